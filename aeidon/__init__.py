@@ -55,6 +55,7 @@ decorator) can be undone and redone. If using :mod:`aeidon` in a context where
 reverting actions is never needed, greater flexibility can be achieved by
 accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 
+:var CACHE_HOME_DIR: Path to the user's local cache directory
 :var CONFIG_HOME_DIR: Path to the user's local configuration directory
 :var DATA_DIR: Path to the global data directory
 :var DATA_HOME_DIR: Path to the user's local data directory
@@ -71,6 +72,7 @@ accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 :var registers: Enumerations for action action reversion register types
 """
 
+import importlib
 import re
 import sys
 
@@ -81,6 +83,47 @@ RUNNING_SPHINX = (sys.argv[0].endswith("autogen.py") or
 
 RE_ANY_TAG = re.compile(r"(^[/\\_]+|<.*?>|\{.*?\})")
 
+# Submodules and classes that are imported only upon first use. Classes are
+# mapped to the module that defines them. This keeps 'import aeidon' cheap
+# for uses that don't need e.g. all file formats or the ISO code tables.
+_LAZY_MODULES = (
+    "agents",
+    "countries",
+    "encodings",
+    "files",
+    "languages",
+    "locales",
+    "markups",
+    "scripts",
+)
+
+_LAZY_NAMES = {
+    "MarkupConverter": "markupconv",
+    "MetadataItem": "metadata",
+    "Pattern": "pattern",
+    "PatternManager": "patternman",
+    "Project": "project",
+    "TestCase": "unittest",
+}
+
+def __getattr__(name):
+    """Return lazily imported submodule or class `name`."""
+    if name in _LAZY_MODULES:
+        return importlib.import_module("aeidon.{}".format(name))
+    if name in _LAZY_NAMES:
+        module = importlib.import_module(
+            "aeidon.{}".format(_LAZY_NAMES[name]))
+        # Mimic star imports by installing all public names.
+        for public in module.__all__:
+            globals()[public] = getattr(module, public)
+        return globals()[name]
+    raise AttributeError("module {} has no attribute {}"
+                         .format(repr(__name__), repr(name)))
+
+def __dir__():
+    """Return names in namespace, including lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY_NAMES))
+
 from aeidon.paths import *
 from aeidon.position import *
 from aeidon import deco
@@ -94,27 +137,22 @@ from aeidon.observable import *
 from aeidon.errors import *
 from aeidon.enum import *
 from aeidon.enums import *
-from aeidon import encodings
-from aeidon import languages
-from aeidon import countries
-from aeidon import locales
-from aeidon import scripts
-from aeidon.metadata import *
 from aeidon.calculator import *
 from aeidon.finder import *
+from aeidon.intervals import *
 from aeidon.parser import *
 from aeidon.liner import *
+from aeidon.metrics import *
+from aeidon.timing import *
 from aeidon import containers
 from aeidon.subtitle import *
 from aeidon.file import *
-from aeidon import files
 from aeidon.markup import *
-from aeidon import markups
-from aeidon.markupconv import *
-from aeidon.pattern import *
-from aeidon.patternman import *
 from aeidon.clipboard import *
 from aeidon.revertable import *
-from aeidon import agents
-from aeidon.project import *
-from aeidon.unittest import *
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) is not supported,
+    # fall back on importing everything immediately.
+    for _name in _LAZY_MODULES + tuple(_LAZY_NAMES):
+        __getattr__(_name)
@@ -28,6 +28,7 @@ from .save      import SaveAgent
 from .search    import SearchAgent
 from .set       import SetAgent
 from .text      import TextAgent
+from .timing    import TimingAgent
 from .util      import UtilityAgent
 
 __all__ = tuple(x for x in dir() if x.endswith("Agent"))
@@ -51,11 +51,13 @@ class EditAgent(aeidon.Delegate):
                 subtitle = self.subtitles[rindices[0]]
                 window = subtitle.start_seconds - first_start
                 duration = window / len(rindices)
-            for i, index in enumerate(rindices):
+            subtitles = []
+            for i in range(len(rindices)):
                 subtitle = self.new_subtitle()
                 subtitle.start_seconds = first_start + i*duration
                 subtitle.duration_seconds = duration
-                self.subtitles.insert(index, subtitle)
+                subtitles.append(subtitle)
+            self.subtitles[rindices[0]:rindices[0]] = subtitles
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Inserting subtitles")
@@ -76,8 +78,7 @@ class EditAgent(aeidon.Delegate):
         """
         if subtitles is None:
             return self._insert_blank_subtitles(indices, register=register)
-        for i, index in enumerate(indices):
-            self.subtitles.insert(index, subtitles[i])
+        self._splice_in(indices, subtitles)
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Inserting subtitles")
@@ -108,7 +109,10 @@ class EditAgent(aeidon.Delegate):
     def remove_subtitles(self, indices, register=-1):
         """Remove subtitles at `indices`."""
         indices = sorted(indices)
-        subtitles = [self.subtitles.pop(i) for i in reversed(indices)][::-1]
+        subtitles = self._splice_out(indices)
+        for doc in aeidon.documents:
+            texts = [x.get_text(doc) for x in subtitles]
+            self.invalidate_text_metrics(doc, texts)
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Removing subtitles")
@@ -122,17 +126,9 @@ class EditAgent(aeidon.Delegate):
     @aeidon.deco.notify_frozen
     def replace_positions(self, indices, subtitles, register=-1):
         """Replace positions at `indices` with those from `subtitles`."""
-        orig_subtitles = [self.subtitles[i].copy() for i in indices]
-        for i, index in enumerate(indices):
-            self.subtitles[index].start = subtitles[i].start
-            self.subtitles[index].end = subtitles[i].end
-        action = aeidon.RevertableAction(register=register)
-        action.docs = tuple(aeidon.documents)
-        action.description = _("Replacing positions")
-        action.revert_function = self.replace_positions
-        action.revert_args = (indices, orig_subtitles)
-        self.register_action(action)
-        self.emit("positions-changed", indices)
+        starts = [x.start for x in subtitles]
+        ends = [x.end for x in subtitles]
+        self.set_positions(indices, starts, ends, register=register)
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -142,6 +138,7 @@ class EditAgent(aeidon.Delegate):
         orig_texts = [self.subtitles[i].get_text(doc) for i in indices]
         for i, index in enumerate(indices):
             self.subtitles[index].set_text(doc, texts[i])
+        self.invalidate_text_metrics(doc, orig_texts)
         action = aeidon.RevertableAction(register=register)
         action.docs = (doc,)
         action.description = _("Replacing texts")
@@ -150,6 +147,75 @@ class EditAgent(aeidon.Delegate):
         self.register_action(action)
         self.emit(self.get_text_signal(doc), indices)
 
+    @aeidon.deco.export
+    @aeidon.deco.revertable
+    @aeidon.deco.notify_frozen
+    def set_positions(self, indices, starts, ends, register=-1):
+        """
+        Set positions at `indices` to `starts` and `ends`.
+
+        `starts` and `ends` should be sequences of positions corresponding
+        to `indices`. Only the original positions, not copies of subtitles,
+        are kept in order to be able to revert.
+        """
+        subtitles = self.subtitles
+        subtitles = [subtitles[i] for i in indices]
+        orig_starts = [x.start for x in subtitles]
+        orig_ends = [x.end for x in subtitles]
+        for subtitle, start, end in zip(subtitles, starts, ends):
+            subtitle.start = start
+            subtitle.end = end
+        action = aeidon.RevertableAction(register=register)
+        action.docs = tuple(aeidon.documents)
+        action.description = _("Replacing positions")
+        action.revert_function = self.set_positions
+        action.revert_args = (indices, orig_starts, orig_ends)
+        self.register_action(action)
+        self.emit("positions-changed", indices)
+
+    def _splice_in(self, indices, subtitles):
+        """Insert `subtitles` at `indices` with one slice assignment."""
+        n = len(self.subtitles) + len(indices)
+        indices = list(indices)
+        if (indices != sorted(set(indices)) or
+            indices and indices[-1] >= n):
+            # Fall back on inserting one by one, since indices
+            # are not final positions of the inserted subtitles.
+            for i, index in enumerate(indices):
+                self.subtitles.insert(index, subtitles[i])
+            return
+        if not indices: return
+        first = indices[0]
+        if indices[-1] - first + 1 == len(indices):
+            self.subtitles[first:first] = list(subtitles[:len(indices)])
+            return
+        # Rebuild the tail after the first index in one pass, which keeps
+        # time taken linear in the amount of subtitles regardless of how
+        # scattered indices are.
+        tail = iter(self.subtitles[first:])
+        new = iter(subtitles)
+        indices = set(indices)
+        self.subtitles[first:] = [next(new) if i in indices else next(tail)
+                                  for i in range(first, n)]
+
+    def _splice_out(self, indices):
+        """Remove subtitles at sorted `indices` and return them."""
+        if not indices: return []
+        first = indices[0]
+        subtitles = [self.subtitles[i] for i in indices]
+        if indices[-1] - first + 1 == len(indices):
+            del self.subtitles[first:indices[-1]+1]
+            return subtitles
+        # Rebuild the tail after the first index in one pass, which keeps
+        # time taken linear in the amount of subtitles regardless of how
+        # scattered indices are.
+        remove = set(indices)
+        self.subtitles[first:] = [self.subtitles[i]
+                                  for i in range(first, len(self.subtitles))
+                                  if not i in remove]
+
+        return subtitles
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def split_subtitle(self, index, register=-1):
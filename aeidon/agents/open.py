@@ -63,12 +63,20 @@ class OpenAgent(aeidon.Delegate):
             subtitles.pop(0)
             i += 1
 
+    def _detect_bom(self, path, data=None):
+        """Return encoding from BOM in `data` or file at `path`."""
+        if data is not None:
+            return aeidon.encodings.detect_bom_data(data)
+        return aeidon.encodings.detect_bom(path)
+
     @aeidon.deco.export
-    def open(self, doc, path, encoding=None, align_method=None):
+    def open(self, doc, path, encoding=None, align_method=None, data=None):
         """
         Read and parse subtitle data for `doc` from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `data` can be bytes already read from `path` to avoid reading it
+        again.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -78,18 +86,20 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         if doc == aeidon.documents.MAIN:
-            return self.open_main(path, encoding)
+            return self.open_main(path, encoding, data)
         if doc == aeidon.documents.TRAN:
-            return self.open_translation(path, encoding, align_method)
+            return self.open_translation(path, encoding, align_method, data)
         raise ValueError("Invalid document: {}".format(repr(doc)))
 
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
-    def open_main(self, path, encoding=None):
+    def open_main(self, path, encoding=None, data=None):
         """
         Read and parse subtitle data for main file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `data` can be bytes already read from `path` to avoid reading it
+        again.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -99,12 +109,12 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
+        bom_encoding = self._detect_bom(path, data)
         if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
+            return self.open_main(path, bom_encoding, data)
+        format = aeidon.util.detect_format(path, encoding, data)
         self.main_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.main_file)
+        subtitles = self._read_file(self.main_file, data)
         self.subtitles, sort_count = self._sort_subtitles(subtitles)
         self.set_framerate(self.framerate, register=None)
         self.main_changed = 0
@@ -116,11 +126,14 @@ class OpenAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
-    def open_translation(self, path, encoding=None, align_method=None):
+    def open_translation(self, path, encoding=None, align_method=None,
+                         data=None):
         """
         Read and parse subtitle data for translation file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `data` can be bytes already read from `path` to avoid reading it
+        again.
         `align_method` specifies how translation texts are attached to existing
         subtitles. :attr:`aeidon.align_methods.NUMBER` is the simple way, which
         adds the translation texts in order, one-by-one to the exising
@@ -142,12 +155,13 @@ class OpenAgent(aeidon.Delegate):
         """
         encoding = encoding or aeidon.util.get_default_encoding()
         align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
+        bom_encoding = self._detect_bom(path, data)
         if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
+            return self.open_translation(
+                path, bom_encoding, align_method, data)
+        format = aeidon.util.detect_format(path, encoding, data)
         self.tran_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.tran_file)
+        subtitles = self._read_file(self.tran_file, data)
         subtitles, sort_count = self._sort_subtitles(subtitles)
         for subtitle in subtitles:
             subtitle.framerate = self.framerate
@@ -163,9 +177,11 @@ class OpenAgent(aeidon.Delegate):
         self.emit("translation-file-opened", self.tran_file)
         return sort_count
 
-    def _read_file(self, file):
-        """Read `file` and return subtitles."""
+    def _read_file(self, file, data=None):
+        """Read `file` or bytes `data` read from it and return subtitles."""
         try:
+            if data is not None:
+                return file.read_data(data)
             return file.read()
         except (IOError, UnicodeError):
             raise
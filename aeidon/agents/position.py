@@ -18,6 +18,8 @@
 """Manipulating times and frames."""
 
 import aeidon
+import bisect
+import math
 
 from aeidon.i18n import _
 
@@ -44,12 +46,13 @@ class PositionAgent(aeidon.Delegate):
         is not desired. Return changed indices.
         """
         new_indices = []
-        new_subtitles = []
+        new_ends = []
+        main = aeidon.documents.MAIN
         for index in indices or self.get_all_indices():
             start = self.subtitles[index].start_seconds
             end = self.subtitles[index].end_seconds
             if speed is not None:
-                length = self.get_text_length(index, aeidon.documents.MAIN)
+                length = self.get_text_metrics(index, main).char_count
                 optimal_duration = length / speed
                 dol = lengthen and end - start < optimal_duration
                 dos = shorten  and end - start > optimal_duration
@@ -66,11 +69,13 @@ class PositionAgent(aeidon.Delegate):
             end = max(start, end_max - gap) if dogap else end
             if end != self.subtitles[index].end_seconds:
                 new_indices.append(index)
-                subtitle = self.subtitles[index].copy()
-                subtitle.end_seconds = end
-                new_subtitles.append(subtitle)
+                new_ends.append(aeidon.as_seconds(end))
         if not new_indices: return []
-        self.replace_positions(new_indices, new_subtitles, register=register)
+        new_starts = [self.subtitles[i].start for i in new_indices]
+        self.set_positions(new_indices,
+                           new_starts,
+                           new_ends,
+                           register=register)
         self.set_action_description(register, _("Adjusting durations"))
         return new_indices
 
@@ -84,15 +89,15 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles. `framerate_in` and
         `framerate_out` should be constants from :attr:`aeidon.framerates`.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.convert_framerate(framerate_out)
-            new_subtitles.append(subtitle)
+        coefficient = framerate_out.value / framerate_in.value
+        starts, ends = self._map_positions(
+            indices,
+            lambda x: x / coefficient,
+            lambda x: round(coefficient * x))
         self.set_framerate(framerate_out)
-        self.replace_positions(indices, new_subtitles, register=register)
+        self.set_positions(indices, starts, ends, register=register)
         self.group_actions(register, 2, _("Converting framerate"))
 
     def _get_frame_transform(self, p1, p2):
@@ -107,6 +112,31 @@ class PositionAgent(aeidon.Delegate):
         constant = int(round(-coefficient * x1 + y1, 0))
         return coefficient, constant
 
+    def _get_piecewise_transform(self, xs, ys, spline=False):
+        """Return a function interpolating positions through `xs`, `ys`."""
+        # Think of this as a polyline, or a spline, through points where
+        # input positions are located on the x-axis and output positions
+        # on the y-axis, extended linearly from its first and last segment.
+        xs, ys = map(list, zip(*sorted(zip(xs, ys))))
+        if len(xs) < 2 or len(set(xs)) < len(xs):
+            raise ValueError("Bad points: {}"
+                             .format(repr(list(zip(xs, ys)))))
+        n = len(xs)
+        slopes = [(ys[i+1] - ys[i]) / (xs[i+1] - xs[i]) for i in range(n-1)]
+        tangents = self._get_spline_tangents(slopes) if spline else None
+        def transform(x):
+            k = min(max(bisect.bisect_right(xs, x) - 1, 0), n - 2)
+            if tangents is None or not xs[k] <= x <= xs[k+1]:
+                return ys[k] + slopes[k] * (x - xs[k])
+            # Cubic Hermite interpolation within the segment.
+            h = xs[k+1] - xs[k]
+            t = (x - xs[k]) / h
+            return ((2*t**3 - 3*t**2 + 1) * ys[k] +
+                    (t**3 - 2*t**2 + t) * h * tangents[k] +
+                    (-2*t**3 + 3*t**2) * ys[k+1] +
+                    (t**3 - t**2) * h * tangents[k+1])
+        return transform
+
     def _get_seconds_transform(self, p1, p2):
         """Return a formula for linear correction of positions."""
         # Think of this as a linear transformation where input positions
@@ -119,6 +149,26 @@ class PositionAgent(aeidon.Delegate):
         constant = -coefficient * x1 + y1
         return coefficient, constant
 
+    def _get_spline_tangents(self, slopes):
+        """Return tangents for a monotone spline given segment `slopes`."""
+        # Fritsch-Carlson method, which avoids overshoot so that the spline
+        # doesn't reverse the order of subtitles between points.
+        tangents = [slopes[0]]
+        for a, b in zip(slopes, slopes[1:]):
+            tangents.append((a + b) / 2 if a * b > 0 else 0)
+        tangents.append(slopes[-1])
+        for k, slope in enumerate(slopes):
+            if slope == 0:
+                tangents[k] = tangents[k+1] = 0
+                continue
+            a = tangents[k] / slope
+            b = tangents[k+1] / slope
+            if a**2 + b**2 > 9:
+                t = 3 / math.sqrt(a**2 + b**2)
+                tangents[k] = t * a * slope
+                tangents[k+1] = t * b * slope
+        return tangents
+
     def _get_time_transform(self, p1, p2):
         """Return a formula for linear correction of positions."""
         p1 = [p1[0], self.calc.time_to_seconds(p1[1])]
@@ -132,6 +182,42 @@ class PositionAgent(aeidon.Delegate):
         if aeidon.is_seconds(p1[1]): return self._get_seconds_transform(p1, p2)
         raise ValueError("Bad position argument: {}".format(repr(p1)))
 
+    def _map_positions(self, indices, seconds_function, frame_function):
+        """
+        Return new start and end positions of subtitles at `indices`.
+
+        `seconds_function` is applied to positions as seconds of subtitles
+        in time mode and `frame_function` to positions as frames of subtitles
+        in frame mode. Returned positions are in each subtitle's mode.
+        """
+        # Do the arithmetic on plain numbers in one go and convert only the
+        # results to times, instead of converting back and forth for each
+        # step of the correction as the Subtitle methods do.
+        subtitles = self.subtitles
+        subtitles = [subtitles[i] for i in indices]
+        if all(x.mode == aeidon.modes.TIME for x in subtitles):
+            calc = self.calc
+            to_seconds = calc.time_to_seconds
+            to_time = calc.seconds_to_time
+            starts = [to_time(seconds_function(to_seconds(x.start)))
+                      for x in subtitles]
+            ends = [to_time(seconds_function(to_seconds(x.end)))
+                    for x in subtitles]
+            return starts, ends
+        starts, ends = [], []
+        for subtitle in subtitles:
+            if subtitle.mode == aeidon.modes.FRAME:
+                starts.append(aeidon.as_frame(
+                    frame_function(subtitle.start_frame)))
+                ends.append(aeidon.as_frame(
+                    frame_function(subtitle.end_frame)))
+            else:
+                starts.append(aeidon.as_seconds(
+                    seconds_function(subtitle.start_seconds)))
+                ends.append(aeidon.as_seconds(
+                    seconds_function(subtitle.end_seconds)))
+        return starts, ends
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def set_framerate(self, framerate, register=-1):
@@ -158,13 +244,13 @@ class PositionAgent(aeidon.Delegate):
         `value` can be any valid position type, negative to make subtitles
         appear ealier, positive to make subtitles appear later.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.shift_positions(value)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        seconds = self.calc.to_seconds(value)
+        frames = self.calc.to_frame(value)
+        starts, ends = self._map_positions(indices,
+                                           lambda x: x + seconds,
+                                           lambda x: x + frames)
+        self.set_positions(indices, starts, ends, register=register)
         self.set_action_description(register, _("Shifting positions"))
 
     @aeidon.deco.export
@@ -176,13 +262,39 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles.
         `p1` and `p2` should be tuples of index, position.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.scale_positions(coefficient)
-            subtitle.shift_positions(constant)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        seconds = self.calc.to_seconds(constant)
+        frames = self.calc.to_frame(constant)
+        starts, ends = self._map_positions(
+            indices,
+            lambda x: round(coefficient * x, 3) + seconds,
+            lambda x: round(coefficient * x) + frames)
+        self.set_positions(indices, starts, ends, register=register)
+        self.set_action_description(register, _("Transforming positions"))
+
+    @aeidon.deco.export
+    @aeidon.deco.revertable
+    def transform_positions_piecewise(self, indices, points, spline=False,
+                                      register=-1):
+        """
+        Change positions by a piecewise correction through `points`.
+
+        `indices` can be ``None`` to process all subtitles. `points` should be
+        a sequence of at least two tuples of index, position. Positions are
+        interpolated linearly between points or, if `spline` is ``True``,
+        along a monotone cubic spline. Positions before the first and after
+        the last point are extrapolated linearly.
+        """
+        indices = indices or self.get_all_indices()
+        xs = [self.subtitles[x[0]].start_seconds for x in points]
+        ys = [self.calc.to_seconds(x[1]) for x in points]
+        transform = self._get_piecewise_transform(xs, ys, spline)
+        to_frame = self.calc.seconds_to_frame
+        to_seconds = self.calc.frame_to_seconds
+        starts, ends = self._map_positions(
+            indices,
+            transform,
+            lambda x: to_frame(transform(to_seconds(x))))
+        self.set_positions(indices, starts, ends, register=register)
         self.set_action_description(register, _("Transforming positions"))
@@ -24,12 +24,31 @@ import string
 
 class PreviewAgent(aeidon.Delegate):
 
-    """Previewing subtitles with a video player."""
+    """
+    Previewing subtitles with a video player.
+
+    :ivar _preview_files: Dictionary mapping documents and encodings to
+        a tuple of changed value, generation and path of temporary file
+    :ivar _preview_generation: Counter increased on any change to subtitles
+        or files, used to tell if temporary files are still up to date
+    """
 
     def __init__(self, master):
         """Initialize a :class:`aeidon.PreviewAgent` instance."""
         aeidon.Delegate.__init__(self, master)
+        self._preview_files = {}
+        self._preview_generation = 0
         aeidon.util.connect(self, self, "notify::main_file")
+        self.connect("action-done", self._on_preview_source_changed)
+        self.connect("action-redone", self._on_preview_source_changed)
+        self.connect("action-undone", self._on_preview_source_changed)
+        self.connect("main-file-opened", self._on_preview_source_changed)
+        self.connect("notify::framerate", self._on_preview_source_changed)
+        self.connect("notify::main_file", self._on_preview_source_changed)
+        self.connect("notify::subtitles", self._on_preview_source_changed)
+        self.connect("notify::tran_file", self._on_preview_source_changed)
+        self.connect("translation-file-opened",
+                     self._on_preview_source_changed)
 
     @aeidon.deco.export
     def find_video(self):
@@ -61,21 +80,41 @@ class PreviewAgent(aeidon.Delegate):
         Raise :exc:`UnicodeError` if encoding temporary file fails.
         """
         file = self.get_file(doc)
-        if file is None or encoding != file.encoding:
-            return self.new_temp_file(doc)
-        if doc == aeidon.documents.MAIN:
-            if not self.main_changed and not temp:
-                return self.main_file.path
-        if doc == aeidon.documents.TRAN:
-            if not self.tran_changed and not temp:
-                return self.tran_file.path
-        return self.new_temp_file(doc)
+        if temp:
+            return self.new_temp_file(doc, encoding)
+        if file is not None and encoding in (None, file.encoding):
+            if not self.get_changed(doc):
+                return file.path
+        return self._get_temp_file(doc, encoding)
+
+    def _get_temp_file(self, doc, encoding=None):
+        """
+        Return path to an up to date temporary file to preview.
+
+        Raise :exc:`IOError` if writing to temporary file fails.
+        Raise :exc:`UnicodeError` if encoding temporary file fails.
+        """
+        key = (self.get_changed(doc), self._preview_generation)
+        if (doc, encoding) in self._preview_files:
+            changed, generation, path = self._preview_files[doc, encoding]
+            if (changed, generation) == key and os.path.isfile(path):
+                return path
+            # A video player might still have the previous file open,
+            # leave it to be removed at exit if removing fails.
+            aeidon.temp.remove(path)
+        path = self.new_temp_file(doc, encoding)
+        self._preview_files[doc, encoding] = key + (path,)
+        return path
 
     def _on_notify_main_file(self, *args):
         """Try to find the video file path if unset."""
         if self.video_path is None:
             self.find_video()
 
+    def _on_preview_source_changed(self, *args):
+        """Mark temporary files of previous previews out of date."""
+        self._preview_generation += 1
+
     @aeidon.deco.export
     def preview(self, position, doc, command, offset, encoding=None, temp=False):
         """
@@ -38,16 +38,15 @@ class SaveAgent(aeidon.Delegate):
         if current_format is not None and file.format != current_format:
             # Convert markup if saving in different format.
             converter = aeidon.MarkupConverter(current_format, file.format)
+            new_texts = converter.convert_many(orig_texts)
             for i, subtitle in enumerate(self.subtitles):
-                text = subtitle.get_text(doc)
-                new_text = converter.convert(text)
-                if new_text == text: continue
-                subtitle.set_text(doc, new_text)
+                if new_texts[i] == orig_texts[i]: continue
+                subtitle.set_text(doc, new_texts[i])
                 indices.append(i)
         file.write(self.subtitles, doc)
         if keep_changes: return indices
-        for i, subtitle in enumerate(self.subtitles):
-            subtitle.set_text(doc, orig_texts[i])
+        for i in indices:
+            self.subtitles[i].set_text(doc, orig_texts[i])
         return []
 
     @aeidon.deco.export
@@ -18,7 +18,6 @@
 """Setting values of single subtitle fields."""
 
 import aeidon
-import bisect
 
 from aeidon.i18n import _
 
@@ -29,15 +28,27 @@ class SetAgent(aeidon.Delegate):
 
     def _move_if_needed(self, index):
         """Move subtitle for correct order and return new index."""
-        subtitle = self.subtitles[index]
-        subtitles = self.subtitles[:index] + self.subtitles[index+1:]
-        new_index = bisect.bisect_right(subtitles, subtitle)
-        if new_index == index: return new_index
-        subtitle = self.subtitles.pop(index)
-        self.emit("subtitles-removed", (index,))
-        self.subtitles.insert(new_index, subtitle)
-        self.emit("subtitles-inserted", (new_index,))
-        return new_index
+        subtitles = self.subtitles
+        subtitle = subtitles[index]
+        if subtitle.mode == aeidon.modes.FRAME:
+            key = lambda x: x.start_frame
+        else:
+            key = lambda x: x.start_seconds
+        start = key(subtitle)
+        # Bisect right among the other subtitles, skipping over the one
+        # being moved instead of copying the list without it, and compare
+        # start positions of only the subtitles the bisection probes.
+        low, high = 0, len(subtitles) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if start < key(subtitles[middle + (middle >= index)]):
+                high = middle
+            else:
+                low = middle + 1
+        if low == index: return index
+        subtitles.insert(low, subtitles.pop(index))
+        self.emit("subtitle-moved", index, low)
+        return low
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -124,6 +135,7 @@ class SetAgent(aeidon.Delegate):
         orig_value = subtitle.get_text(doc)
         if value == orig_value: return
         subtitle.set_text(doc, value)
+        self.invalidate_text_metrics(doc, (orig_value,))
         action = aeidon.RevertableAction(register=register)
         action.docs = (doc,)
         action.description = _("Editing text")
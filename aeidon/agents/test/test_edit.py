@@ -68,6 +68,21 @@ class TestEditAgent(aeidon.TestCase):
         assert len(subtitles) == orig_length + 3
         assert subtitles == sorted(subtitles)
 
+    @aeidon.deco.reversion_test
+    def test_insert_subtitles__scattered(self):
+        subtitles = self.project.subtitles
+        orig_subtitles = subtitles[:]
+        new_subtitles = [self.project.new_subtitle() for i in range(3)]
+        self.project.insert_subtitles((1, 3, 4), new_subtitles)
+        assert subtitles[:6] == [orig_subtitles[0],
+                                 new_subtitles[0],
+                                 orig_subtitles[1],
+                                 new_subtitles[1],
+                                 new_subtitles[2],
+                                 orig_subtitles[2]]
+
+        assert subtitles[6:] == orig_subtitles[3:]
+
     @aeidon.deco.reversion_test
     def test_merge_subtitles(self):
         subtitles = self.project.subtitles
@@ -86,6 +101,19 @@ class TestEditAgent(aeidon.TestCase):
         self.project.remove_subtitles((2, 3))
         assert len(subtitles) == orig_length - 2
 
+    @aeidon.deco.reversion_test
+    def test_remove_subtitles__scattered(self):
+        subtitles = self.project.subtitles
+        orig_subtitles = subtitles[:]
+        self.project.remove_subtitles((5, 1, 2, 7))
+        assert subtitles[:5] == [orig_subtitles[0],
+                                 orig_subtitles[3],
+                                 orig_subtitles[4],
+                                 orig_subtitles[6],
+                                 orig_subtitles[8]]
+
+        assert subtitles[5:] == orig_subtitles[9:]
+
     @aeidon.deco.reversion_test
     def test_replace_positions(self):
         new_subtitles = []
@@ -107,6 +135,16 @@ class TestEditAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    @aeidon.deco.reversion_test
+    def test_set_positions(self):
+        starts = ["00:00:0{:d}.000".format(i) for i in range(3)]
+        ends = ["00:00:0{:d}.500".format(i) for i in range(3)]
+        self.project.set_positions((0, 1, 2), starts, ends)
+        subtitles = self.project.subtitles
+        for i in range(3):
+            assert subtitles[i].start == starts[i]
+            assert subtitles[i].end == ends[i]
+
     @aeidon.deco.reversion_test
     def test_split_subtitle(self):
         subtitles = self.project.subtitles
@@ -38,6 +38,16 @@ class TestOpenAgent(aeidon.TestCase):
         assert self.project.subtitles
         assert self.project.main_file.encoding == "utf_8_sig"
 
+    def test_open_main__data(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            data = open(path, "rb").read()
+            # Data given should be parsed without reading path again.
+            open(path, "wb").close()
+            self.project.open_main(path, "ascii", data)
+            assert self.project.subtitles
+            assert self.project.main_file.format == format
+
     def test_open_main__sort(self):
         path = self.new_microdvd_file()
         with open(path, "w") as f:
@@ -66,3 +76,11 @@ class TestOpenAgent(aeidon.TestCase):
         self.project.open_translation(path, "ascii")
         assert self.project.subtitles
         assert self.project.tran_file.encoding == "utf_8_sig"
+
+    def test_open_translation__data(self):
+        path = self.new_subrip_file()
+        data = codecs.BOM_UTF8 + open(path, "rb").read()
+        open(path, "wb").close()
+        self.project.open_translation(path, "ascii", data=data)
+        assert self.project.subtitles
+        assert self.project.tran_file.encoding == "utf_8_sig"
@@ -136,6 +136,15 @@ class TestPositionAgent(aeidon.TestCase):
             assert subtitle.start_frame == start
             assert subtitle.end_frame == end
 
+    def test_shift_positions__frame(self):
+        self.project.open_main(self.new_microdvd_file(), "ascii")
+        orig_subtitles = [x.copy() for x in self.project.subtitles]
+        self.project.shift_positions(None, aeidon.as_seconds(1.0))
+        framerate = self.project.framerate.value
+        for i, subtitle in enumerate(self.project.subtitles):
+            start = orig_subtitles[i].start + round(framerate)
+            assert subtitle.start == start
+
     @aeidon.deco.reversion_test
     def test_transform_positions(self):
         a, b = "00:00:01.000", "00:00:45.000"
@@ -144,3 +153,33 @@ class TestPositionAgent(aeidon.TestCase):
         for subtitle in self.project.subtitles[3:6]:
             assert a < subtitle.start_time < b
         assert self.project.subtitles[6].start_time == b
+
+    @aeidon.deco.reversion_test
+    def test_transform_positions_piecewise(self):
+        a, b, c = "00:00:01.000", "00:00:20.000", "00:00:45.000"
+        points = ((2, a), (4, b), (6, c))
+        self.project.transform_positions_piecewise(None, points)
+        assert self.project.subtitles[2].start_time == a
+        assert self.project.subtitles[3].start_time < b
+        assert self.project.subtitles[4].start_time == b
+        assert b < self.project.subtitles[5].start_time < c
+        assert self.project.subtitles[6].start_time == c
+
+    @aeidon.deco.reversion_test
+    def test_transform_positions_piecewise__spline(self):
+        a, b, c = "00:00:01.000", "00:00:20.000", "00:00:45.000"
+        points = ((2, a), (4, b), (6, c))
+        self.project.transform_positions_piecewise(None, points, spline=True)
+        assert self.project.subtitles[2].start_time == a
+        assert self.project.subtitles[4].start_time == b
+        assert self.project.subtitles[6].start_time == c
+        for i in range(2, 6):
+            x = self.project.subtitles[i]
+            y = self.project.subtitles[i+1]
+            assert x.start_time < y.start_time
+
+    def test_transform_positions_piecewise__value_error(self):
+        points = ((2, "00:00:01.000"), (2, "00:00:02.000"))
+        self.assert_raises(ValueError,
+                           self.project.transform_positions_piecewise,
+                           None, points)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+
+class TestPreviewAgent(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.delegate = self.project.preview.__self__
+
+    def test__get_subtitle_path(self):
+        path = self.delegate._get_subtitle_path(aeidon.documents.MAIN)
+        assert path == self.project.main_file.path
+
+    def test__get_subtitle_path__changed(self):
+        self.project.set_text(0, aeidon.documents.MAIN, "x")
+        path = self.delegate._get_subtitle_path(aeidon.documents.MAIN)
+        assert path != self.project.main_file.path
+        assert os.path.isfile(path)
+        path_2 = self.delegate._get_subtitle_path(aeidon.documents.MAIN)
+        assert path_2 == path
+        self.project.set_text(0, aeidon.documents.MAIN, "y")
+        new_path = self.delegate._get_subtitle_path(aeidon.documents.MAIN)
+        assert new_path != path
+        assert not os.path.isfile(path)
+
+    def test__get_subtitle_path__encoding(self):
+        self.project.main_file.encoding = "ascii"
+        doc = aeidon.documents.MAIN
+        path = self.delegate._get_subtitle_path(doc, "utf_8")
+        assert path != self.project.main_file.path
+        assert self.delegate._get_subtitle_path(doc, "utf_8") == path
+        self.project.main_file.encoding = "utf_8"
+        assert self.delegate._get_subtitle_path(doc, "utf_8") != path
+
+    def test__get_subtitle_path__temp(self):
+        doc = aeidon.documents.MAIN
+        path = self.delegate._get_subtitle_path(doc, temp=True)
+        assert path != self.project.main_file.path
+        assert self.delegate._get_subtitle_path(doc, temp=True) != path
+
+    def test__get_subtitle_path__undo(self):
+        self.project.set_text(0, aeidon.documents.MAIN, "x")
+        path = self.delegate._get_subtitle_path(aeidon.documents.MAIN)
+        self.project.undo()
+        self.project.set_text(0, aeidon.documents.MAIN, "y")
+        new_path = self.delegate._get_subtitle_path(aeidon.documents.MAIN)
+        assert new_path != path
@@ -34,6 +34,14 @@ class TestSaveAgent(aeidon.TestCase):
             self.project.save_main(file, keep_changes=True)
             assert self.project.main_changed == 0
 
+    def test_save_main__restore(self):
+        self.project.set_text(0, aeidon.documents.MAIN, "<i>test</i>")
+        texts = [x.main_text for x in self.project.subtitles]
+        path = self.project.main_file.path
+        file = aeidon.files.new(aeidon.formats.SSA, path, "ascii")
+        self.project.save_main(file, keep_changes=False)
+        assert [x.main_text for x in self.project.subtitles] == texts
+
     def test_save_translation(self):
         for format in aeidon.formats:
             self.project.clear_texts((0,), aeidon.documents.TRAN)
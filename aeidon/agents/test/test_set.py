@@ -57,6 +57,15 @@ class TestSetAgent(aeidon.TestCase):
         assert subtitles[0].main_text == text_3
         assert subtitles[1].main_text == text_0
 
+    def test_set_start__reorder__signals(self):
+        emitted = []
+        for signal in ("subtitle-moved",
+                       "subtitles-inserted",
+                       "subtitles-removed"):
+            self.project.connect(signal, lambda *args: emitted.append(args))
+        self.project.set_start(3, -1000)
+        assert emitted == [(self.project, 3, 0)]
+
     @aeidon.deco.reversion_test
     def test_set_text__main(self):
         subtitles = self.project.subtitles
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestTimingAgent(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = aeidon.Project()
+        for i, (start, end) in enumerate(((0.0, 2.0),
+                                          (1.0, 3.0),
+                                          (3.1, 5.0),
+                                          (6.0, 7.0))):
+
+            subtitle = self.project.new_subtitle()
+            subtitle.start_seconds = start
+            subtitle.end_seconds = end
+            subtitle.main_text = "x" * (i + 1) * 10
+            self.project.subtitles.append(subtitle)
+
+    def test_analyze_timing(self):
+        report = self.project.analyze_timing(gap=0.5, speed=10)
+        assert report.gaps == [1]
+        assert report.negative_durations == []
+        assert report.overlaps == [(0, 1)]
+        assert report.speeding == [2, 3]
+
+    def test_analyze_timing__none(self):
+        self.project.remove_subtitles((1,))
+        assert not self.project.analyze_timing()
+
+    def test_get_indices_at(self):
+        assert self.project.get_indices_at(1.5) == [0, 1]
+        assert self.project.get_indices_at(5.5) == []
+        assert self.project.get_indices_at("00:00:06.500") == [3]
+
+    def test_get_indices_at__inserted(self):
+        subtitle = self.project.new_subtitle()
+        subtitle.start_seconds = 5.0
+        subtitle.end_seconds = 6.5
+        assert self.project.get_indices_at(5.5) == []
+        self.project.insert_subtitles((3,), (subtitle,))
+        assert self.project.get_indices_at(5.5) == [3]
+        self.project.undo()
+        assert self.project.get_indices_at(5.5) == []
+
+    def test_get_indices_at__positions_changed(self):
+        assert self.project.get_indices_at(5.5) == []
+        self.project.set_end(2, aeidon.as_seconds(5.7))
+        assert self.project.get_indices_at(5.5) == [2]
+        self.project.set_end(2, aeidon.as_seconds(8.0))
+        self.project.set_start(2, aeidon.as_seconds(6.5))
+        assert self.project.get_indices_at(6.2) == [2]
+        assert self.project.get_indices_at(7.5) == [3]
+        self.project.shift_positions((0,), aeidon.as_seconds(10.0))
+        assert self.project.get_indices_at(10.5) == [0]
+
+    def test_get_indices_between(self):
+        assert self.project.get_indices_between(2.5, 3.5) == [1, 2]
+        assert self.project.get_indices_between(5.1, 5.9) == []
+
+    def test_get_indices_at__removed(self):
+        assert self.project.get_indices_at(6.5) == [3]
+        self.project.remove_subtitles((0, 2))
+        assert self.project.get_indices_at(6.5) == [1]
+        self.project.undo()
+        assert self.project.get_indices_at(6.5) == [3]
+        assert self.project.get_indices_at(4.0) == [2]
+
+    def test_get_negative_durations(self):
+        assert self.project.get_negative_durations() == []
+        self.project.set_end(2, aeidon.as_seconds(2.5))
+        assert self.project.get_negative_durations() == [2]
+
+    def test_get_overlaps(self):
+        assert self.project.get_overlaps() == [(0, 1)]
+
+    def test_get_overlaps__negative_duration(self):
+        self.project.set_end(1, aeidon.as_seconds(0.5))
+        assert self.project.get_overlaps() == []
+
+    def test_get_short_gaps(self):
+        assert self.project.get_short_gaps(0.05) == []
+        assert self.project.get_short_gaps(0.5) == [1]
+        assert self.project.get_short_gaps(1.5) == [1, 2]
+
+    def test_get_speeding(self):
+        assert self.project.get_speeding(12) == [2, 3]
+        assert self.project.get_speeding(20) == [3]
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestUtilityAgent(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test_get_text_length(self):
+        doc = aeidon.documents.MAIN
+        self.project.subtitles[0].main_text = "<i>test</i>"
+        assert self.project.get_text_length(0, doc) == 4
+
+    def test_get_text_metrics(self):
+        doc = aeidon.documents.MAIN
+        self.project.subtitles[0].main_text = "<i>test</i>\ntest"
+        metrics = self.project.get_text_metrics(0, doc)
+        assert metrics.line_lengths == (4, 4)
+        assert self.project.get_text_metrics(0, doc) is metrics
+
+    def test_get_text_metrics__changed(self):
+        doc = aeidon.documents.MAIN
+        metrics = self.project.get_text_metrics(0, doc)
+        self.project.set_text(0, doc, "test")
+        assert self.project.get_text_metrics(0, doc) is not metrics
+        assert self.project.get_text_metrics(0, doc).plain_text == "test"
+
+    def test_invalidate_text_metrics(self):
+        doc = aeidon.documents.MAIN
+        metrics = self.project.get_text_metrics(0, doc)
+        self.project.invalidate_text_metrics(doc)
+        assert self.project.get_text_metrics(0, doc) is not metrics
+
+    def test_invalidate_text_metrics__main_file_opened(self):
+        doc = aeidon.documents.MAIN
+        path = self.project.main_file.path
+        metrics = self.project.get_text_metrics(0, doc)
+        self.project.open_main(path, "ascii")
+        assert self.project.get_text_metrics(0, doc) is not metrics
+
+    def test_invalidate_text_metrics__translation_file_opened(self):
+        doc = aeidon.documents.TRAN
+        path = self.project.main_file.path
+        self.project.open_translation(path, "ascii")
+        metrics = self.project.get_text_metrics(0, doc)
+        self.project.open_translation(path, "ascii")
+        assert self.project.get_text_metrics(0, doc) is not metrics
+
+    def test_invalidate_text_metrics__texts(self):
+        doc = aeidon.documents.MAIN
+        self.project.subtitles[1].main_text = "test"
+        metrics_0 = self.project.get_text_metrics(0, doc)
+        metrics_1 = self.project.get_text_metrics(1, doc)
+        self.project.invalidate_text_metrics(doc, ("test",))
+        assert self.project.get_text_metrics(0, doc) is metrics_0
+        assert self.project.get_text_metrics(1, doc) is not metrics_1
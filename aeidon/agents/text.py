@@ -60,24 +60,19 @@ class TextAgent(aeidon.Delegate):
         re_tag = self.get_markup_tag_regex(doc)
         for index in indices or self.get_all_indices():
             subtitle = self.subtitles[index]
-            liner.set_text(subtitle.get_text(doc))
-            plain_text = subtitle.get_text(doc)
-            if re_tag is not None:
-                plain_text = re_tag.sub("", plain_text)
-            lines = plain_text.split("\n")
-            length = max(map(length_func, lines))
-            line_count = len(lines)
+            metrics = self.get_text_metrics(index, doc)
+            length = max(map(length_func, metrics.lines))
+            line_count = metrics.line_count
             if (length <= max_skip_length and
                 line_count <= max_skip_lines):
                 # Skip subtitles that do not violate
                 # any of the defined skip conditions.
                 if skip: continue
+            liner.set_text(subtitle.get_text(doc))
             text = liner.break_lines()
-            if re_tag is not None:
-                plain_text = re_tag.sub("", text)
-            lines = plain_text.split("\n")
-            length_down = max(map(length_func, lines)) < length
-            lines_down = len(lines) < line_count
+            metrics = aeidon.TextMetrics(text, re_tag)
+            length_down = max(map(length_func, metrics.lines)) < length
+            lines_down = metrics.line_count < line_count
             length_fixed = length > max_skip_length and length_down
             lines_fixed = line_count > max_skip_lines and lines_down
             if not length_fixed and not lines_fixed:
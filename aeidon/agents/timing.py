@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Analyzing subtitle timing."""
+
+import aeidon
+
+
+class TimingAgent(aeidon.Delegate):
+
+    """
+    Analyzing subtitle timing.
+
+    :ivar _timing_index: :class:`aeidon.IntervalIndex` of positions as seconds
+        or ``None`` if it needs to be rebuilt
+    :ivar _timing_order: List of indices of subtitles in order of start
+        if subtitles are not sorted, otherwise ``None``
+
+    The index is patched from signals emitted when subtitles are inserted,
+    removed, moved or their positions changed and rebuilt when a file is
+    opened, the framerate changed, subtitles are not in order of start or
+    a large share of subtitles changed at once.
+    """
+
+    def __init__(self, master):
+        """Initialize a :class:`TimingAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._timing_index = None
+        self._timing_order = None
+        aeidon.util.connect(self, self, "main-file-opened")
+        aeidon.util.connect(self, self, "notify::framerate")
+        aeidon.util.connect(self, self, "positions-changed")
+        aeidon.util.connect(self, self, "subtitle-moved")
+        aeidon.util.connect(self, self, "subtitles-changed")
+        aeidon.util.connect(self, self, "subtitles-inserted")
+        aeidon.util.connect(self, self, "subtitles-removed")
+
+    @aeidon.deco.export
+    def analyze_timing(self, gap=None, speed=None):
+        """
+        Return a report of timing problems as :class:`aeidon.TimingReport`.
+
+        Overlapping subtitles and subtitles of negative duration are always
+        reported. `gap` is the shortest allowed gap between consecutive
+        subtitles in seconds and `speed` the highest allowed reading speed
+        in characters per second, either can be ``None`` to not check.
+        """
+        report = aeidon.TimingReport(
+            negative_durations=self.get_negative_durations(),
+            overlaps=self.get_overlaps())
+        if gap is not None:
+            report.gaps = self.get_short_gaps(gap)
+        if speed is not None:
+            report.speeding = self.get_speeding(speed)
+        return report
+
+    def _can_patch(self, indices):
+        """Return ``True`` if the index can be patched, else discard it."""
+        if self._timing_index is None: return False
+        # Patching needs positions of each subtitle at `indices` as seconds,
+        # for a large share of subtitles it is no faster than rebuilding
+        # and the index might not even be needed again.
+        if (self._timing_order is not None or
+            len(indices) > max(50, len(self.subtitles) / 10)):
+            self._timing_index = None
+            return False
+        return True
+
+    def _check_order(self, indices):
+        """Discard the index if subtitles at `indices` are out of order."""
+        index = self._timing_index
+        for i in indices:
+            if ((i > 0 and index[i-1][0] > index[i][0]) or
+                (i < len(index) - 1 and index[i][0] > index[i+1][0])):
+                self._timing_index = None
+                return
+
+    def _get_index(self):
+        """Return an up-to-date :class:`aeidon.IntervalIndex`."""
+        if (self._timing_index is not None and
+            len(self._timing_index) == len(self.subtitles)):
+            return self._timing_index
+        positions = [(x.start_seconds, x.end_seconds) for x in self.subtitles]
+        order = sorted(range(len(positions)), key=lambda i: positions[i][0])
+        if order == list(range(len(positions))):
+            self._timing_index = aeidon.IntervalIndex(positions)
+            self._timing_order = None
+        else:
+            self._timing_index = aeidon.IntervalIndex(
+                positions[i] for i in order)
+            self._timing_order = order
+        return self._timing_index
+
+    @aeidon.deco.export
+    def get_indices_at(self, position):
+        """Return a list of indices of subtitles shown at `position`."""
+        seconds = self.calc.to_seconds(position)
+        return self._map_order(self._get_index().get_active(seconds))
+
+    @aeidon.deco.export
+    def get_indices_between(self, start, end):
+        """Return a list of indices of subtitles shown between positions."""
+        start = self.calc.to_seconds(start)
+        end = self.calc.to_seconds(end)
+        indices = self._get_index().get_overlapping(start, end)
+        return self._map_order(indices)
+
+    @aeidon.deco.export
+    def get_negative_durations(self):
+        """Return a list of indices of subtitles ending before they start."""
+        return self._map_order(self._get_index().get_reversed())
+
+    @aeidon.deco.export
+    def get_overlaps(self):
+        """
+        Return a list of tuples of indices of overlapping subtitles.
+
+        Subtitles of negative duration are not included, see
+        :meth:`get_negative_durations`.
+        """
+        overlaps = self._get_index().get_overlaps()
+        if self._timing_order is None: return overlaps
+        order = self._timing_order
+        return sorted(tuple(sorted((order[i], order[j])))
+                      for i, j in overlaps)
+
+    @aeidon.deco.export
+    def get_short_gaps(self, gap):
+        """
+        Return a list of indices of subtitles followed by too short a gap.
+
+        `gap` is the shortest allowed gap in seconds between a subtitle and
+        the subtitle starting next after it. Overlapping subtitles, which
+        have a negative gap, are not included, see :meth:`get_overlaps`.
+        """
+        index = self._get_index()
+        indices = [i for i in range(len(index) - 1)
+                   if 0 <= index[i+1][0] - index[i][1] < gap]
+        return self._map_order(indices)
+
+    @aeidon.deco.export
+    def get_speeding(self, speed):
+        """
+        Return a list of indices of subtitles too fast to read.
+
+        `speed` is the highest allowed reading speed in characters per
+        second of the main text. Subtitles of zero duration with text are
+        always too fast to read. Subtitles of negative duration are not
+        included, see :meth:`get_negative_durations`.
+        """
+        indices = []
+        main = aeidon.documents.MAIN
+        index = self._get_index()
+        for i in range(len(index)):
+            j = (self._timing_order[i] if self._timing_order else i)
+            length = self.get_text_metrics(j, main).char_count
+            start, end = index[i]
+            if end < start: continue
+            if length > speed * (end - start):
+                indices.append(j)
+        return sorted(indices)
+
+    def _map_order(self, indices):
+        """Return `indices` of the index as sorted indices of subtitles."""
+        if self._timing_order is None: return indices
+        return sorted(self._timing_order[i] for i in indices)
+
+    def _on_main_file_opened(self, *args):
+        """Discard the index to be rebuilt."""
+        self._timing_index = None
+
+    def _on_notify_framerate(self, *args):
+        """Discard the index to be rebuilt."""
+        self._timing_index = None
+
+    def _on_positions_changed(self, project, indices):
+        """Update positions of subtitles at `indices` in the index."""
+        if not self._can_patch(indices): return
+        for i in indices:
+            subtitle = self.subtitles[i]
+            self._timing_index.set(i,
+                                   subtitle.start_seconds,
+                                   subtitle.end_seconds)
+        self._check_order(indices)
+
+    def _on_subtitle_moved(self, project, index, new_index):
+        """Move subtitle from `index` to `new_index` in the index."""
+        self._on_subtitles_removed(project, (index,))
+        self._on_subtitles_inserted(project, (new_index,))
+
+    def _on_subtitles_changed(self, project, indices):
+        """Update positions of subtitles at `indices` in the index."""
+        self._on_positions_changed(project, indices)
+
+    def _on_subtitles_inserted(self, project, indices):
+        """Insert subtitles at `indices` to the index."""
+        if not self._can_patch(indices): return
+        self._timing_index.insert_many(indices, [
+            (self.subtitles[i].start_seconds, self.subtitles[i].end_seconds)
+            for i in indices])
+        self._check_order(indices)
+
+    def _on_subtitles_removed(self, project, indices):
+        """Remove subtitles at `indices` from the index."""
+        if not self._can_patch(indices): return
+        self._timing_index.remove_many(indices)
@@ -22,7 +22,20 @@ import aeidon
 
 class UtilityAgent(aeidon.Delegate):
 
-    """Miscellaneous helper methods."""
+    """
+    Miscellaneous helper methods.
+
+    :ivar _text_metrics: Dictionary mapping documents to a tuple of format,
+        markup tag regular expression and a dictionary mapping texts to
+        :class:`aeidon.TextMetrics` instances
+    """
+
+    def __init__(self, master):
+        """Initialize a :class:`UtilityAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._text_metrics = {}
+        aeidon.util.connect(self, self, "main-file-opened")
+        aeidon.util.connect(self, self, "translation-file-opened")
 
     @aeidon.deco.export
     def get_all_indices(self):
@@ -113,11 +126,28 @@ class UtilityAgent(aeidon.Delegate):
     @aeidon.deco.export
     def get_text_length(self, index, doc):
         """Return the amount of characters in text excluding markup."""
+        return self.get_text_metrics(index, doc).char_count
+
+    @aeidon.deco.export
+    def get_text_metrics(self, index, doc):
+        """
+        Return :class:`aeidon.TextMetrics` for `doc`'s text at `index`.
+
+        Metrics are cached by text and reused as long as the text and the
+        format of `doc` remain the same.
+        """
         text = self.subtitles[index].get_text(doc)
-        re_tag = self.get_markup_tag_regex(doc)
-        if re_tag is not None:
-            text = re_tag.sub("", text)
-        return len(text)
+        format = self.get_format(doc)
+        if (doc not in self._text_metrics or
+            self._text_metrics[doc][0] is not format):
+            re_tag = self.get_markup_tag_regex(doc)
+            self._text_metrics[doc] = (format, re_tag, {})
+        format, re_tag, cache = self._text_metrics[doc]
+        with aeidon.util.silent(KeyError):
+            return cache[text]
+        metrics = aeidon.TextMetrics(text, re_tag)
+        cache[text] = metrics
+        return metrics
 
     @aeidon.deco.export
     def get_text_signal(self, doc):
@@ -129,6 +159,26 @@ class UtilityAgent(aeidon.Delegate):
         raise ValueError("Invalid document: {}"
                          .format(repr(doc)))
 
+    @aeidon.deco.export
+    def invalidate_text_metrics(self, doc, texts=None):
+        """
+        Remove cached metrics of `doc`'s `texts`.
+
+        `texts` can be ``None`` to remove metrics of all texts. Since metrics
+        are cached by text, stale metrics are never returned, but metrics of
+        texts no longer present should be removed to free memory.
+        """
+        if doc not in self._text_metrics: return
+        if texts is None:
+            return self._text_metrics.pop(doc)
+        cache = self._text_metrics[doc][2]
+        for text in texts:
+            cache.pop(text, None)
+
+    def _on_main_file_opened(self, *args):
+        """Remove cached metrics of texts replaced by opening."""
+        self.invalidate_text_metrics(aeidon.documents.MAIN)
+
     @aeidon.deco.export
     def new_subtitle(self):
         """Return a new :class:`aeidon.Subtitle` instance."""
@@ -161,3 +211,7 @@ class UtilityAgent(aeidon.Delegate):
             temp_file = aeidon.files.new(format, path, encoding)
         self.save(doc, temp_file, keep_changes=False)
         return temp_file.path
+
+    def _on_translation_file_opened(self, *args):
+        """Remove cached metrics of texts replaced by opening."""
+        self.invalidate_text_metrics(aeidon.documents.TRAN)
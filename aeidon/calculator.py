@@ -196,12 +196,14 @@ class Calculator:
         seconds = abs(round(seconds, 3))
         if seconds > 359999.999:
             return "{}99:59:59.999".format(sign)
-        return ("{}{:02.0f}:{:02.0f}:{:02.0f}.{:03.0f}"
-                .format(sign,
-                        seconds // 3600,
-                        (seconds % 3600) // 60,
-                        int(seconds % 60),
-                        (seconds % 1) * 1000))
+        # Old-style formatting is notably faster here, which matters
+        # when converting all positions of long subtitle files.
+        return ("%s%02d:%02d:%02d.%03d"
+                % (sign,
+                   seconds // 3600,
+                   (seconds % 3600) // 60,
+                   seconds % 60,
+                   round((seconds % 1) * 1000)))
 
     def time_to_frame(self, time):
         """Convert `time` to frame."""
@@ -210,12 +212,12 @@ class Calculator:
 
     def time_to_seconds(self, time):
         """Convert `time` to seconds."""
-        coefficient = (-1 if time.startswith("-") else 1)
-        time = (time[1:] if time.startswith("-") else time)
-        return coefficient * sum((float(time[ :2]) * 3600,
-                                  float(time[3:5]) * 60,
-                                  float(time[6:8]),
-                                  float(time[9: ]) / 1000))
+        if time.startswith("-"):
+            return -self.time_to_seconds(time[1:])
+        return (int(time[ :2]) * 3600 +
+                int(time[3:5]) * 60 +
+                int(time[6:8]) +
+                int(time[9: ]) / 1000)
 
     def to_frame(self, pos):
         """Convert `pos` to frame."""
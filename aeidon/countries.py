@@ -32,13 +32,21 @@ def _init_countries():
     # fall back on possibly bundled JSON.
     path = "/usr/share/iso-codes/json/iso_3166-1.json"
     if os.path.isfile(path):
-        return _init_countries_json(path)
+        return _init_countries_cached(path, _init_countries_json)
     path = "/usr/share/xml/iso-codes/iso_3166.xml"
     if os.path.isfile(path):
-        return _init_countries_xml(path)
+        return _init_countries_cached(path, _init_countries_xml)
     path = os.path.join(aeidon.DATA_DIR, "iso-codes", "iso_3166-1.json")
     if os.path.isfile(path):
-        return _init_countries_json(path)
+        return _init_countries_cached(path, _init_countries_json)
+
+def _init_countries_cached(path, parse):
+    """Initialize the dictionary from cache or by parsing `path`."""
+    table = aeidon.util.read_cached_table("iso_3166", path)
+    if table is not None:
+        return _countries.update(table)
+    parse(path)
+    aeidon.util.write_cached_table("iso_3166", path, _countries)
 
 def _init_countries_json(path):
     """Initialize the dictionary mapping codes to names."""
@@ -23,6 +23,8 @@ For functions dealing with character encodings, see also :mod:`aeidon.util`.
 
 import aeidon
 import codecs
+import importlib.util
+import itertools
 import locale
 import re
 
@@ -137,33 +139,30 @@ CODE, NAME, DESC = range(3)
 # Illegal characters in encoding codes.
 _re_illegal = re.compile(r"[^a-z0-9_]")
 
+# Dictionaries mapping codes and names to items of _encodings
+# and arbitrary codes to their normalized versions.
+_codes = {}
+_names = {}
+_translations = {}
+
+# Amount of bytes to feed to chardet at a time.
+_detect_size = 65536
+
 
 def code_to_description(code):
     """Convert encoding `code` to localized description."""
-    for item in _encodings:
-        if item[CODE] == code:
-            return item[DESC]
-    raise ValueError("Code {} not found"
-                     .format(repr(code)))
+    return _get_item(code)[DESC]
 
 def code_to_long_name(code):
     """Convert encoding `code` to localized long name."""
-    for item in _encodings:
-        if item[CODE] == code:
-            return (_("{description} ({name})")
-                    .format(name=item[NAME],
-                            description=item[DESC]))
-
-    raise ValueError("Code {} not found"
-                     .format(repr(code)))
+    item = _get_item(code)
+    return (_("{description} ({name})")
+            .format(name=item[NAME],
+                    description=item[DESC]))
 
 def code_to_name(code):
     """Convert encoding `code` to name."""
-    for item in _encodings:
-        if item[CODE] == code:
-            return item[NAME]
-    raise ValueError("Code {} not found"
-                     .format(repr(code)))
+    return _get_item(code)[NAME]
 
 def detect(path):
     """
@@ -171,48 +170,95 @@ def detect(path):
 
     Raise :exc:`IOError` if reading fails.
     """
-    bom_encoding = detect_bom(path)
-    if bom_encoding is not None:
-        return bom_encoding
-    from chardet import universaldetector
-    detector = universaldetector.UniversalDetector()
     with open(path, "rb") as f:
-        detector.reset()
-        for line in f:
-            detector.feed(line)
-            if detector.done: break
-    detector.close()
-    code = detector.result["encoding"]
-    if code is None: return None
-    try:
-        # chardet returns what seem to be IANA names. They need to be
-        # translated to their Python equivalents. Some of the encodings
-        # returned by chardet are not supported by Python.
-        return translate_code(code)
-    except ValueError:
-        return None
+        return detect_data(f.read())
 
 def detect_bom(path):
     """Return corresponding encoding if BOM found, else ``None``."""
     with open(path, "rb") as f:
         line = f.readline()
-    if (line.startswith(codecs.BOM_UTF32_BE) and
+    return detect_bom_data(line)
+
+def detect_bom_data(data):
+    """Return corresponding encoding if `data` starts with BOM."""
+    if (data.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
-    if (line.startswith(codecs.BOM_UTF32_LE) and
+    if (data.startswith(codecs.BOM_UTF32_LE) and
         is_valid_code("utf_32_le")):
         return "utf_32_le"
-    if (line.startswith(codecs.BOM_UTF8) and
+    if (data.startswith(codecs.BOM_UTF8) and
         is_valid_code("utf_8_sig")):
         return "utf_8_sig"
-    if (line.startswith(codecs.BOM_UTF16_BE) and
+    if (data.startswith(codecs.BOM_UTF16_BE) and
         is_valid_code("utf_16_be")):
         return "utf_16_be"
-    if (line.startswith(codecs.BOM_UTF16_LE) and
+    if (data.startswith(codecs.BOM_UTF16_LE) and
         is_valid_code("utf_16_le")):
         return "utf_16_le"
     return None
 
+def detect_data(data):
+    """
+    Detect the encoding of bytes `data` and return code or ``None``.
+
+    If `data` is valid UTF-8, return UTF-8 without trying :mod:`chardet`,
+    since other encodings are unlikely to produce valid UTF-8 by chance.
+    """
+    bom_encoding = detect_bom_data(data)
+    if bom_encoding is not None:
+        return bom_encoding
+    if _is_utf_8(data): return "utf_8"
+    from chardet import universaldetector
+    detector = universaldetector.UniversalDetector()
+    for i in range(0, len(data), _detect_size):
+        detector.feed(data[i:i+_detect_size])
+        if detector.done: break
+    detector.close()
+    code = detector.result["encoding"]
+    if code is None: return None
+    try:
+        # chardet returns what seem to be IANA names. They need to be
+        # translated to their Python equivalents. Some of the encodings
+        # returned by chardet are not supported by Python.
+        return translate_code(code)
+    except ValueError:
+        return None
+
+def get_decodable(data, codes):
+    """
+    Iterate over those of `codes` that can decode bytes `data`.
+
+    `codes` should be in order of preference and can include ``"auto"`` for
+    the encoding detected by :func:`detect_data`. An encoding indicated by
+    a BOM in `data` is tried first, the rest in order of preference. Codes
+    are detected and tried only once iteration reaches them, so that it can
+    be stopped at the first one that works. Trial decoding is done in memory
+    to avoid rereading files.
+    """
+    tried = set()
+    codes = itertools.chain((detect_bom_data(data),), codes)
+    for code in codes:
+        if code == "auto":
+            code = detect_data(data)
+        if code is None or code in tried: continue
+        tried.add(code)
+        try:
+            data.decode(code)
+        except (LookupError, UnicodeError):
+            continue
+        yield code
+
+def _get_item(code):
+    """Return item in _encodings corresponding to `code`."""
+    if not _codes:
+        _init_indices()
+    try:
+        return _codes[code]
+    except LookupError:
+        raise ValueError("Code {} not found"
+                         .format(repr(code)))
+
 @aeidon.deco.once
 def get_locale_code():
     """Return code of the locale encoding or ``None``."""
@@ -233,10 +279,35 @@ def get_valid():
     """Return a list of code, name, description of valid encodings."""
     valid_encodings = []
     for i, item in enumerate(_encodings):
-        if is_valid_code(item[CODE]):
+        if _is_available_code(item[CODE]):
             valid_encodings.append(item)
     return valid_encodings
 
+def _init_indices():
+    """Initialize the dictionaries mapping codes and names to items."""
+    for item in _encodings:
+        _codes.setdefault(item[CODE], item)
+        _names.setdefault(item[NAME], item)
+
+def _is_available_code(code):
+    """Return ``True`` if encoding `code` is valid, avoid import if possible."""
+    # Looking up a codec imports its module, which is slow if done
+    # for all encodings. Codes in _encodings are the module names
+    # in the standard library encodings package, so we can check
+    # that the module exists without importing it.
+    with aeidon.util.silent(ImportError, ValueError):
+        if importlib.util.find_spec("encodings.{}".format(code)):
+            return True
+    return is_valid_code(code)
+
+def _is_utf_8(data):
+    """Return ``True`` if `data` is valid UTF-8."""
+    try:
+        data.decode("utf_8")
+    except UnicodeError:
+        return False
+    return True
+
 def is_valid_code(code):
     """Return ``True`` if encoding `code` is valid."""
     try:
@@ -247,18 +318,20 @@ def is_valid_code(code):
 
 def name_to_code(name):
     """Convert encoding `name` to code."""
-    for item in _encodings:
-        if item[NAME] == name:
-            return item[CODE]
-    raise ValueError("Name {} not found"
-                     .format(repr(name)))
+    if not _names:
+        _init_indices()
+    try:
+        return _names[name][CODE]
+    except LookupError:
+        raise ValueError("Name {} not found"
+                         .format(repr(name)))
 
 def translate_code(code):
     """Return normalized encoding `code`."""
-    code = _re_illegal.sub("_", code.lower())
-    code = aeidon.util.get_encoding_alias(code)
-    for item in _encodings:
-        if item[CODE] == code:
-            return item[CODE]
-    raise ValueError("Code {} not found"
-                     .format(repr(code)))
+    if code in _translations:
+        return _translations[code]
+    normalized = _re_illegal.sub("_", code.lower())
+    normalized = aeidon.util.get_encoding_alias(normalized)
+    normalized = _get_item(normalized)[CODE]
+    _translations[code] = normalized
+    return normalized
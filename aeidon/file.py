@@ -55,6 +55,8 @@ class SubtitleFile:
 
         self.newline = newline or aeidon.util.get_default_newline()
         self.path = os.path.abspath(path)
+        # Bytes of file already read, see read_data.
+        self._data = None
 
     def copy_from(self, other):
         """Copy generic properties from `other`."""
@@ -75,6 +77,19 @@ class SubtitleFile:
         """
         raise NotImplementedError
 
+    def read_data(self, data):
+        """
+        Read subtitles from bytes `data` already read from file.
+
+        `data` is decoded instead of reading the file again.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        self._data = data
+        try:
+            return self.read()
+        finally:
+            self._data = None
+
     def _read_lines(self):
         """
         Read file to a list of lines.
@@ -86,13 +101,15 @@ class SubtitleFile:
         Return a list of lines read.
         """
         re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
+        with aeidon.util.open_text(self.path,
+                                   self.encoding,
+                                   self._data) as f:
             lines = f.readlines()
             lines = [re_newline_char.sub("", x) for x in lines]
         for index in (0, -1):
             while lines and not lines[index].strip():
                 lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
+        newline = aeidon.util.detect_newlines(self.path, self._data)
         if newline is not None:
             self.newline = newline
         if self.encoding == "utf_8":
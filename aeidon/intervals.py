@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Index of intervals for fast lookup by position."""
+
+import bisect
+import itertools
+
+__all__ = ("IntervalIndex",)
+
+
+class IntervalIndex:
+
+    """
+    Index of intervals for fast lookup by position.
+
+    Intervals are referred to by their index and are usually sorted by
+    start, as are subtitles of :class:`aeidon.Project`. Intervals may
+    overlap. Lookups bisect the starts and then scan backwards only as far
+    as preceding intervals can still reach the position, which for typical
+    subtitle data means a lookup takes O(log n) time. Subtitles are not
+    re-sorted after e.g. shifting positions of a selection though, and if
+    starts are out of order, lookups fall back to scanning all intervals.
+
+    Intervals can be changed with :meth:`insert`, :meth:`remove` and
+    :meth:`set`. Bookkeeping needed for lookups is updated lazily on the
+    next lookup.
+    """
+
+    def __init__(self, intervals=()):
+        """
+        Initialize an :class:`IntervalIndex` instance.
+
+        `intervals` should be a sequence of ``(start, end)`` tuples.
+        """
+        intervals = list(intervals)
+        self._starts = [x[0] for x in intervals]
+        self._ends = [x[1] for x in intervals]
+        # Cumulative maximum of ends, i.e. the furthest position reached
+        # by any interval up to index. Truncated on changes and extended
+        # again on lookup to cover all intervals.
+        self._reach = list(itertools.accumulate(self._ends, max))
+        # True if starts are known to be in order, False if known not to be
+        # and None if unknown, in which case checked on the next lookup.
+        self._ordered = None
+
+    def __getitem__(self, index):
+        """Return start and end of interval at `index`."""
+        return (self._starts[index], self._ends[index])
+
+    def __len__(self):
+        """Return the amount of intervals."""
+        return len(self._starts)
+
+    def _check_order(self, index):
+        """Mark starts out of order if interval at `index` is."""
+        if not self._ordered:
+            # Starts might have come back into order.
+            self._ordered = None
+            return
+        starts = self._starts
+        if ((index > 0 and starts[index-1] > starts[index]) or
+            (index < len(starts) - 1 and starts[index] > starts[index+1])):
+            self._ordered = False
+
+    def get_active(self, pos):
+        """Return a list of indices of intervals containing `pos`."""
+        return sorted(self._iter_active(pos))
+
+    def get_last_active(self, pos):
+        """Return index of last interval containing `pos` or ``None``."""
+        return next(self._iter_active(pos), None)
+
+    def get_next(self, pos):
+        """Return index of first interval starting after `pos` or ``None``."""
+        if not self._is_ordered():
+            indices = [i for i, x in enumerate(self._starts) if x > pos]
+            if not indices: return None
+            return min(indices, key=self._starts.__getitem__)
+        index = bisect.bisect_right(self._starts, pos)
+        return (index if index < len(self._starts) else None)
+
+    def get_overlapping(self, start, end):
+        """Return a list of indices of intervals overlapping `start`-`end`."""
+        if not self._is_ordered():
+            return [i for i in range(len(self._starts))
+                    if self._starts[i] <= end and self._ends[i] >= start]
+        self._update_reach()
+        index = bisect.bisect_right(self._starts, end)
+        indices = []
+        for i in range(index - 1, -1, -1):
+            if self._reach[i] < start: break
+            if self._ends[i] >= start:
+                indices.append(i)
+        return indices[::-1]
+
+    def get_overlaps(self):
+        """
+        Return a list of tuples of indices of overlapping intervals.
+
+        Intervals ending before they start are not included, since those
+        are errors of their own rather than overlaps, see
+        :meth:`get_reversed`.
+        """
+        # Since starts are sorted, the intervals overlapping an interval
+        # from its start on are the ones following it and starting before
+        # its end, found by bisecting instead of comparing all pairs.
+        if not self._is_ordered():
+            order = sorted(range(len(self._starts)),
+                           key=self._starts.__getitem__)
+            index = IntervalIndex(self[i] for i in order)
+            return sorted(tuple(sorted((order[i], order[j])))
+                          for i, j in index.get_overlaps())
+        overlaps = []
+        starts, ends = self._starts, self._ends
+        for i, end in enumerate(ends):
+            if end < starts[i]: continue
+            index = bisect.bisect_left(starts, end, i + 1)
+            overlaps.extend((i, j) for j in range(i + 1, index)
+                            if ends[j] >= starts[j])
+        return overlaps
+
+    def get_previous(self, pos):
+        """Return index of last interval ending before `pos` or ``None``."""
+        # Intervals ending before pos must also start before it.
+        index = len(self._starts)
+        if self._is_ordered():
+            index = bisect.bisect_left(self._starts, pos)
+        for i in range(index - 1, -1, -1):
+            if self._ends[i] < pos:
+                return i
+        return None
+
+    def get_reversed(self):
+        """Return a list of indices of intervals ending before they start."""
+        return [i for i, (start, end)
+                in enumerate(zip(self._starts, self._ends)) if end < start]
+
+    def insert(self, index, start, end):
+        """Insert interval from `start` to `end` at `index`."""
+        self._starts.insert(index, start)
+        self._ends.insert(index, end)
+        del self._reach[index:]
+        self._check_order(index)
+
+    def insert_many(self, indices, intervals):
+        """
+        Insert `intervals` at `indices`.
+
+        `indices` are positions after inserting all of `intervals`, which
+        should be a sequence of ``(start, end)`` tuples. All intervals are
+        inserted in one pass, which is faster than separate inserts, each
+        of which needs to shift all following intervals.
+        """
+        items = sorted(zip(indices, intervals))
+        if not items: return
+        starts, ends = [], []
+        j = 0
+        for index, (start, end) in items:
+            k = j + index - len(starts)
+            starts.extend(self._starts[j:k])
+            ends.extend(self._ends[j:k])
+            starts.append(start)
+            ends.append(end)
+            j = k
+        starts.extend(self._starts[j:])
+        ends.extend(self._ends[j:])
+        self._starts, self._ends = starts, ends
+        del self._reach[items[0][0]:]
+        for index, interval in items:
+            self._check_order(index)
+
+    def _is_ordered(self):
+        """Return ``True`` if starts are in order."""
+        if self._ordered is None:
+            starts = self._starts
+            self._ordered = all(starts[i] <= starts[i+1]
+                                for i in range(len(starts) - 1))
+        return self._ordered
+
+    def _iter_active(self, pos):
+        """Iterate over indices of intervals containing `pos` backwards."""
+        if not self._is_ordered():
+            for i in range(len(self._starts) - 1, -1, -1):
+                if self._starts[i] <= pos <= self._ends[i]:
+                    yield i
+            return
+        self._update_reach()
+        index = bisect.bisect_right(self._starts, pos)
+        for i in range(index - 1, -1, -1):
+            if self._reach[i] < pos: break
+            if self._ends[i] >= pos:
+                yield i
+
+    def remove(self, index):
+        """Remove interval at `index`."""
+        del self._starts[index]
+        del self._ends[index]
+        del self._reach[index:]
+        if self._ordered is False:
+            self._ordered = None
+
+    def remove_many(self, indices):
+        """
+        Remove intervals at `indices`.
+
+        All intervals are removed in one pass, which is faster than
+        separate removals, each of which needs to shift all following
+        intervals.
+        """
+        indices = sorted(set(indices))
+        if not indices: return
+        starts, ends = [], []
+        j = 0
+        for index in indices:
+            starts.extend(self._starts[j:index])
+            ends.extend(self._ends[j:index])
+            j = index + 1
+        starts.extend(self._starts[j:])
+        ends.extend(self._ends[j:])
+        self._starts, self._ends = starts, ends
+        del self._reach[indices[0]:]
+        if self._ordered is False:
+            self._ordered = None
+
+    def set(self, index, start, end):
+        """Set interval at `index` to span from `start` to `end`."""
+        self._starts[index] = start
+        self._ends[index] = end
+        del self._reach[index:]
+        self._check_order(index)
+
+    def _update_reach(self):
+        """Extend cumulative maximum of ends to cover all intervals."""
+        n = len(self._reach)
+        if n == len(self._ends): return
+        seed = self._reach[-1:]
+        reach = itertools.accumulate(seed + self._ends[n:], max)
+        self._reach.extend(itertools.islice(reach, len(seed), None))
@@ -32,13 +32,21 @@ def _init_languages():
     # fall back on possibly bundled JSON.
     path = "/usr/share/iso-codes/json/iso_639-2.json"
     if os.path.isfile(path):
-        return _init_languages_json(path)
+        return _init_languages_cached(path, _init_languages_json)
     path = "/usr/share/xml/iso-codes/iso_639.xml"
     if os.path.isfile(path):
-        return _init_languages_xml(path)
+        return _init_languages_cached(path, _init_languages_xml)
     path = os.path.join(aeidon.DATA_DIR, "iso-codes", "iso_639-2.json")
     if os.path.isfile(path):
-        return _init_languages_json(path)
+        return _init_languages_cached(path, _init_languages_json)
+
+def _init_languages_cached(path, parse):
+    """Initialize the dictionary from cache or by parsing `path`."""
+    table = aeidon.util.read_cached_table("iso_639", path)
+    if table is not None:
+        return _languages.update(table)
+    parse(path)
+    aeidon.util.write_cached_table("iso_639", path, _languages)
 
 def _init_languages_json(path):
     """Initialize the dictionary mapping codes to names."""
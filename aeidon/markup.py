@@ -18,6 +18,7 @@
 """Base class for text markup."""
 
 import aeidon
+import collections
 import re
 
 __all__ = ("Markup",)
@@ -30,8 +31,10 @@ class Markup(aeidon.Singleton):
 
     Markup conversions between different formats are done via an internal
     format, which has the following BBcode-style tags with angle brackets.
-    Conversions are best done via the ``_decode_*`` and ``_encode_*`` methods
-    rather than hard-coding internal tags in regular expression substitutions.
+    Conversions are best done by defining the tags of a format in
+    :attr:`_tags` for decoding and implementing the tagging methods, e.g.
+    :meth:`bolden`, for encoding rather than hard-coding internal tags in
+    regular expression substitutions.
 
      * ``<b>...................</b>``
      * ``<i>...................</i>``
@@ -49,6 +52,36 @@ class Markup(aeidon.Singleton):
     _flags = re.DOTALL | re.MULTILINE
     format = aeidon.formats.NONE
 
+    # Opening and closing internal tags by name.
+    _internal_tags = {
+        "b": ("<b>", "</b>"),
+        "c": ("<color=#{}>", "</color>"),
+        "f": ("<font={}>", "</font>"),
+        "i": ("<i>", "</i>"),
+        "s": ("<size={}>", "</size>"),
+        "u": ("<u>", "</u>"),
+    }
+
+    # Internal tags in the same form as _tags below.
+    _internal_tag_patterns = (
+        ("b", r"<b>", r"</b>"),
+        ("c", r"<color=#([a-fA-F0-9]{6})>", r"</color>"),
+        ("f", r"<font=(.+?)>", r"</font>"),
+        ("i", r"<i>", r"</i>"),
+        ("s", r"<size=(\d+)>", r"</size>"),
+        ("u", r"<u>", r"</u>"),
+    )
+
+    # Decodable tags as tuples of internal tag name and regular expression
+    # patterns of the opening and closing tag. The value of color, font and
+    # size tags is the last group of the opening pattern. If the closing
+    # pattern has a group, it must equal group 1 of the opening pattern.
+    _tags = ()
+
+    # True if tagging methods only wrap text in tags without looking at the
+    # text around, which allows encoding all tags in one pass.
+    _tags_context_free = True
+
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
         raise NotImplementedError
@@ -73,60 +106,17 @@ class Markup(aeidon.Singleton):
         text = self._main_decode(text)
         return self._post_decode(text)
 
-    def _decode_apply(self, text, regex, replacement, groups):
-        """
-        Return `text` with all matches of `regex` replaced.
-
-        `replacement` may contain one or more of ``{}``, which are replaced
-        with parts of the match as defined by `groups`, a ``tuple`` of numbers.
-        """
-        orig_text = text
-        match = regex.search(text)
-        if match is None: return text
-        a, z = match.span()
-        new = replacement.format(*tuple(map(match.group, groups)))
-        text = "".join((text[:a], new, text[z:]))
-        if text == orig_text: return text
-        return self._decode_apply(text, regex, replacement, groups)
-
-    def _decode_b(self, text, pattern, target, flags=0):
-        """Return `text` with bold markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<b>{}</b>"
-        return self._decode_apply(text, regex, replacement, (target,))
-
-    def _decode_c(self, text, pattern, value, target, flags=0):
-        """Return `text` with color markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<color=#{}>{}</color>"
-        return self._decode_apply(text, regex, replacement, (value, target))
-
-    def _decode_f(self, text, pattern, value, target, flags=0):
-        """Return `text` with font markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<font={}>{}</font>"
-        return self._decode_apply(text, regex, replacement, (value, target))
-
-    def _decode_i(self, text, pattern, target, flags=0):
-        """Return `text` with italic markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<i>{}</i>"
-        return self._decode_apply(text, regex, replacement, (target,))
-
-    def _decode_s(self, text, pattern, value, target, flags=0):
-        """Return `text` with size markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<size={}>{}</size>"
-        return self._decode_apply(text, regex, replacement, (value, target))
-
-    def _decode_u(self, text, pattern, target, flags=0):
-        """Return `text` with underline markup converted to internal format."""
-        regex = self._get_regex(pattern, flags)
-        replacement = "<u>{}</u>"
-        return self._decode_apply(text, regex, replacement, (target,))
-
     def encode(self, text):
         """Return `text` with markup converted from internal to this format."""
+        if self._tags_context_free:
+            parts = self._parse_tags(text, self._internal_tag_patterns)
+            tags = set(x[:2] for x in parts if not isinstance(x, str))
+            tags = {x: self._get_tags(*x) for x in tags}
+            return "".join(x if isinstance(x, str) else
+                           tags[x[:2]][x[2]] for x in parts)
+
+        # Tags depend on the text around, e.g. beginnings of lines,
+        # apply tagging methods one tag at a time in a fixed order.
         text = self._encode_b(text)
         text = self._encode_c(text)
         text = self._encode_f(text)
@@ -141,19 +131,22 @@ class Markup(aeidon.Singleton):
         `method` should be one the tagging methods, e.g. meth:`bolden`.
         `target` and `value` should be group numbers in `regex`.
         """
-        orig_text = text
-        match = regex.search(text)
-        if match is None: return text
-        text = regex.sub(r"\{}".format(target), text, 1)
-        a = match.start()
-        z = a + len(match.group(target))
-        args = (text, (a, z))
-        if value is not None:
-            args = (text, match.group(value), (a, z))
-        with aeidon.util.silent(NotImplementedError):
-            text = method(*args)
-        if text == orig_text: return text
-        return self._encode_apply(text, regex, method, target, value)
+        # Tagging methods only insert tags at or after the start of the
+        # match, so search again from there instead of from the start.
+        pos = 0
+        while True:
+            match = regex.search(text, pos)
+            if match is None: return text
+            orig_text = text
+            a, z = match.span()
+            inner = match.group(target)
+            text = "".join((text[:a], inner, text[z:]))
+            args = (text, (a, a + len(inner)))
+            if value is not None:
+                args = (text, match.group(value), (a, a + len(inner)))
+            with aeidon.util.silent(NotImplementedError):
+                text = method(*args)
+            pos = (a + 1 if text == orig_text else a)
 
     def _encode_b(self, text):
         """Return `text` with bold markup converted to this format."""
@@ -195,6 +188,59 @@ class Markup(aeidon.Singleton):
         flags = self._flags | flags
         return re.compile(pattern, flags)
 
+    @aeidon.deco.memoize(100)
+    def _get_tags(self, name, value):
+        """Return opening and closing tag of this format for internal tag."""
+        method = {"b": self.bolden,
+                  "c": self.colorize,
+                  "f": self.fontify,
+                  "i": self.italicize,
+                  "s": self.scale,
+                  "u": self.underline}[name]
+
+        # Tag a placeholder and split at it to find out
+        # which tags the tagging method adds around text.
+        args = ("\0",) if value is None else ("\0", value)
+        try:
+            return tuple(method(*args).split("\0"))
+        except NotImplementedError:
+            return ("", "")
+
+    @aeidon.deco.memoize(100)
+    def _get_tags_regex(self, tags):
+        """
+        Return a regular expression for all of `tags` and group details.
+
+        Group details are returned as a dictionary mapping names of groups for
+        each tag to a tuple of internal tag name, ``True`` if closing tag,
+        index of the group, amount of subgroups and ``True`` if the opening and
+        closing tag need to match by group 1.
+        """
+        alternatives = []
+        groups = {}
+        # Try closing tags first, since an opening pattern can match
+        # a closing tag too, e.g. "{\\fn\\}" is "{\\fnNAME}" for SSA.
+        for j in (1, 0):
+            for i, (name, opening, closing) in enumerate(tags):
+                pattern = (opening, closing)[j]
+                group = "t{:d}_{:d}".format(i, j)
+                alternatives.append("(?P<{}>{})".format(group, pattern))
+                count = re.compile(pattern).groups
+                keyed = re.compile(closing).groups > 0
+                groups[group] = [name, bool(j), None, count, keyed]
+        pattern = "|".join(alternatives)
+        heads = set(x[:2] if x.startswith("\\") else x[:1]
+                    for tag in tags for x in tag[1:])
+        if all(x in ("<", "\\{") for x in heads):
+            # Check the first character up front to let the regular
+            # expression engine skip plain text quickly instead of
+            # trying all alternatives at every position.
+            pattern = "(?=[{}])(?:{})".format("".join(heads), pattern)
+        regex = self._get_regex(pattern)
+        for group, value in regex.groupindex.items():
+            groups[group][2] = value
+        return regex, {k: tuple(v) for k, v in groups.items()}
+
     @property
     def italic_tag(self):
         """Regular expression for an italic markup tag or ``None``."""
@@ -206,7 +252,46 @@ class Markup(aeidon.Singleton):
 
     def _main_decode(self, text):
         """Return `text` with decodable markup decoded."""
-        return text
+        if not self._tags: return text
+        parts = self._parse_tags(text, self._tags)
+        return "".join(x if isinstance(x, str) else
+                       self._internal_tags[x[0]][x[2]].format(x[1])
+                       for x in parts)
+
+    def _parse_tags(self, text, tags):
+        """
+        Return `text` split into strings and paired markup tags.
+
+        `tags` should be a sequence of tuples like :attr:`_tags`. Paired tags
+        are returned as tuples of internal tag name, value and ``0`` for an
+        opening or ``1`` for a closing tag. Each closing tag is paired with
+        the first unpaired opening tag before it, unpaired tags are returned
+        as strings. `text` is scanned once for all of `tags`.
+        """
+        regex, groups = self._get_tags_regex(tags)
+        parts = []
+        pending = collections.defaultdict(collections.deque)
+        pos = 0
+        for match in regex.finditer(text):
+            a = match.start()
+            if a > pos:
+                parts.append(text[pos:a])
+            pos = match.end()
+            name, closing, index, count, keyed = groups[match.lastgroup]
+            key = match.group(index + 1) if keyed else None
+            if not closing:
+                value = match.group(index + count) if count else None
+                pending[name, key].append((len(parts), value))
+                parts.append(match.group())
+            elif pending[name, key]:
+                i, value = pending[name, key].popleft()
+                parts[i] = (name, value, 0)
+                parts.append((name, value, 1))
+            else:
+                parts.append(match.group())
+        if pos < len(text):
+            parts.append(text[pos:])
+        return parts
 
     def _post_decode(self, text):
         """Return `text` with markup finalized after decoding."""
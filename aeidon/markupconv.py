@@ -18,13 +18,30 @@
 """Subtitle text markup converter."""
 
 import aeidon
+import collections
+import re
+import threading
 
 __all__ = ("MarkupConverter",)
 
 
 class MarkupConverter:
 
-    """Subtitle text markup converter."""
+    """
+    Subtitle text markup converter.
+
+    Converted texts are cached by formats and text and shared by all
+    instances, so that e.g. saving the same texts again or in several
+    formats doesn't need to convert the same texts again.
+    """
+
+    _cache = collections.OrderedDict()
+    _cache_limit = 10000
+    _cache_lock = threading.Lock()
+
+    # Texts without any of these characters cannot contain markup tags
+    # in any of the supported formats and are returned as such.
+    _re_tag_char = re.compile(r"[<{/\\_]")
 
     def __init__(self, from_format, to_format):
         """
@@ -34,8 +51,30 @@ class MarkupConverter:
         enumeration items.
         """
         self._from = aeidon.markups.new(from_format)
+        self._key = (from_format, to_format)
         self._to = aeidon.markups.new(to_format)
 
     def convert(self, text):
         """Return `text` with markup converted."""
-        return self._to.encode(self._from.decode(text))
+        if self._re_tag_char.search(text) is None: return text
+        key = (self._key, text)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        new_text = self._to.encode(self._from.decode(text))
+        with self._cache_lock:
+            self._cache[key] = new_text
+            while len(self._cache) > self._cache_limit:
+                self._cache.popitem(last=False)
+        return new_text
+
+    def convert_many(self, texts):
+        """Return a list of `texts` with markup converted."""
+        # Convert repeated texts, e.g. song or sound
+        # effect subtitles, only once per call.
+        new_texts = {}
+        for text in texts:
+            if text in new_texts: continue
+            new_texts[text] = self.convert(text)
+        return [new_texts[x] for x in texts]
@@ -44,11 +44,10 @@ class AdvSubStationAlpha(aeidon.markups.SubStationAlpha):
     _opening_pattern = r"\{\\(?![biu]0)(b|i|u|c|fn|fs).*?\}"
     _reset_pattern   = r"\{\\r.*?\}"
 
-    def _main_decode(self, text):
-        """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"\{\\b[1-9]\d*\}(.*?)\{\\b[0\\]\}", 1)
-        text = self._decode_u(text, r"\{\\u1\}(.*?)\{\\u[0\\]\}", 1)
-        return aeidon.markups.SubStationAlpha._main_decode(self, text)
+    _tags = (
+        ("b", r"\{\\b[1-9]\d*\}", r"\{\\b[0\\]\}"),
+        ("u", r"\{\\u1\}", r"\{\\u[0\\]\}"),
+    ) + aeidon.markups.SubStationAlpha._tags
 
     def underline(self, text, bounds=None):
         """Return underlined `text`."""
@@ -44,6 +44,18 @@ class MicroDVD(aeidon.Markup):
 
     format = aeidon.formats.MICRODVD
 
+    _tags = (
+        ("b", r"\{([Yy]:b)\}", r"\{/([Yy]:b)\}"),
+        ("c", r"\{([Cc]:#(.*?))\}", r"\{/([Cc]:#.*?)\}"),
+        ("f", r"\{([Ff]:(.*?))\}", r"\{/([Ff]:.*?)\}"),
+        ("i", r"\{([Yy]:i)\}", r"\{/([Yy]:i)\}"),
+        ("s", r"\{([Ss]:(.*?))\}", r"\{/([Ss]:.*?)\}"),
+        ("u", r"\{([Yy]:u)\}", r"\{/([Yy]:u)\}"),
+    )
+
+    # Tags are only added at beginnings of lines or subtitles.
+    _tags_context_free = False
+
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
         return self._style(text, "Y", "y", "b", bounds)
@@ -67,16 +79,6 @@ class MicroDVD(aeidon.Markup):
         """Return italicized `text`."""
         return self._style(text, "Y", "y", "i", bounds)
 
-    def _main_decode(self, text):
-        """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"\{([Yy]:b)\}(.*?)\{/\1\}", 2)
-        text = self._decode_c(text, r"\{([Cc]:#(.*?))\}(.*?)\{/\1\}", 2, 3)
-        text = self._decode_f(text, r"\{([Ff]:(.*?))\}(.*?)\{/\1\}", 2, 3)
-        text = self._decode_i(text, r"\{([Yy]:i)\}(.*?)\{/\1\}", 2)
-        text = self._decode_s(text, r"\{([Ss]:(.*?))\}(.*?)\{/\1\}", 2, 3)
-        text = self._decode_u(text, r"\{([Yy]:u)\}(.*?)\{/\1\}", 2)
-        return text
-
     def _pre_decode(self, text):
         """Return `text` with markup prepared for decoding."""
         text = self._pre_decode_break(text)
@@ -90,17 +92,13 @@ class MicroDVD(aeidon.Markup):
 
         For example, ``{y:biu}`` is replaced with ``{y:b}{y:i}{y:u}``.
         """
-        pattern = r"\{([Yy]):([^}]{2,})\}"
-        regex = self._get_regex(pattern)
-        match = regex.search(text)
-        if match is None: return text
-        y = match.group(1)
-        replacement = ""
-        for m in ("b", "i", "u"):
-            if m in match.group(2):
-                replacement += "{{{}:{}}}".format(y, m)
-        text = regex.sub(replacement, text, 1)
-        return self._pre_decode_break(text)
+        def replace(match):
+            y = match.group(1)
+            return "".join("{{{}:{}}}".format(y, x)
+                           for x in ("b", "i", "u")
+                           if x in match.group(2))
+        regex = self._get_regex(r"\{([Yy]):([^}]{2,})\}")
+        return regex.sub(replace, text)
 
     def _pre_decode_close(self, text):
         """
@@ -129,13 +127,12 @@ class MicroDVD(aeidon.Markup):
 
         Color tags are converted from ``{c:$BBGGRR}`` to ``{c:#RRGGBB}``.
         """
+        def replace(match):
+            color = match.group(2)
+            color = "{}{}{}".format(color[4:], color[2:4], color[:2])
+            return "{{{}#{}}}".format(match.group(1), color)
         regex = self._get_regex(r"\{([Cc]:)\$([0-9A-Fa-f]{6})\}")
-        match = regex.search(text)
-        if match is None: return text
-        color = match.group(2)
-        color = "{}{}{}".format(color[4:], color[2:4], color[:2])
-        text = regex.sub(r"{{\1#{}}}".format(color), text, 1)
-        return self._pre_decode_color(text)
+        return regex.sub(replace, text)
 
     def scale(self, text, size, bounds=None):
         """Return `text` scaled to `size`."""
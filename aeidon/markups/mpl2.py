@@ -40,6 +40,12 @@ class MPL2(aeidon.markups.MicroDVD):
 
     format = aeidon.formats.MPL2
 
+    _tags = (
+        ("b", r"<\\>", r"</\\>"),
+        ("i", r"</>", r"<//>"),
+        ("u", r"<_>", r"</_>"),
+    ) + aeidon.markups.MicroDVD._tags
+
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
         return self._style_mpl2(text, "\\", bounds)
@@ -53,13 +59,6 @@ class MPL2(aeidon.markups.MicroDVD):
         """Return italicized `text`."""
         return self._style_mpl2(text, "/", bounds)
 
-    def _main_decode(self, text):
-        """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"<\\>(.*?)</\\>", 1)
-        text = self._decode_i(text, r"</>(.*?)<//>", 1)
-        text = self._decode_u(text, r"<_>(.*?)</_>", 1)
-        return aeidon.markups.MicroDVD._main_decode(self, text)
-
     def _pre_decode(self, text):
         """Return `text` with markup prepared for decoding."""
         text = self._pre_decode_identify(text)
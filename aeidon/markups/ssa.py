@@ -18,6 +18,7 @@
 """Text markup for the Sub Station Alpha format."""
 
 import aeidon
+import collections
 import re
 
 __all__ = ("SubStationAlpha",)
@@ -55,6 +56,14 @@ class SubStationAlpha(aeidon.Markup):
     _opening_pattern = r"\{\\(?![bi]0)(b|i|c|fn|fs).*?\}"
     _reset_pattern   = r"\{\\r\}"
 
+    _tags = (
+        ("b", r"\{\\b1\}", r"\{\\b[0\\]\}"),
+        ("c", r"\{\\c#(.+?)\}", r"\{\\c\\\}"),
+        ("f", r"\{\\fn(.+?)\}", r"\{\\fn\\\}"),
+        ("i", r"\{\\i1\}", r"\{\\i[0\\]\}"),
+        ("s", r"\{\\fs(\d+)\}", r"\{\\fs\\\}"),
+    )
+
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
         a, z = bounds or (0, len(text))
@@ -86,15 +95,6 @@ class SubStationAlpha(aeidon.Markup):
         target = "{{\\i1}}{}{{\\i0}}".format(text[a:z])
         return "".join((text[:a], target, text[z:]))
 
-    def _main_decode(self, text):
-        """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"\{\\b1\}(.*?)\{\\b[0\\]\}", 1)
-        text = self._decode_c(text, r"\{\\c#(.+?)\}(.*?)\{\\c\\\}", 1, 2)
-        text = self._decode_f(text, r"\{\\fn(.+?)\}(.*?)\{\\fn\\\}", 1, 2)
-        text = self._decode_i(text, r"\{\\i1\}(.*?)\{\\i[0\\]\}", 1)
-        text = self._decode_s(text, r"\{\\fs(\d+)\}(.*?)\{\\fs\\\}", 1, 2)
-        return text
-
     def _post_decode(self, text):
         """Return `text` with markup finalized after decoding."""
         # Remove all unsupported markup tags.
@@ -114,12 +114,17 @@ class SubStationAlpha(aeidon.Markup):
         For example, ``{\\b1\\i1}`` is replaced with ``{\\b1}{\\i1}``.
         """
         parts = text.split("\\")
+        # Track whether the last brace so far is an opening one
+        # instead of searching all of the text so far for each part.
+        inside = False
         for i in range(1, len(parts)):
-            text_so_far = "\\".join(parts[:i])
-            if text_so_far.endswith("{"): continue
-            opening_index = text_so_far.rfind("{")
-            closing_index = text_so_far.rfind("}")
-            if opening_index > closing_index:
+            part = parts[i - 1]
+            opening_index = part.rfind("{")
+            closing_index = part.rfind("}")
+            if opening_index != closing_index:
+                inside = opening_index > closing_index
+            if part.endswith("{"): continue
+            if inside:
                 parts[i - 1] += "}{"
         return "\\".join(parts)
 
@@ -129,14 +134,12 @@ class SubStationAlpha(aeidon.Markup):
 
         Color tags are converted from ``{\\c&HBBGGRR&}`` to ``{\\c#RRGGBB}``.
         """
-        pattern = r"\{\\c&H([0-9a-fA-F]*)&\}"
-        regex = self._get_regex(pattern)
-        match = regex.search(text)
-        if match is None: return text
-        color = ("{:0>6s}".format(match.group(1))).replace(" ", "0")
-        color = "{}{}{}".format(color[4:], color[2:4], color[:2])
-        text = regex.sub(r"{{\\c#{}}}".format(color), text, 1)
-        return self._pre_decode_color(text)
+        def replace(match):
+            color = ("{:0>6s}".format(match.group(1))).replace(" ", "0")
+            color = "{}{}{}".format(color[4:], color[2:4], color[:2])
+            return "{{\\c#{}}}".format(color)
+        regex = self._get_regex(r"\{\\c&H([0-9a-fA-F]*)&\}")
+        return regex.sub(replace, text)
 
     def _pre_decode_reset(self, text):
         """
@@ -150,16 +153,16 @@ class SubStationAlpha(aeidon.Markup):
         re_reset = self._get_regex(self._reset_pattern)
         parts = re_reset.split(text + "{\\r}")
         for i, part in enumerate(parts):
-            opening_matches = [x for x in re_opening.finditer(part)]
-            closing_matches = [x for x in re_closing.finditer(part)]
-            # Find out which tags have already been closed.
-            for j in reversed(range(len(closing_matches))):
-                closing_core = closing_matches[j].group(1)
-                for k in range(len(opening_matches)):
-                    opening_core = opening_matches[k].group(1)
-                    if opening_core == closing_core:
-                        opening_matches.pop(k)
-                        break
+            # Find out which tags have already been closed,
+            # each closing tag closes the first opening one.
+            closed = collections.Counter(
+                x.group(1) for x in re_closing.finditer(part))
+            opening_matches = []
+            for match in re_opening.finditer(part):
+                if closed[match.group(1)] > 0:
+                    closed[match.group(1)] -= 1
+                    continue
+                opening_matches.append(match)
             # Add artificial closing tags to close remaining tags.
             for j in reversed(range(len(opening_matches))):
                 parts[i] += "{{\\{}\\}}".format(opening_matches[j].group(1))
@@ -40,6 +40,13 @@ class SubRip(aeidon.Markup):
     _flags = re.DOTALL | re.MULTILINE | re.IGNORECASE
     format = aeidon.formats.SUBRIP
 
+    _tags = (
+        ("b", r"<b>", r"</b>"),
+        ("i", r"<i>", r"</i>"),
+        ("u", r"<u>", r"</u>"),
+        ("c", r'<font color="#([0-9a-fA-F]{6})">', r"</font>"),
+    )
+
     def bolden(self, text, bounds=None):
         """Return bolded `text`."""
         a, z = bounds or (0, len(text))
@@ -73,14 +80,6 @@ class SubRip(aeidon.Markup):
         a, z = bounds or (0, len(text))
         return "".join((text[:a], "<i>{}</i>".format(text[a:z]), text[z:]))
 
-    def _main_decode(self, text):
-        """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"<b>(.*?)</b>", 1)
-        text = self._decode_i(text, r"<i>(.*?)</i>", 1)
-        text = self._decode_u(text, r"<u>(.*?)</u>", 1)
-        pattern = r'<font color="#([0-9a-fA-F]{6})">(.*?)</font>'
-        return self._decode_c(text, pattern, 1, 2)
-
     @property
     def tag(self):
         """Regular expression for any markup tag."""
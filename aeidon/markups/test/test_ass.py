@@ -35,6 +35,11 @@ class TestAdvSubStationAlpha(TestSubStationAlpha):
             "All things weird are normal\n"
             "in <b>this</b> whore of cities.")
 
+    def test_decode__karaoke(self):
+        text = "".join("{{\\k20}}word{} ".format(i) for i in range(5000))
+        assert self.markup.decode(text) == (
+            "".join("word{} ".format(i) for i in range(5000)))
+
     def test_decode__underline(self):
         text = ("{\\u1}All things weird are normal\n"
                 "in this whore of cities{\\rDefault}.")
@@ -57,6 +57,11 @@ class TestSubStationAlpha(aeidon.TestCase):
             "<b><i>All things weird are normal\n"
             "in this</i></b> whore of cities.")
 
+    def test_decode__color__many(self):
+        text = "{\\c&Hff&}x{\\r}" * 5000
+        assert self.markup.decode(text) == (
+            "<color=#ff0000>x</color>" * 5000)
+
     def test_decode__font(self):
         text = ("All things {\\fnsans}weird{\\r} are normal\n"
                 "in this whore of cities.")
@@ -71,6 +71,13 @@ class TestSubRip(aeidon.TestCase):
             "<i>All</i> things weird are normal\n"
             "in this whore of cities.")
 
+    def test_decode__mixed_case(self):
+        text = ("<b>All</b> things weird are normal\n"
+                "in this <B>whore</B> of cities.")
+        assert self.markup.decode(text) == (
+            "<b>All</b> things weird are normal\n"
+            "in this <b>whore</b> of cities.")
+
     def test_decode__underline(self):
         text = ("All things weird are normal\n"
                 "in this <U>whore</U> of cities.")
@@ -100,6 +107,10 @@ class TestSubRip(aeidon.TestCase):
                 "in <i>this</i> whore of cities.")
         assert self.markup.encode(text) == text
 
+    def test_encode__many(self):
+        text = "<i>" * 2000 + "All" + "</i>" * 2000
+        assert self.markup.encode(text) == text
+
     def test_encode__size(self):
         text = ("All things weird are normal\n"
                 "in this whore of <size=12>cities</size>.")
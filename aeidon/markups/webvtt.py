@@ -36,16 +36,16 @@ class WebVTT(aeidon.markups.SubRip):
 
     format = aeidon.formats.WEBVTT
 
+    _tags = (
+        ("b", r"<b>", r"</b>"),
+        ("i", r"<i>", r"</i>"),
+        ("u", r"<u>", r"</u>"),
+    )
+
     def colorize(self, text, color, bounds=None):
         """Return `text` colorized to hexadecimal value."""
         raise NotImplementedError
 
-    def _main_decode(self, text):
-        """Return `text` with decodable markup decoded."""
-        text = self._decode_b(text, r"<b>(.*?)</b>", 1)
-        text = self._decode_i(text, r"<i>(.*?)</i>", 1)
-        return self._decode_u(text, r"<u>(.*?)</u>", 1)
-
     def _post_decode(self, text):
         """Return `text` with markup finalized after decoding."""
         # Remove all unsupported markup tags.
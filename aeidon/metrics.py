@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Metrics derived from subtitle text."""
+
+__all__ = ("TextMetrics",)
+
+
+class TextMetrics:
+
+    """
+    Metrics derived from subtitle text.
+
+    :ivar char_count: Amount of characters in :attr:`plain_text`
+    :ivar line_count: Amount of lines
+    :ivar line_lengths: Tuple of amounts of characters in :attr:`lines`
+    :ivar lines: Tuple of lines of :attr:`plain_text`
+    :ivar plain_text: Text with markup tags removed
+    :ivar text: Original text including markup tags
+
+    Instances are meant to be created once per text and kept, e.g. by
+    :meth:`aeidon.Project.get_text_metrics`, to avoid stripping tags and
+    splitting lines each time these values are needed.
+    """
+
+    __slots__ = ("char_count",
+                 "line_count",
+                 "line_lengths",
+                 "lines",
+                 "plain_text",
+                 "text")
+
+    def __init__(self, text, re_tag=None):
+        """Initialize a :class:`TextMetrics` instance."""
+        plain_text = (re_tag.sub("", text) if re_tag is not None else text)
+        self.char_count = len(plain_text)
+        self.lines = tuple(plain_text.split("\n"))
+        self.line_count = len(self.lines)
+        self.line_lengths = tuple(map(len, self.lines))
+        self.plain_text = plain_text
+        self.text = text
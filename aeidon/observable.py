@@ -18,9 +18,26 @@
 """Base class for observable objects."""
 
 import aeidon
+import sys
 
 __all__ = ("Observable",)
 
+# Interned notify signals keyed by attribute name
+# and the reverse mapping from signal to attribute name.
+_notify_signals = {}
+_notify_names = {}
+
+
+def _get_notify_signal(name):
+    """Return interned ``notify::NAME`` signal for attribute `name`."""
+    try:
+        return _notify_signals[name]
+    except KeyError:
+        signal = sys.intern("notify::{}".format(name))
+        _notify_signals[name] = signal
+        _notify_names[signal] = name
+        return signal
+
 
 class Observable:
 
@@ -38,7 +55,9 @@ class Observable:
     that care should be taken not to emit thousands of signals when
     e.g. appending one-by-one to a large list. :meth:`freeze_notify` and
     :meth:`thaw_notify` will queue notify signals and emit only one of each
-    once thawed.
+    once thawed. :meth:`freeze_all` and :meth:`thaw_all` will queue all
+    signals and emit them in order once thawed, e.g. to defer handlers of
+    signals emitted from a worker thread to the main thread.
 
     The Observable philosophy and API is highly inspired by GObject_.
 
@@ -48,6 +67,8 @@ class Observable:
     __slots__ = (
         "_blocked_signals",
         "_blocked_state",
+        "_frozen_queue",
+        "_frozen_state",
         "_notify_frozen",
         "_notify_queue",
         "_signal_handlers",
@@ -57,8 +78,10 @@ class Observable:
 
     def __init__(self):
         """Initialize an :class:`Observable` instance."""
-        self._blocked_signals = []
+        self._blocked_signals = set()
         self._blocked_state = False
+        self._frozen_queue = []
+        self._frozen_state = False
         self._notify_frozen = False
         self._notify_queue = []
         self._signal_handlers = {}
@@ -67,10 +90,10 @@ class Observable:
 
     def __setattr__(self, name, value):
         """Set value of observable attribute."""
-        if (name in self.__slots__) or name.startswith("_"):
+        if name.startswith("_") or (name in self.__slots__):
             return object.__setattr__(self, name, value)
         value = self._validate(name, value)
-        signal = "notify::{}".format(name)
+        signal = _get_notify_signal(name)
         if not signal in self._signal_handlers:
             self._add_signal(signal)
             return object.__setattr__(self, name, value)
@@ -80,7 +103,9 @@ class Observable:
 
     def _add_signal(self, signal):
         """Add `signal` to the list of signals emitted."""
-        self._signal_handlers[signal] = []
+        if signal.startswith("notify::"):
+            signal = _get_notify_signal(signal[8:])
+        self._signal_handlers[sys.intern(signal)] = []
 
     def block(self, signal):
         """
@@ -89,7 +114,7 @@ class Observable:
         Return ``False`` if already blocked, otherwise ``True``.
         """
         if not signal in self._blocked_signals:
-            self._blocked_signals.append(signal)
+            self._blocked_signals.add(signal)
             return True
         return False
 
@@ -116,18 +141,31 @@ class Observable:
 
     def emit(self, signal, *args):
         """Send notification of ``signal`` to all registered observers."""
-        if signal.startswith("notify::") and self._notify_frozen:
+        if self._frozen_state:
+            return self._frozen_queue.append((signal, args))
+        name = _notify_names.get(signal)
+        if name is not None and self._notify_frozen:
             if not signal in self._notify_queue:
                 self._notify_queue.append(signal)
             return
         if (not self._blocked_state and
             not signal in self._blocked_signals):
-            if signal.startswith("notify::"):
-                name = signal.replace("notify::", "")
+            if name is not None:
                 args = (getattr(self, name),)
             for method, data in self._signal_handlers[signal]:
                 method(*((self,) + args + data))
 
+    def freeze_all(self):
+        """
+        Queue all signals instead of emitting them.
+
+        Return ``False`` if already frozen, otherwise ``True``.
+        """
+        if not self._frozen_state:
+            self._frozen_state = True
+            return True
+        return False
+
     def freeze_notify(self):
         """
         Queue notify signals instead of emitting them.
@@ -141,7 +179,26 @@ class Observable:
 
     def notify(self, name):
         """Emit notification signal for variable."""
-        return self.emit("notify::{}".format(name))
+        return self.emit(_get_notify_signal(name))
+
+    def thaw_all(self, do=True):
+        """
+        Emit all queued signals in order and queue no more.
+
+        The optional `do` keyword argument should be the return value from
+        :meth:`freeze_all` to avoid problems with nested functions where
+        signals were frozen at a higher level. If `do` is ``False``,
+        nothing will be done.
+
+        Return ``False`` if already thawed, otherwise ``True``.
+        """
+        if do and self._frozen_state:
+            self._frozen_state = False
+            queue, self._frozen_queue = self._frozen_queue, []
+            for signal, args in queue:
+                self.emit(signal, *args)
+            return True
+        return False
 
     def thaw_notify(self, do=True):
         """
@@ -157,8 +214,7 @@ class Observable:
         if do and self._notify_frozen:
             self._notify_frozen = False
             for signal in self._notify_queue:
-                name = signal.replace("notify::", "")
-                self.emit(signal, getattr(self, name))
+                self.emit(signal)
             self._notify_queue = []
             return True
         return False
@@ -175,7 +231,7 @@ class Observable:
         Return ``False`` if already unblocked, otherwise ``True``.
         """
         if do and (signal in self._blocked_signals):
-            self._blocked_signals.remove(signal)
+            self._blocked_signals.discard(signal)
             return True
         return False
 
@@ -197,6 +253,8 @@ class Observable:
 
     def _validate(self, name, value):
         """Return `value` or an observable version if `value` is mutable."""
+        if not isinstance(value, (dict, list, set)):
+            return value
         args = (value, self, name)
         if isinstance(value, dict):
             return aeidon.ObservableDict(*args)
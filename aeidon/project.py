@@ -30,12 +30,17 @@ class ProjectMeta(type):
     Public methods are added to the class dictionary during :meth:`__new__`
     in order to fool Sphinx (and perhaps other API documentation generators)
     into thinking that the resulting instantiated class actually contains those
-    methods, which it does not since the methods are removed during
-    :meth:`Project.__init__`.
+    methods, which it does not since the methods are shadowed by bound methods
+    of agents in the instance dictionary during :meth:`Project.__init__`.
+
+    The table of exported methods per agent class is computed only once here
+    and saved as the ``_delegations`` class attribute, a tuple of tuples of
+    agent class and the names of methods it exports.
     """
 
     def __new__(meta, class_name, bases, dic):
         new_dict = dic.copy()
+        delegations = []
         for agent_class_name in aeidon.agents.__all__:
             agent_class = getattr(aeidon.agents, agent_class_name)
             def is_delegate_method(name):
@@ -44,9 +49,15 @@ class ProjectMeta(type):
                         hasattr(value, "export") and
                         value.export is True)
 
-            attr_names = list(filter(is_delegate_method, dir(agent_class)))
+            attr_names = tuple(filter(is_delegate_method, dir(agent_class)))
             for attr_name in attr_names:
+                if any(attr_name in x[1] for x in delegations):
+                    raise ValueError("Multiple definitions of {}"
+                                     .format(repr(attr_name)))
+
                 new_dict[attr_name] = getattr(agent_class, attr_name)
+            delegations.append((agent_class, attr_names))
+        new_dict["_delegations"] = tuple(delegations)
         return type.__new__(meta, class_name, bases, new_dict)
 
 
@@ -57,7 +68,7 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar calc: Instance of :class:`aeidon.Calculator` used
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
-    :ivar _delegations: Dictionary mapping method names to agent methods
+    :cvar _delegations: Tuple of agent classes and their exported methods
     :ivar framerate: :attr:`aeidon.framerates` item corresponding to video
     :ivar main_changed: Integer, status of main document
 
@@ -87,6 +98,7 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
      * ``main-file-saved``: project, main_file
      * ``main-texts-changed``: project, indices
      * ``positions-changed``: project, indices
+     * ``subtitle-moved``: project, index, new_index
      * ``subtitles-changed``: project, indices
      * ``subtitles-inserted``: project, indices
      * ``subtitles-removed``: project, indices
@@ -103,6 +115,7 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "main-file-saved",
         "main-texts-changed",
         "positions-changed",
+        "subtitle-moved",
         "subtitles-inserted",
         "subtitles-removed",
         "subtitles-changed",
@@ -117,7 +130,6 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(framerate)
         self.clipboard = aeidon.Clipboard()
-        self._delegations = {}
         self.framerate = framerate
         self.main_changed = 0
         self.main_file = None
@@ -130,31 +142,11 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         self.video_path = None
         self._init_delegations()
 
-    def __getattr__(self, name):
-        """Return method delegated to an agent."""
-        try:
-            return self._delegations[name]
-        except LookupError:
-            raise AttributeError
-
     def _init_delegations(self):
-        """Initialize the delegation mappings."""
-        for agent_class_name in aeidon.agents.__all__:
-            agent = getattr(aeidon.agents, agent_class_name)(self)
-            def is_delegate_method(name):
-                value = getattr(agent, name)
-                return (callable(value) and
-                        hasattr(value, "export") and
-                        value.export is True)
-
-            attr_names = list(filter(is_delegate_method, dir(agent)))
+        """Initialize agents and bind their exported methods."""
+        for agent_class, attr_names in self._delegations:
+            agent = agent_class(self)
             for attr_name in attr_names:
-                attr_value = getattr(agent, attr_name)
-                if attr_name in self._delegations:
-                    raise ValueError("Multiple definitions of {}"
-                                     .format(repr(attr_name)))
-
-                self._delegations[attr_name] = attr_value
-                # Remove class-level function added by ProjectMeta.
-                if hasattr(self.__class__, attr_name):
-                    delattr(self.__class__, attr_name)
+                # Bypass Observable.__setattr__ and shadow the class-level
+                # function added by ProjectMeta with a bound agent method.
+                self.__dict__[attr_name] = getattr(agent, attr_name)
@@ -32,13 +32,21 @@ def _init_scripts():
     # fall back on possibly bundled JSON.
     path = "/usr/share/iso-codes/json/iso_15924.json"
     if os.path.isfile(path):
-        return _init_scripts_json(path)
+        return _init_scripts_cached(path, _init_scripts_json)
     path = "/usr/share/xml/iso-codes/iso_15924.xml"
     if os.path.isfile(path):
-        return _init_scripts_xml(path)
+        return _init_scripts_cached(path, _init_scripts_xml)
     path = os.path.join(aeidon.DATA_DIR, "iso-codes", "iso_15924.json")
     if os.path.isfile(path):
-        return _init_scripts_json(path)
+        return _init_scripts_cached(path, _init_scripts_json)
+
+def _init_scripts_cached(path, parse):
+    """Initialize the dictionary from cache or by parsing `path`."""
+    table = aeidon.util.read_cached_table("iso_15924", path)
+    if table is not None:
+        return _scripts.update(table)
+    parse(path)
+    aeidon.util.write_cached_table("iso_15924", path, _scripts)
 
 def _init_scripts_json(path):
     """Initialize the dictionary mapping codes to names."""
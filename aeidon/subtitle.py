@@ -54,14 +54,31 @@ class Subtitle:
     e.g. ``ssa`` for Sub Station Alpha formats, accessed as ``subtitle.ssa.*``.
     These containers are lazily created upon first use in order to avoid slow
     instantiation and excessive memory use when handling simpler formats.
+    Copies share containers with the original until either accesses them.
     """
 
+    __slots__ = ("_end",
+                 "_framerate",
+                 "_main_text",
+                 "_mode",
+                 "_shared",
+                 "_ssa",
+                 "_start",
+                 "_subrip",
+                 "_tran_text",
+                 "_webvtt",
+                 "calc")
+
     def __init__(self, mode=None, framerate=None):
         """Initialize a :class:`Subtitle` instance."""
         self._start = None
         self._end = None
         self._main_text = ""
         self._tran_text = ""
+        self._shared = ()
+        self._ssa = None
+        self._subrip = None
+        self._webvtt = None
         self._mode = mode or aeidon.modes.TIME
         self._framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(self._framerate)
@@ -79,16 +96,6 @@ class Subtitle:
                 self.framerate == other.framerate and
                 self.mode == other.mode)
 
-    def __getattr__(self, name):
-        """Return lazily instantiated format-specific attribute container."""
-        if name in (x.container for x in aeidon.formats):
-            # Lazily instantiate a new container.
-            container = aeidon.containers.new(name)
-            object.__setattr__(self, name, container)
-            return container
-        raise AttributeError("Invalid container name: {}"
-                             .format(repr(name)))
-
     def __ge__(self, other):
         """Compare start positions."""
         if self._mode == aeidon.modes.TIME:
@@ -158,16 +165,28 @@ class Subtitle:
 
     def copy(self):
         """Return a new subtitle instance with the same values."""
-        subtitle = Subtitle(self._mode, self._framerate)
+        # Bypass initialization, which would look up a calculator
+        # and parse default positions only to be overwritten.
+        subtitle = Subtitle.__new__(Subtitle)
         subtitle._start = self._start
         subtitle._end = self._end
         subtitle._main_text = self._main_text
         subtitle._tran_text = self._tran_text
-        # Copy all containers that have been instantiated.
-        containers = (x.container for x in aeidon.formats)
-        for name in set(dir(self)) & set(containers):
-            container = copy.deepcopy(getattr(self, name))
-            setattr(subtitle, name, container)
+        subtitle._mode = self._mode
+        subtitle._framerate = self._framerate
+        subtitle.calc = self.calc
+        subtitle._ssa = self._ssa
+        subtitle._subrip = self._subrip
+        subtitle._webvtt = self._webvtt
+        subtitle._shared = ()
+        if self._ssa or self._subrip or self._webvtt:
+            # Share instantiated containers until either
+            # subtitle accesses them, see _get_container.
+            containers = (("ssa", self._ssa),
+                          ("subrip", self._subrip),
+                          ("webvtt", self._webvtt))
+            shared = tuple(x for x, y in containers if y is not None)
+            self._shared = subtitle._shared = shared
         return subtitle
 
     @property
@@ -277,6 +296,21 @@ class Subtitle:
         self._framerate = value
         self.calc = aeidon.Calculator(value)
 
+    def _get_container(self, name):
+        """Return container `name`, instantiating or unsharing it if needed."""
+        attr = "_{}".format(name)
+        container = getattr(self, attr)
+        if container is None:
+            container = aeidon.containers.new(name)
+            setattr(self, attr, container)
+        elif name in self._shared:
+            # Containers hold only immutable values,
+            # making a shallow copy equal to a deep copy.
+            container = copy.copy(container)
+            setattr(self, attr, container)
+            self._unshare(name)
+        return container
+
     def get_duration(self, mode):
         """Return duration in `mode`."""
         if mode == aeidon.modes.TIME:
@@ -315,7 +349,7 @@ class Subtitle:
 
     def has_container(self, name):
         """Return ``True`` if container has been instantiated."""
-        return name in dir(self)
+        return getattr(self, "_{}".format(name), None) is not None
 
     @property
     def main_text(self):
@@ -364,6 +398,17 @@ class Subtitle:
         self._start = self.calc.add(self._start, value)
         self._end = self.calc.add(self._end, value)
 
+    @property
+    def ssa(self):
+        """Return Sub Station Alpha attribute container."""
+        return self._get_container("ssa")
+
+    @ssa.setter
+    def ssa(self, value):
+        """Set Sub Station Alpha attribute container."""
+        self._ssa = value
+        self._unshare("ssa")
+
     @property
     def start(self):
         """Return start position in correct mode."""
@@ -414,6 +459,17 @@ class Subtitle:
         """Set start position from `value`."""
         self.start = aeidon.as_time(value)
 
+    @property
+    def subrip(self):
+        """Return SubRip attribute container."""
+        return self._get_container("subrip")
+
+    @subrip.setter
+    def subrip(self, value):
+        """Set SubRip attribute container."""
+        self._subrip = value
+        self._unshare("subrip")
+
     @property
     def tran_text(self):
         """Return translation text."""
@@ -423,3 +479,19 @@ class Subtitle:
     def tran_text(self, value):
         """Set translation text from `value`."""
         self._tran_text = value
+
+    def _unshare(self, name):
+        """Stop sharing container `name` with copies."""
+        if name in self._shared:
+            self._shared = tuple(x for x in self._shared if x != name)
+
+    @property
+    def webvtt(self):
+        """Return WebVTT attribute container."""
+        return self._get_container("webvtt")
+
+    @webvtt.setter
+    def webvtt(self, value):
+        """Set WebVTT attribute container."""
+        self._webvtt = value
+        self._unshare("webvtt")
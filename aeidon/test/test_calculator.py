@@ -119,12 +119,21 @@ class TestCalculator(aeidon.TestCase):
     def test_seconds_to_time(self):
         assert self.calc.seconds_to_time(68951.15388) == "19:09:11.154"
 
+    def test_seconds_to_time__negative(self):
+        assert self.calc.seconds_to_time(-1.9996) == "-00:00:02.000"
+
+    def test_seconds_to_time__overflow(self):
+        assert self.calc.seconds_to_time(360000) == "99:59:59.999"
+
     def test_time_to_frame(self):
         assert self.calc.time_to_frame("01:22:36.144") == 118829
 
     def test_time_to_seconds(self):
         assert self.calc.time_to_seconds("03:45:22.117") == 13522.117
 
+    def test_time_to_seconds__negative(self):
+        assert self.calc.time_to_seconds("-00:01:02.500") == -62.5
+
     def test_to_frame(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_frame("00:00:01.000") == 25
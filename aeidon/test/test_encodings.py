@@ -90,6 +90,46 @@ class TestModule(aeidon.TestCase):
         encoding = aeidon.encodings.detect_bom(path)
         assert encoding == "utf_8_sig"
 
+    def test_detect_bom_data(self):
+        data = codecs.BOM_UTF8 + "test".encode("utf_8")
+        assert aeidon.encodings.detect_bom_data(data) == "utf_8_sig"
+        assert aeidon.encodings.detect_bom_data(b"test") is None
+
+    def test_detect_data__bom(self):
+        data = codecs.BOM_UTF8 + "test".encode("utf_8")
+        encoding = aeidon.encodings.detect_data(data)
+        assert encoding == "utf_8_sig"
+
+    def test_detect_data__utf_8(self):
+        data = "\u00e4\u00f6".encode("utf_8")
+        encoding = aeidon.encodings.detect_data(data)
+        assert encoding == "utf_8"
+
+    def test_detect_data__non_utf_8_at_end(self):
+        data = b"x" * 100000 + "Caf\u00e9".encode("iso8859_1")
+        encoding = aeidon.encodings.detect_data(data)
+        assert encoding != "utf_8"
+
+    def test_get_decodable(self):
+        data = "\u00e4\u00f6".encode("iso8859_1")
+        codes = ("utf_8", "ascii", "iso8859_1", "iso8859_15")
+        decodable = list(aeidon.encodings.get_decodable(data, codes))
+        assert decodable == ["iso8859_1", "iso8859_15"]
+
+    def test_get_decodable__bom(self):
+        data = codecs.BOM_UTF8 + "test".encode("utf_8")
+        codes = ("ascii", "iso8859_1")
+        decodable = list(aeidon.encodings.get_decodable(data, codes))
+        assert decodable == ["utf_8_sig", "iso8859_1"]
+
+    def test_get_decodable__lazy(self):
+        data = "\u00e4\u00f6".encode("iso8859_1")
+        codes = ("iso8859_1", "auto")
+        decodable = aeidon.encodings.get_decodable(data, codes)
+        # Detection of "auto" should not be needed for the first code.
+        with patch("aeidon.encodings.detect_data", None):
+            assert next(decodable) == "iso8859_1"
+
     def test_get_locale_code(self):
         code = aeidon.encodings.get_locale_code()
         assert aeidon.encodings.is_valid_code(code)
@@ -117,8 +157,16 @@ class TestModule(aeidon.TestCase):
         assert name_to_code("GB2312") == "gb2312"
         assert name_to_code("PTCP154") == "ptcp154"
 
+    def test_name_to_code__value_error(self):
+        name_to_code = aeidon.encodings.name_to_code
+        self.assert_raises(ValueError, name_to_code, "xxxxx")
+
     def test_translate_code(self):
         translate_code = aeidon.encodings.translate_code
         assert translate_code("johab") == "johab"
         assert translate_code("UTF-8") == "utf_8"
         assert translate_code("ISO-8859-1") == "latin_1"
+
+    def test_translate_code__value_error(self):
+        translate_code = aeidon.encodings.translate_code
+        self.assert_raises(ValueError, translate_code, "xxxxx")
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+def run_python(code):
+    output = subprocess.check_output((sys.executable, "-c", code),
+                                     cwd=ROOT,
+                                     universal_newlines=True)
+
+    return output.strip()
+
+
+class TestModule(aeidon.TestCase):
+
+    def test___dir__(self):
+        names = dir(aeidon)
+        assert "files" in names
+        assert "Project" in names
+
+    def test___getattr____module(self):
+        assert aeidon.files.new is not None
+        assert aeidon.markups.new is not None
+
+    def test___getattr____name(self):
+        assert aeidon.Project.__name__ == "Project"
+        assert aeidon.PatternManager.__name__ == "PatternManager"
+
+    def test___getattr____value_error(self):
+        self.assert_raises(AttributeError, getattr, aeidon, "xxx")
+
+    def test_import(self):
+        if sys.version_info < (3, 7): return
+        names = run_python("import aeidon, sys; print(' '.join(sys.modules))")
+        names = names.split()
+        for name in aeidon._LAZY_MODULES:
+            assert not "aeidon.{}".format(name) in names
+        for name in set(aeidon._LAZY_NAMES.values()):
+            assert not "aeidon.{}".format(name) in names
+
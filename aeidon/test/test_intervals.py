@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import random
+
+
+class TestIntervalIndex(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.index = aeidon.IntervalIndex(((0, 2),
+                                           (1, 3),
+                                           (4, 10),
+                                           (5, 6),
+                                           (8, 9)))
+
+    def test___getitem__(self):
+        assert self.index[2] == (4, 10)
+
+    def test___len__(self):
+        assert len(self.index) == 5
+
+    def test_get_active(self):
+        assert self.index.get_active(-1) == []
+        assert self.index.get_active(1.5) == [0, 1]
+        assert self.index.get_active(3.5) == []
+        assert self.index.get_active(5.5) == [2, 3]
+        assert self.index.get_active(7) == [2]
+        assert self.index.get_active(11) == []
+
+    def test_get_active__bounds(self):
+        assert self.index.get_active(2) == [0, 1]
+        assert self.index.get_active(4) == [2]
+        assert self.index.get_active(10) == [2]
+
+    def test_get_active__random(self):
+        starts = sorted(random.uniform(0, 100) for i in range(100))
+        intervals = [(x, x + random.uniform(0, 10)) for x in starts]
+        index = aeidon.IntervalIndex(intervals)
+        for pos in (random.uniform(-1, 111) for i in range(100)):
+            assert index.get_active(pos) == [
+                i for i, x in enumerate(intervals) if x[0] <= pos <= x[1]]
+
+    def test_get_active__unsorted(self):
+        # Shifting a selection leaves subtitles out of order.
+        project = aeidon.Project()
+        subtitles = []
+        for i in range(6):
+            subtitle = project.new_subtitle()
+            subtitle.start_seconds = i * 3.0
+            subtitle.end_seconds = i * 3.0 + 2.0
+            subtitles.append(subtitle)
+        project.subtitles = subtitles
+        project.shift_positions((1,), aeidon.as_seconds(10))
+        index = aeidon.IntervalIndex((x.start_seconds, x.end_seconds)
+                                     for x in project.subtitles)
+        assert index.get_active(7) == [2]
+        assert index.get_active(10) == [3]
+        assert index.get_active(14.5) == [1]
+        assert index.get_last_active(14) == 4
+        assert index.get_next(11) == 4
+        assert index.get_previous(12) == 3
+        assert index.get_overlapping(7, 10) == [2, 3]
+        assert index.get_overlaps() == [(1, 4)]
+
+    def test_get_active__unsorted__random(self):
+        starts = [random.uniform(0, 100) for i in range(100)]
+        intervals = [(x, x + random.uniform(0, 10)) for x in starts]
+        index = aeidon.IntervalIndex(intervals)
+        for pos in (random.uniform(-1, 111) for i in range(100)):
+            assert index.get_active(pos) == [
+                i for i, x in enumerate(intervals) if x[0] <= pos <= x[1]]
+
+    def test_get_active__unsorted_by_set(self):
+        self.index.set(1, 20, 21)
+        assert self.index.get_active(20.5) == [1]
+        self.index.set(1, 1, 3)
+        assert self.index.get_active(1.5) == [0, 1]
+
+    def test_get_last_active(self):
+        assert self.index.get_last_active(1.5) == 1
+        assert self.index.get_last_active(7) == 2
+        assert self.index.get_last_active(8.5) == 4
+        assert self.index.get_last_active(3.5) is None
+
+    def test_get_next(self):
+        assert self.index.get_next(-1) == 0
+        assert self.index.get_next(0) == 1
+        assert self.index.get_next(4.5) == 3
+        assert self.index.get_next(8) is None
+
+    def test_get_active__changed(self):
+        self.index.insert(0, -5, 20)
+        assert self.index.get_active(3.5) == [0]
+        self.index.remove(0)
+        assert self.index.get_active(3.5) == []
+        self.index.set(1, 1, 4)
+        assert self.index.get_active(3.5) == [1]
+
+    def test_get_overlapping(self):
+        assert self.index.get_overlapping(-2, -1) == []
+        assert self.index.get_overlapping(2.5, 4.5) == [1, 2]
+        assert self.index.get_overlapping(6.5, 7.5) == [2]
+        assert self.index.get_overlapping(0, 11) == [0, 1, 2, 3, 4]
+
+    def test_get_overlapping__random(self):
+        starts = sorted(random.uniform(0, 100) for i in range(100))
+        intervals = [(x, x + random.uniform(0, 10)) for x in starts]
+        index = aeidon.IntervalIndex(intervals)
+        for start in (random.uniform(-1, 111) for i in range(100)):
+            end = start + random.uniform(0, 5)
+            assert index.get_overlapping(start, end) == [
+                i for i, x in enumerate(intervals)
+                if x[0] <= end and x[1] >= start]
+
+    def test_get_overlaps(self):
+        assert self.index.get_overlaps() == [(0, 1), (2, 3), (2, 4)]
+
+    def test_get_overlaps__reversed(self):
+        self.index.set(3, 5, 4.5)
+        assert self.index.get_overlaps() == [(0, 1), (2, 4)]
+
+    def test_get_previous(self):
+        assert self.index.get_previous(0) is None
+        assert self.index.get_previous(2.5) == 0
+        assert self.index.get_previous(7) == 3
+        assert self.index.get_previous(9.5) == 4
+
+    def test_get_reversed(self):
+        assert self.index.get_reversed() == []
+        self.index.set(3, 5, 4.5)
+        assert self.index.get_reversed() == [3]
+
+    def test_insert(self):
+        self.index.insert(2, 3, 5)
+        assert self.index[2] == (3, 5)
+        assert self.index[3] == (4, 10)
+        assert self.index.get_active(4.5) == [2, 3]
+
+    def test_insert_many(self):
+        self.index.insert_many((0, 3, 7), ((-2, -1), (3, 5), (11, 12)))
+        assert len(self.index) == 8
+        assert self.index[0] == (-2, -1)
+        assert self.index[1] == (0, 2)
+        assert self.index[3] == (3, 5)
+        assert self.index[4] == (4, 10)
+        assert self.index[7] == (11, 12)
+        assert self.index.get_active(4.5) == [3, 4]
+        assert self.index.get_active(11.5) == [7]
+
+    def test_insert_many__unsorted(self):
+        self.index.insert_many((1,), ((20, 21),))
+        assert self.index.get_active(20.5) == [1]
+
+    def test_remove(self):
+        self.index.remove(2)
+        assert len(self.index) == 4
+        assert self.index.get_active(7) == []
+
+    def test_remove_many(self):
+        self.index.remove_many((0, 2, 4))
+        assert len(self.index) == 2
+        assert self.index[0] == (1, 3)
+        assert self.index[1] == (5, 6)
+        assert self.index.get_active(7) == []
+        assert self.index.get_active(5.5) == [1]
+
+    def test_set(self):
+        self.index.set(2, 4, 5)
+        assert self.index[2] == (4, 5)
+        assert self.index.get_active(7) == []
+
@@ -56,3 +56,14 @@ class TestMarkup(aeidon.TestCase):
     def test_encode__u(self):
         text = "All things weird are normal\nin this whore of <u>cities</u>."
         assert self.markup.encode(text) == self.text
+
+    def test__parse_tags(self):
+        tags = self.markup._internal_tag_patterns
+        parts = self.markup._parse_tags("<b>a<b>b</b></i><size=9>", tags)
+        assert parts == [("b", None, 0), "a", "<b>", "b", ("b", None, 1),
+                         "</i>", "<size=9>"]
+
+    def test__parse_tags__value(self):
+        tags = self.markup._internal_tag_patterns
+        parts = self.markup._parse_tags("<font=sans>a</font>", tags)
+        assert parts == [("f", "sans", 0), "a", ("f", "sans", 1)]
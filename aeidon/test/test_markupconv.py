@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestMarkupConverter(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.converter = aeidon.MarkupConverter(aeidon.formats.SSA,
+                                                aeidon.formats.SUBRIP)
+
+    def test_convert(self):
+        text = "{\\i1}test{\\i0}"
+        assert self.converter.convert(text) == "<i>test</i>"
+        assert self.converter.convert(text) == "<i>test</i>"
+
+    def test_convert__nested(self):
+        text = "{\\fnSans}{\\i1}{\\c&Hff&}test"
+        assert self.converter.convert(text) == (
+            '<i><font color="#ff0000">test</font></i>')
+
+    def test_convert__karaoke(self):
+        text = "".join("{\\k20}{\\b1}x{\\b0}" for i in range(5000))
+        assert self.converter.convert(text) == "<b>x</b>" * 5000
+
+    def test_convert__plain(self):
+        assert self.converter.convert("test") == "test"
+
+    def test_convert_many(self):
+        texts = ["♪", "{\\i1}test{\\i0}", "♪", "test"]
+        assert self.converter.convert_many(texts) == [
+            "♪", "<i>test</i>", "♪", "test"]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestTextMetrics(aeidon.TestCase):
+
+    def setup_method(self, method):
+        text = "<i>test</i>\nof metrics"
+        self.metrics = aeidon.TextMetrics(text, aeidon.RE_ANY_TAG)
+
+    def test___init__(self):
+        assert self.metrics.plain_text == "test\nof metrics"
+        assert self.metrics.char_count == 15
+        assert self.metrics.line_count == 2
+        assert self.metrics.line_lengths == (4, 10)
+        assert self.metrics.lines == ("test", "of metrics")
+
+    def test___init____no_re_tag(self):
+        metrics = aeidon.TextMetrics("<i>test</i>")
+        assert metrics.plain_text == "<i>test</i>"
+        assert metrics.char_count == 11
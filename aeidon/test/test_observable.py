@@ -78,6 +78,14 @@ class TestObservable(aeidon.TestCase):
         self.obs.emit("do")
         assert self.do_count == 1
 
+    def test_freeze_all(self):
+        assert self.obs.freeze_all()
+        assert not self.obs.freeze_all()
+        self.obs.emit("do")
+        self.obs.x = 1
+        assert self.do_count == 0
+        assert self.notify_count == 0
+
     def test_freeze_notify(self):
         assert self.obs.freeze_notify()
         assert not self.obs.freeze_notify()
@@ -88,6 +96,16 @@ class TestObservable(aeidon.TestCase):
         self.obs.notify("x")
         assert self.notify_count == 1
 
+    def test_thaw_all(self):
+        self.obs.freeze_all()
+        self.obs.emit("do")
+        self.obs.x = 1
+        self.obs.x = 2
+        assert self.obs.thaw_all()
+        assert not self.obs.thaw_all()
+        assert self.do_count == 1
+        assert self.notify_count == 2
+
     def test_thaw_notify(self):
         self.obs.freeze_notify()
         self.obs.x = 1
@@ -116,3 +134,4 @@ class TestObservable(aeidon.TestCase):
         assert not self.obs.unblock_all()
         self.obs.notify("x")
         assert self.notify_count == 1
+
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = aeidon.Project()
+
+    def test___init____bound(self):
+        method = self.project.get_mode
+        assert isinstance(method.__self__, aeidon.agents.UtilityAgent)
+        assert method.__self__.master is self.project
+
+    def test___init____class(self):
+        aeidon.Project()
+        assert callable(aeidon.Project.get_mode)
+
+    def test___init____instances(self):
+        project = aeidon.Project()
+        assert project.get_mode.__self__ is not self.project.get_mode.__self__
+
+    def test__delegations(self):
+        names = [y for x in aeidon.Project._delegations for y in x[1]]
+        assert len(names) == len(set(names))
+        assert "open_main" in names
+        assert "undo" in names
+
@@ -60,6 +60,27 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.start == "00:00:01.043"
         assert self.tsub.end == "00:00:02.085"
 
+    def test_copy(self):
+        subtitle = self.tsub.copy()
+        assert subtitle == self.tsub
+        assert subtitle is not self.tsub
+        subtitle.start = "00:00:02.000"
+        assert self.tsub.start == "00:00:01.000"
+
+    def test_copy__container(self):
+        self.tsub.ssa.style = "Title"
+        subtitle = self.tsub.copy()
+        assert subtitle.ssa.style == "Title"
+        subtitle.ssa.style = "Default"
+        assert self.tsub.ssa.style == "Title"
+        assert not subtitle.has_container("webvtt")
+
+    def test_copy__container_original(self):
+        self.tsub.webvtt.id = "1"
+        subtitle = self.tsub.copy()
+        self.tsub.webvtt.id = "2"
+        assert subtitle.webvtt.id == "1"
+
     def test_duration__get(self):
         assert self.tsub.duration == "00:00:02.000"
         assert self.fsub.duration == 200
@@ -178,6 +199,11 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.get_text(MAIN) == "main"
         assert self.tsub.get_text(TRAN) == "translation"
 
+    def test_has_container(self):
+        assert not self.tsub.has_container("ssa")
+        self.tsub.ssa.layer = 1
+        assert self.tsub.has_container("ssa")
+
     def test_main_text__get(self):
         assert self.tsub.main_text == "main"
         assert self.fsub.main_text == "main"
@@ -16,6 +16,9 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import os
+
+from unittest.mock import patch
 
 
 class TestModule(aeidon.TestCase):
@@ -104,6 +107,22 @@ class TestModule(aeidon.TestCase):
         open(path, "w", encoding="utf_8").write("\xc3\xb6\n")
         assert aeidon.util.read(path, "ascii") == "\xc3\xb6"
 
+    def test_read_cached_table(self):
+        source = self.new_subrip_file()
+        with patch("aeidon.CACHE_HOME_DIR", aeidon.temp.create_directory()):
+            assert aeidon.util.read_cached_table("test", source) is None
+            aeidon.util.write_cached_table("test", source, {"a": "b"})
+            table = aeidon.util.read_cached_table("test", source)
+            assert table == {"a": "b"}
+
+    def test_read_cached_table__outdated(self):
+        source = self.new_subrip_file()
+        with patch("aeidon.CACHE_HOME_DIR", aeidon.temp.create_directory()):
+            aeidon.util.write_cached_table("test", source, {"a": "b"})
+            mtime = os.path.getmtime(source)
+            os.utime(source, (mtime + 10, mtime + 10))
+            assert aeidon.util.read_cached_table("test", source) is None
+
     def test_readlines__basic(self):
         path = self.new_subrip_file()
         lines = [x.rstrip() for x in open(path, "r").readlines()]
@@ -128,6 +147,13 @@ class TestModule(aeidon.TestCase):
         f = open(path, "r", encoding="utf_8")
         assert f.read() == text
 
+    def test_write_cached_table(self):
+        source = self.new_subrip_file()
+        directory = aeidon.temp.create_directory()
+        with patch("aeidon.CACHE_HOME_DIR", directory):
+            aeidon.util.write_cached_table("test", source, {"a": "b"})
+        assert os.path.isfile(os.path.join(directory, "test.json"))
+
     def test_writelines__basic(self):
         lines = ("test", "test")
         path = self.new_subrip_file()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Report of subtitle timing problems."""
+
+__all__ = ("TimingReport",)
+
+
+class TimingReport:
+
+    """
+    Report of subtitle timing problems.
+
+    :ivar gaps: List of indices of subtitles followed by too short a gap
+    :ivar negative_durations: List of indices of subtitles ending before
+        they start
+    :ivar overlaps: List of tuples of indices of overlapping subtitles
+    :ivar speeding: List of indices of subtitles too fast to read
+
+    Instances are returned by :meth:`aeidon.Project.analyze_timing`.
+    """
+
+    __slots__ = ("gaps", "negative_durations", "overlaps", "speeding")
+
+    def __init__(self, gaps=None, negative_durations=None, overlaps=None,
+                 speeding=None):
+        """Initialize a :class:`TimingReport` instance."""
+        self.gaps = gaps or []
+        self.negative_durations = negative_durations or []
+        self.overlaps = overlaps or []
+        self.speeding = speeding or []
+
+    def __bool__(self):
+        """Return ``True`` if any problems were found."""
+        return bool(self.gaps or
+                    self.negative_durations or
+                    self.overlaps or
+                    self.speeding)
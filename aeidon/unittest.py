@@ -77,6 +77,19 @@ class TestCase:
         """Compatibility alias for :meth:`setup_method`."""
         self.setup_method(None)
 
+    @classmethod
+    def setUpClass(cls):
+        """Compatibility alias for :meth:`setup_class`."""
+        cls.setup_class()
+
+    @classmethod
+    def setup_class(cls):
+        """Set state for executing tests in class."""
+        # Keep caches written by tests, e.g. parsed ISO code tables,
+        # out of the user's real cache directory.
+        cls._cache_home_dir = aeidon.CACHE_HOME_DIR
+        aeidon.CACHE_HOME_DIR = aeidon.temp.create_directory()
+
     def setup_method(self, method):
         """Set state for executing tests in `method`."""
         pass
@@ -85,6 +98,16 @@ class TestCase:
         """Compatibility alias for :meth:`teardown_method`."""
         self.teardown_method(None)
 
+    @classmethod
+    def tearDownClass(cls):
+        """Compatibility alias for :meth:`teardown_class`."""
+        cls.teardown_class()
+
+    @classmethod
+    def teardown_class(cls):
+        """Remove state set for executing tests in class."""
+        aeidon.CACHE_HOME_DIR = cls._cache_home_dir
+
     def teardown_method(self, method):
         """Remove state set for executing tests in `method`."""
         pass
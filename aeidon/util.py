@@ -21,6 +21,8 @@ import aeidon
 import collections
 import contextlib
 import inspect
+import io
+import json
 import locale
 import mimetypes
 import os
@@ -149,17 +151,18 @@ def connect(observer, observable, signal, *args):
         observable = getattr(observer, observable)
     return observable.connect(signal, method, *args)
 
-def detect_format(path, encoding):
+def detect_format(path, encoding, data=None):
     """
     Detect and return format of subtitle file at `path`.
 
+    `data` can be bytes already read from `path` to avoid reading it again.
     Raise :exc:`IOError` if reading fails.
     Raise :exc:`UnicodeError` if decoding fails.
     Raise :exc:`aeidon.FormatError` if unable to detect format.
     Return an :attr:`aeidon.formats` enumeration item.
     """
     re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
-    with open(path, "r", encoding=encoding) as f:
+    with open_text(path, encoding, data) as f:
         for line in f:
             for format, re_id in re_ids:
                 if re_id.search(line) is not None:
@@ -167,10 +170,14 @@ def detect_format(path, encoding):
     raise aeidon.FormatError("Failed to detect format of file {}"
                              .format(repr(path)))
 
-def detect_newlines(path):
-    """Detect and return the newline type of file at `path` or ``None``."""
+def detect_newlines(path, data=None):
+    """
+    Detect and return the newline type of file at `path` or ``None``.
+
+    `data` can be bytes already read from `path` to avoid reading it again.
+    """
     try:
-        with open(path, "r", newline="") as f:
+        with open_text(path, None, data, newline="") as f:
             f.read()
             chars = f.newlines
     except Exception:
@@ -348,6 +355,20 @@ def normalize_newlines(text):
     re_newline_char = re.compile(r"\r\n?")
     return re_newline_char.sub("\n", text)
 
+def open_text(path, encoding, data=None, newline=None):
+    """
+    Return a text file object for reading file at `path`.
+
+    `data` can be bytes already read from `path` to decode those instead of
+    reading the file again. `encoding` and `newline` are as for :func:`open`.
+    Raise :exc:`IOError` if opening fails.
+    """
+    if data is None:
+        return open(path, "r", encoding=encoding, newline=newline)
+    return io.TextIOWrapper(io.BytesIO(data),
+                            encoding=encoding,
+                            newline=newline)
+
 def path_to_uri(path):
     """Convert local filepath to URI."""
     if sys.platform == "win32":
@@ -403,6 +424,23 @@ def read(path, encoding=None, fallback="utf_8", quiet=False):
             print_read_unicode(sys.exc_info(), path, encoding)
         raise # UnicodeError
 
+def read_cached_table(name, source):
+    """
+    Return dictionary `name` parsed from file `source` from cache.
+
+    Return ``None`` if no cache is found or if the cache is out of date
+    compared to `source`, see :func:`write_cached_table`.
+    """
+    path = os.path.join(aeidon.CACHE_HOME_DIR, "{}.json".format(name))
+    with silent(Exception):
+        with open(path, "r", encoding="utf_8") as f:
+            cache = json.load(f)
+        if (cache["source"] == source and
+            cache["mtime"] == os.path.getmtime(source) and
+            cache["version"] == aeidon.__version__):
+            return cache["table"]
+    return None
+
 def readlines(path, encoding=None, fallback="utf_8", quiet=False):
     """
     Read file at `path` and return lines.
@@ -505,6 +543,24 @@ def write(path, text, encoding=None, fallback="utf_8", quiet=False):
             print_write_unicode(sys.exc_info(), path, encoding)
         raise # UnicodeError
 
+def write_cached_table(name, source, table):
+    """
+    Write dictionary `name` parsed from file `source` to cache.
+
+    The cache is a compact file that can be read much faster than `source`
+    can be parsed. Failure to write the cache is ignored.
+    """
+    path = os.path.join(aeidon.CACHE_HOME_DIR, "{}.json".format(name))
+    with silent(Exception):
+        os.makedirs(aeidon.CACHE_HOME_DIR, exist_ok=True)
+        cache = dict(source=source,
+                     mtime=os.path.getmtime(source),
+                     version=aeidon.__version__,
+                     table=table)
+
+        with atomic_open(path, "w", encoding="utf_8") as f:
+            json.dump(cache, f, ensure_ascii=False, separators=(",", ":"))
+
 def writelines(path, lines, encoding=None, fallback="utf_8", quiet=False):
     """
     Write `lines` of text to file at `path`.
@@ -20,6 +20,7 @@
 __version__ = "1.2"
 COMBO_SEPARATOR = "<separator/>"
 
+import importlib
 import sys
 import warnings
 
@@ -52,6 +53,57 @@ with aeidon.util.silent(Exception):
     from gi.repository import Gst
     Gst.init(None)
 
+# Dialogs are needed only once the user asks for them, defer importing
+# their modules until first use to speed up startup.
+_LAZY_NAMES = {
+    "AboutDialog": "about",
+    "AppendDialog": "append",
+    "DebugDialog": "debug",
+    "DurationAdjustDialog": "duration_adjust",
+    "EncodingDialog": "encoding",
+    "ErrorDialog": "message",
+    "FileDialog": "file",
+    "FrameShiftDialog": "position_shift",
+    "FrameTransformDialog": "position_transform",
+    "FramerateConvertDialog": "framerate_convert",
+    "InfoDialog": "message",
+    "InsertDialog": "insert",
+    "LanguageDialog": "language",
+    "MenuEncodingDialog": "encoding",
+    "MultiCloseDialog": "multi_close",
+    "MultiSaveDialog": "multi_save",
+    "OpenDialog": "open",
+    "PreferencesDialog": "preferences",
+    "PreviewErrorDialog": "preview_error",
+    "QuestionDialog": "message",
+    "SaveDialog": "save",
+    "SearchDialog": "search",
+    "SpellCheckDialog": "spell_check",
+    "SplitDialog": "split",
+    "TextEditDialog": "text_edit",
+    "TimeShiftDialog": "position_shift",
+    "TimeTransformDialog": "position_transform",
+    "VideoDialog": "video",
+    "WarningDialog": "message",
+}
+
+def __getattr__(name):
+    """Return lazily imported dialog class `name`."""
+    if name in _LAZY_NAMES:
+        module = importlib.import_module(
+            "gaupol.dialogs.{}".format(_LAZY_NAMES[name]))
+        # Mimic star imports by installing all public names.
+        for public in module.__all__:
+            globals()[public] = getattr(module, public)
+        return globals()[name]
+    raise AttributeError("module {} has no attribute {}"
+                         .format(repr(__name__), repr(name)))
+
+def __dir__():
+    """Return names in namespace, including lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
 from gaupol.urls import *
 from gaupol import util
 from gaupol.enums import *
@@ -64,33 +116,11 @@ from gaupol import ruler
 from gaupol.entries import *
 from gaupol.renderers import *
 from gaupol.floatlabel import *
+from gaupol.model import *
 from gaupol.view import *
 from gaupol.page import *
 from gaupol.player import *
 from gaupol.dialogs.builder import *
-from gaupol.dialogs.file import *
-from gaupol.dialogs.open import *
-from gaupol.dialogs.save import *
-from gaupol.dialogs.video import *
-from gaupol.dialogs.append import *
-from gaupol.dialogs.about import *
-from gaupol.dialogs.debug import *
-from gaupol.dialogs.duration_adjust import *
-from gaupol.dialogs.encoding import *
-from gaupol.dialogs.framerate_convert import *
-from gaupol.dialogs.insert import *
-from gaupol.dialogs.language import *
-from gaupol.dialogs.message import *
-from gaupol.dialogs.multi_close import *
-from gaupol.dialogs.multi_save import *
-from gaupol.dialogs.preferences import *
-from gaupol.dialogs.preview_error import *
-from gaupol.dialogs.search import *
-from gaupol.dialogs.position_shift import *
-from gaupol.dialogs.spell_check import *
-from gaupol.dialogs.split import *
-from gaupol.dialogs.text_edit import *
-from gaupol.dialogs.position_transform import *
 from gaupol.assistants import *
 from gaupol.action import *
 from gaupol import actions
@@ -101,6 +131,13 @@ from gaupol.application import *
 from gaupol.applicationman import *
 from gaupol.unittest import *
 
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) is not supported,
+    # fall back on importing everything immediately,
+    # base classes first as those are needed by subclasses.
+    for _name in ("FileDialog", "OpenDialog") + tuple(sorted(_LAZY_NAMES)):
+        __getattr__(_name)
+
 def main(args):
     """Initialize application."""
     global appman
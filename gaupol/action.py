@@ -40,6 +40,15 @@ class Action(Gio.SimpleAction):
         GObject.GObject.__init__(self, name=name)
         self.accelerators = []
         self.action_group = "unsafe"
+        self.application = None
+
+    def activate(self, parameter=None):
+        """Activate action, running a queued update of "enabled" first."""
+        if self.application is not None:
+            # Updates from selection and cursor changes are run when idle,
+            # make sure the action is not activated based on stale state.
+            self.application.flush_gui_update()
+        return Gio.SimpleAction.activate(self, parameter)
 
     def _affirm_doable(self, application, page, selected_rows):
         """Raise :exc:`gaupol.AffirmationError` if action cannot be done."""
@@ -74,7 +83,7 @@ class RadioAction(Action):
 
     def activate(self, parameter):
         """Activate action with `parameter`."""
-        return Gio.SimpleAction.activate(self, GLib.Variant("s", parameter))
+        return Action.activate(self, GLib.Variant("s", parameter))
 
     @staticmethod
     def new(name, parameter_type=GLib.VariantType.new("s")):
@@ -126,6 +126,9 @@ class CloseAgent(aeidon.Delegate):
     @aeidon.deco.export
     def _on_window_delete_event(self, *args):
         """Quit Gaupol."""
+        # Closing the window is the same as the quit action,
+        # ignore it while the action is disabled, e.g. when opening.
+        if not self.get_action("quit").get_enabled(): return True
         try:
             self.quit()
         except gaupol.Default:
@@ -347,6 +347,9 @@ class EditAgent(aeidon.Delegate):
     @aeidon.deco.export
     def _on_view_renderer_editing_started(self, renderer, editor, path, column):
         """Set proper state for editing cell."""
+        # Run a queued update first so that it won't enable
+        # the unsafe actions again while editing.
+        self.flush_gui_update()
         self._set_unsafe_enabled(False)
         page = self.get_current_page()
         col = page.view.get_columns().index(column)
@@ -214,6 +214,8 @@ class MenuAgent(aeidon.Delegate):
         if not row in view.get_selected_rows():
             view.set_cursor(path, column)
             view.update_headers()
+            # Update sensitivities for the pop-up menu right away.
+            self.flush_gui_update()
         if self._view_popup is None:
             path = os.path.join(aeidon.DATA_DIR, "ui", "view-popup.ui")
             builder = Gtk.Builder.new_from_file(path)
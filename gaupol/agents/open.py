@@ -20,8 +20,11 @@
 import aeidon
 import gaupol
 import os
+import threading
 
 from aeidon.i18n   import _
+from gi.repository import Gdk
+from gi.repository import GLib
 from gi.repository import Gtk
 
 
@@ -71,17 +74,20 @@ class OpenAgent(aeidon.Delegate):
         """Append subtitles from file at `path` to the current project."""
         encodings = self._get_encodings(encoding)
         doc = aeidon.documents.MAIN
-        temp = self._open_file(path, encodings, doc, check_open=False)
+        path, temp = next(self._read_main_files((path,),
+                                                encodings,
+                                                check_open=False))
+
         gaupol.util.set_cursor_busy(self.window)
         current = self.get_current_page()
         offset = current.project.subtitles[-1].end
-        temp.project.shift_positions(None, offset)
-        rows = self._append_subtitles(current, temp.project.subtitles)
+        temp.shift_positions(None, offset)
+        rows = self._append_subtitles(current, temp.subtitles)
         amount = len(rows)
         current.view.set_focus(rows[0], None)
         current.view.select_rows(rows)
         current.view.scroll_to_row(rows[0])
-        basename = temp.get_main_basename()
+        basename = os.path.basename(path)
         message = _('Appended {amount:d} subtitles from "{basename}"')
         self.flash_message(message.format(**locals()))
         gaupol.util.set_cursor_normal(self.window)
@@ -115,7 +121,7 @@ class OpenAgent(aeidon.Delegate):
     def _check_file_size(self, path):
         """Raise :exc:`gaupol.Default` if size of file at `path` too large."""
         size_mb = os.stat(path).st_size / 1048576
-        if size_mb <= 1: return
+        if size_mb <= 100: return
         basename = os.path.basename(path)
         self._show_size_warning_dialog(basename, size_mb)
 
@@ -143,6 +149,14 @@ class OpenAgent(aeidon.Delegate):
             callback = self._on_view_header_button_press_event
             button.connect("button-press-event", callback)
 
+    def _disable_actions(self):
+        """Disable all enabled actions and return their names."""
+        names = [x for x in self.window.list_actions()
+                 if self.get_action(x).get_enabled()]
+        for name in names:
+            self.get_action(name).set_enabled(False)
+        return names
+
     def _get_encodings(self, first=None):
         """Return a sequence of encodings to try when opening files."""
         encodings = [first]
@@ -243,21 +257,21 @@ class OpenAgent(aeidon.Delegate):
 
     def _open_file(self, path, encodings, doc, check_open=True):
         """Open file at `path` and return corresponding page if successful."""
+        if doc == aeidon.documents.MAIN:
+            path, project = next(self._read_main_files((path,),
+                                                       encodings,
+                                                       check_open))
+
+            return gaupol.Page(project=project)
         self._check_file_exists(path)
         if check_open:
             self._check_file_not_open(path)
         self._check_file_size(path)
-        basename = os.path.basename(path)
-        page = (gaupol.Page() if doc == aeidon.documents.MAIN
-                else self.get_current_page())
-        for encoding in encodings:
-            with aeidon.util.silent(UnicodeError):
-                n = self._try_open_file(page, doc, path, encoding)
-                self._check_sort_count(path, n)
-                return page
-        # Report if all codecs failed to decode file.
-        self._show_encoding_error_dialog(basename)
-        raise gaupol.Default
+        page = self.get_current_page()
+        align_method = gaupol.conf.file.align_method
+        result = self._read_file(page.project, doc, path,
+                                 encodings, align_method)
+        return self._process_read_result(page, path, *result)
 
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
@@ -267,17 +281,18 @@ class OpenAgent(aeidon.Delegate):
             gaupol.conf.editor.visible_fields.remove(gaupol.fields.TRAN_TEXT)
         encodings = self._get_encodings(encoding)
         gaupol.util.set_cursor_busy(self.window)
-        for path in aeidon.util.flatten([path]):
-            try:
-                page = self._open_file(path, encodings, aeidon.documents.MAIN)
-            except gaupol.Default:
-                gaupol.util.set_cursor_normal(self.window)
-                raise # gaupol.Default
-            self.add_page(page)
-            format = page.project.main_file.format
-            self.add_to_recent_files(path, format, aeidon.documents.MAIN)
-            # Refresh view to get row heights etc. correct.
-            page.view.set_focus(0, page.view.columns.MAIN_TEXT)
+        paths = aeidon.util.flatten([path])
+        try:
+            for path, project in self._read_main_files(paths, encodings):
+                page = gaupol.Page(project=project)
+                self.add_page(page)
+                format = page.project.main_file.format
+                self.add_to_recent_files(path, format, aeidon.documents.MAIN)
+                # Refresh view to get row heights etc. correct.
+                page.view.set_focus(0, page.view.columns.MAIN_TEXT)
+        except gaupol.Default:
+            gaupol.util.set_cursor_normal(self.window)
+            raise # gaupol.Default
         gaupol.util.set_cursor_normal(self.window)
         self.update_gui()
 
@@ -297,6 +312,162 @@ class OpenAgent(aeidon.Delegate):
         self.add_to_recent_files(path, format, aeidon.documents.TRAN)
         gaupol.util.set_cursor_normal(self.window)
 
+    def _process_read_result(self, target, path, encoding, sort_count, error):
+        """Return `target` if reading file succeeded, else report error."""
+        basename = os.path.basename(path)
+        if error is None:
+            self._check_sort_count(path, sort_count)
+            return target
+        if isinstance(error, UnicodeError):
+            # Report if all codecs failed to decode file.
+            self._show_encoding_error_dialog(basename)
+        if isinstance(error, aeidon.FormatError):
+            self._show_format_error_dialog(basename)
+        if isinstance(error, IOError):
+            self._show_io_error_dialog(basename, str(error))
+        if isinstance(error, aeidon.ParseError):
+            bom_encoding = aeidon.encodings.detect_bom(path)
+            encoding = bom_encoding or encoding
+            with aeidon.util.silent(Exception):
+                format = aeidon.util.detect_format(path, encoding)
+            self._show_parse_error_dialog(basename, format)
+        raise gaupol.Default
+
+    def _read_file(self, project, doc, path, encodings, align_method,
+                   cancel=None):
+
+        """
+        Read file at `path` for `doc` trying each of `encodings` in turn.
+
+        Return a tuple of encoding, sort count and the exception raised or
+        ``None`` if successful. This method does not touch the user
+        interface, so it can be run in a worker thread on a `project` not
+        yet connected to anything. Stop trying further encodings if
+        `cancel` is set.
+        """
+        try:
+            # Read the file once and pass the same data to the parser
+            # to avoid rereading it for each encoding tried.
+            with open(path, "rb") as f:
+                data = f.read()
+        except IOError as error:
+            return (None, None, error)
+        for encoding in aeidon.encodings.get_decodable(data, encodings):
+            if cancel is not None and cancel.is_set(): break
+            try:
+                return (encoding,
+                        project.open(doc,
+                                     path,
+                                     encoding,
+                                     align_method=align_method,
+                                     data=data),
+                        None)
+            except UnicodeError:
+                continue
+            except (IOError,
+                    aeidon.FormatError,
+                    aeidon.ParseError) as error:
+                return (encoding, None, error)
+        return (None, None, UnicodeError())
+
+    def _read_main_files(self, paths, encodings, check_open=True):
+        """
+        Read files at `paths` into new projects and yield paths and projects.
+
+        Files are read and parsed in parallel in worker threads, during which
+        the main loop is kept running and progress shown in the status label.
+        Projects are yielded and errors reported in the order of `paths`.
+        Raise :exc:`gaupol.Default` at the first file that fails to open.
+        """
+        checked = []
+        check_error = None
+        for path in paths:
+            try:
+                self._check_file_exists(path)
+                if check_open:
+                    self._check_file_not_open(path)
+                self._check_file_size(path)
+            except gaupol.Default as error:
+                # Open files before the failed one.
+                check_error = error
+                break
+            checked.append(path)
+        framerate = gaupol.conf.editor.framerate
+        projects = [aeidon.Project(framerate) for x in checked]
+        align_method = gaupol.conf.file.align_method
+        args = [(projects[i], aeidon.documents.MAIN, path,
+                 encodings, align_method) for i, path in enumerate(checked)]
+        message = (_('Opening "{}"…').format(os.path.basename(checked[0]))
+                   if len(checked) == 1 else _("Opening files…"))
+        results = self._run_in_threads(message, self._read_file, args)
+        for path, project, result in zip(checked, projects, results):
+            self._process_read_result(project, path, *result)
+            yield path, project
+        if check_error is not None:
+            raise check_error
+
+    def _run_in_threads(self, message, function, args):
+        """
+        Call `function` with each of `args` in a pool of worker threads.
+
+        Return a list of return values in the same order as `args`. Each call
+        gets a :class:`threading.Event` instance as keyword argument `cancel`,
+        which is set if the user cancels by pressing Escape. The main loop is
+        kept running and `message` and progress shown in the status label
+        while waiting, with all actions disabled and pages insensitive to
+        avoid e.g. opening the same files again or quitting mid-open. Raise
+        :exc:`gaupol.Default` if cancelled.
+        """
+        if not args: return []
+        cancel = threading.Event()
+        loop = GLib.MainLoop()
+        done = []
+        message = _("{} Press Escape to cancel.").format(message)
+        def on_done(future):
+            # Called from a worker thread, hand over to the main loop.
+            gaupol.util.idle_add(on_done_main)
+        def on_done_main():
+            # Ignore calls still queued after cancelling.
+            if not loop.is_running(): return
+            done.append(True)
+            if len(done) == len(args):
+                return loop.quit()
+            self.statuslabel.set_text("{} ({:d}/{:d})".format(
+                message, len(done), len(args)))
+        def on_key_press_event(window, event):
+            if event.keyval != Gdk.KEY_Escape: return False
+            cancel.set()
+            loop.quit()
+            return True
+        handler_id = self.window.connect("key-press-event",
+                                         on_key_press_event)
+
+        self.statuslabel.set_text(message)
+        # Run a queued update first so that it won't enable
+        # the actions again while the nested main loop runs.
+        self.flush_gui_update()
+        disabled = self._disable_actions()
+        self.notebook.set_sensitive(False)
+        executor = gaupol.util.new_thread_pool(len(args))
+        futures = [executor.submit(function, *x, cancel=cancel) for x in args]
+        for future in futures:
+            future.add_done_callback(on_done)
+        try:
+            loop.run()
+        finally:
+            for future in futures:
+                # Drop calls not yet started if cancelled,
+                # leave running ones to finish in the background.
+                future.cancel()
+            executor.shutdown(wait=False)
+            self.window.disconnect(handler_id)
+            self.notebook.set_sensitive(True)
+            for name in disabled:
+                self.get_action(name).set_enabled(True)
+            self.statuslabel.set_text("")
+        gaupol.util.raise_default(cancel.is_set())
+        return [x.result() for x in futures]
+
     def _select_files(self, title, doc):
         """Show a :class:`gaupol.OpenDialog` to select files."""
         gaupol.util.set_cursor_busy(self.window)
@@ -385,24 +556,3 @@ class OpenAgent(aeidon.Delegate):
         if response == Gtk.ResponseType.YES:
             return self.save_translation(page)
         gaupol.util.raise_default(response != Gtk.ResponseType.NO)
-
-    def _try_open_file(self, page, doc, path, encoding, **kwargs):
-        """Try to open file at `path` and return subtitle sort count."""
-        if encoding == "auto":
-            encoding = aeidon.encodings.detect(path)
-            if encoding is None: raise UnicodeError
-        kwargs["align_method"] = gaupol.conf.file.align_method
-        basename = os.path.basename(path)
-        try:
-            return page.project.open(doc, path, encoding, **kwargs)
-        except aeidon.FormatError:
-            self._show_format_error_dialog(basename)
-        except IOError as error:
-            self._show_io_error_dialog(basename, str(error))
-        except aeidon.ParseError:
-            bom_encoding = aeidon.encodings.detect_bom(path)
-            encoding = bom_encoding or encoding
-            with aeidon.util.silent(Exception):
-                format = aeidon.util.detect_format(path, encoding)
-            self._show_parse_error_dialog(basename, format)
-        raise gaupol.Default
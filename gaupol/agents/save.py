@@ -32,12 +32,22 @@ class SaveAgent(aeidon.Delegate):
     @aeidon.deco.export
     def _on_save_all_documents_activate(self, *args):
         """Save all open documents."""
+        # Save documents that need a file to be selected one by one first,
+        # then write the rest to their existing files in parallel.
+        docs = []
         for page in self.pages:
-            with aeidon.util.silent(gaupol.Default):
-                self.save_main(page)
-            if page.project.tran_changed is not None:
-                with aeidon.util.silent(gaupol.Default):
-                    self.save_translation(page)
+            for doc in aeidon.documents:
+                if (doc == aeidon.documents.TRAN and
+                    page.project.tran_changed is None): continue
+                file = page.project.get_file(doc)
+                if (file is None or
+                    file.path is None or
+                    file.encoding is None):
+                    with aeidon.util.silent(gaupol.Default):
+                        self.save(page, doc)
+                    continue
+                docs.append((page, doc))
+        self._save_documents(docs)
         self.update_gui()
 
     @aeidon.deco.export
@@ -99,18 +109,66 @@ class SaveAgent(aeidon.Delegate):
             file = file or page.project.get_file(doc)
             gaupol.util.set_cursor_busy(self.window)
             return page.project.save(doc, file)
-        except IOError as error:
+        except (IOError, UnicodeError) as error:
             gaupol.util.set_cursor_normal(self.window)
-            basename = os.path.basename(file.path)
-            self._show_io_error_dialog(basename, str(error))
-        except UnicodeError:
-            gaupol.util.set_cursor_normal(self.window)
-            basename = os.path.basename(file.path)
-            self._show_encoding_error_dialog(basename, file.encoding)
+            self._show_save_error_dialog(file, error)
         finally:
             gaupol.util.set_cursor_normal(self.window)
         raise gaupol.Default
 
+    def _save_documents(self, docs):
+        """
+        Save `docs` of pages to their existing files in parallel.
+
+        `docs` should be a sequence of tuples of page and document. Projects
+        are written in worker threads, documents of the same project one
+        after another, since saving can temporarily change subtitle texts.
+        Signals of projects are queued while writing and emitted afterwards
+        in the main thread, followed by errors reported in order of `docs`.
+        """
+        if not docs: return
+        projects = aeidon.util.get_unique([x[0].project for x in docs])
+        project_docs = dict((x, []) for x in projects)
+        for page, doc in docs:
+            project_docs[page.project].append(doc)
+        gaupol.util.set_cursor_busy(self.window)
+        frozen = [x.freeze_all() for x in projects]
+        try:
+            with gaupol.util.new_thread_pool(len(projects)) as executor:
+                futures = [executor.submit(self._save_project_documents,
+                                           x, project_docs[x])
+                           for x in projects]
+        finally:
+            for project, do in zip(projects, frozen):
+                project.thaw_all(do)
+            gaupol.util.set_cursor_normal(self.window)
+        errors = {}
+        for project, future in zip(projects, futures):
+            errors.update(future.result())
+        for page, doc in docs:
+            error = errors.get((page.project, doc))
+            if error is None:
+                page.update_tab_label()
+                self.emit("page-saved", self, page)
+                continue
+            file = page.project.get_file(doc)
+            self._show_save_error_dialog(file, error)
+
+    def _save_project_documents(self, project, docs):
+        """
+        Save `docs` of `project` to their existing files in order.
+
+        Return a dictionary mapping project and document to errors
+        of documents that failed to be written or encoded.
+        """
+        errors = {}
+        for doc in docs:
+            try:
+                project.save(doc)
+            except (IOError, UnicodeError) as error:
+                errors[project, doc] = error
+        return errors
+
     @aeidon.deco.export
     def save_main(self, page):
         """Save the main document of `page` to file."""
@@ -205,3 +263,10 @@ class SaveAgent(aeidon.Delegate):
         dialog.add_button(_("_OK"), Gtk.ResponseType.OK)
         dialog.set_default_response(Gtk.ResponseType.OK)
         gaupol.util.flash_dialog(dialog)
+
+    def _show_save_error_dialog(self, file, error):
+        """Show an error dialog after failing to save `file`."""
+        basename = os.path.basename(file.path)
+        if isinstance(error, UnicodeError):
+            return self._show_encoding_error_dialog(basename, file.encoding)
+        self._show_io_error_dialog(basename, str(error))
@@ -17,6 +17,7 @@
 
 import aeidon
 import gaupol
+import threading
 
 from gi.repository import Gtk
 from unittest.mock import patch
@@ -81,6 +82,40 @@ class TestOpenAgent(gaupol.TestCase):
         self.application.open_main(path)
         assert len(self.application.pages) == n+1
 
+    def test_open_main__multiple(self):
+        n = len(self.application.pages)
+        paths = [self.new_subrip_file(), self.new_microdvd_file()]
+        self.application.open_main(paths)
+        assert len(self.application.pages) == n+2
+
+    def test__read_file(self):
+        project = aeidon.Project()
+        path = self.new_subrip_file()
+        encoding, sort_count, error = self.delegate._read_file(
+            project, aeidon.documents.MAIN, path, ("utf_8",), None)
+        assert encoding == "utf_8"
+        assert error is None
+        assert project.subtitles
+
+    def test__read_file__cancel(self):
+        cancel = threading.Event()
+        cancel.set()
+        project = aeidon.Project()
+        path = self.new_subrip_file()
+        encoding, sort_count, error = self.delegate._read_file(
+            project, aeidon.documents.MAIN, path, ("utf_8",), None, cancel)
+        assert isinstance(error, UnicodeError)
+        assert not project.subtitles
+
+    def test__run_in_threads(self):
+        action = self.application.get_action("quit")
+        def function(x, cancel):
+            return (x, action.get_enabled())
+        results = self.delegate._run_in_threads("", function, [(1,), (2,)])
+        assert results == [(1, False), (2, False)]
+        assert action.get_enabled()
+        assert self.application.notebook.get_sensitive()
+
     def test_open_translation(self):
         path = self.new_subrip_file()
         self.application.open_translation(path)
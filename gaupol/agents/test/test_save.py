@@ -33,6 +33,24 @@ class TestSaveAgent(gaupol.TestCase):
     def test__on_save_all_documents_activate(self):
         self.application.get_action("save-all-documents").activate()
 
+    def test__on_save_all_documents_activate__changed(self):
+        self.application.open_main(self.new_subrip_file())
+        for page in self.application.pages:
+            page.project.set_main_text(0, "test")
+        self.application.get_action("save-all-documents").activate()
+        for page in self.application.pages:
+            assert page.project.main_changed == 0
+
+    def test__on_save_all_documents_activate__signals(self):
+        saved = []
+        for page in self.application.pages:
+            page.project.set_main_text(0, "test")
+            page.project.connect("main-file-saved",
+                                 lambda *args: saved.append(args[0]))
+        self.application.get_action("save-all-documents").activate()
+        projects = [x.project for x in self.application.pages]
+        assert sorted(map(id, saved)) == sorted(map(id, projects))
+
     def test__on_save_main_document_activate(self):
         self.application.get_action("save-main-document").activate()
 
@@ -28,6 +28,16 @@ class TestUpdateAgent(gaupol.TestCase):
         self.application.flash_message("")
         self.application.flash_message(None)
 
+    def test_flush_gui_update(self):
+        page = self.application.get_current_page()
+        page.view.set_focus(0, page.view.columns.MAIN_TEXT)
+        page.view.select_rows((0, 1))
+        self.application.flush_gui_update()
+        assert self.application.get_action("clear-texts").get_enabled()
+        page.view.select_rows(())
+        self.application.flush_gui_update()
+        assert not self.application.get_action("clear-texts").get_enabled()
+
     def test__on_activate_next_project_activate(self):
         self.application.notebook.set_current_page(0)
         self.application.get_action("activate-next-project").activate()
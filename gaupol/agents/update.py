@@ -21,12 +21,24 @@ import aeidon
 import gaupol
 
 from gi.repository import Gdk
+from gi.repository import GLib
 
 
 class UpdateAgent(aeidon.Delegate):
 
     """Updating the application GUI."""
 
+    def __init__(self, master):
+        """Initialize an :class:`UpdateAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        # Selection and cursor changes can come in storms, e.g. when holding
+        # down an arrow key. Merge the resulting update requests into one
+        # idle call and skip it if nothing relevant changed since the last
+        # update, since updating all actions is relatively slow.
+        self._update_gui_id = None
+        self._update_gui_rows_changed = False
+        self._update_gui_state = None
+
     def _disable_widgets(self):
         """Make widgets insensitive and blank."""
         self.window.set_title("Gaupol")
@@ -43,6 +55,18 @@ class UpdateAgent(aeidon.Delegate):
             self.statuslabel.register_hide_event(
                 self.get_current_page().view, "button-press-event")
 
+    @aeidon.deco.export
+    def flush_gui_update(self):
+        """Run queued update of widget sensitivities now, if one exists."""
+        if self._update_gui_id is None: return
+        GLib.source_remove(self._update_gui_id)
+        self._update_gui_if_changed()
+
+    def _get_gui_state(self, page):
+        """Return page, selected rows and focus that GUI updates depend on."""
+        if page is None: return (None, (), (None, None))
+        return (page, page.view.get_selected_rows(), page.view.get_focus())
+
     @aeidon.deco.export
     def _on_activate_next_project_activate(self, *args):
         """Activate the project in the next tab."""
@@ -89,7 +113,9 @@ class UpdateAgent(aeidon.Delegate):
     def _on_notebook_switch_page(self, notebook, pointer, index):
         """Update GUI for the page switched to."""
         if not self.pages: return
-        self.update_gui()
+        # Merge updates when adding several pages at once,
+        # e.g. when opening multiple files.
+        self._queue_gui_update()
         page = self.pages[index]
         page.view.grab_focus()
         self.emit("page-switched", page)
@@ -97,12 +123,22 @@ class UpdateAgent(aeidon.Delegate):
     @aeidon.deco.export
     def _on_view_move_cursor(self, *args):
         """Update GUI after moving cursor in the view."""
-        self.update_gui()
+        self._queue_gui_update()
 
     @aeidon.deco.export
     def _on_view_selection_changed(self, *args):
         """Update GUI after changing selection in the view."""
-        self.update_gui()
+        self._update_gui_rows_changed = True
+        self._queue_gui_update()
+
+    @aeidon.deco.export
+    def _on_window_key_press_event(self, *args):
+        """Run queued update before accelerators are handled."""
+        # Key presses can activate actions via accelerators, which
+        # don't go through Action.activate, so run an update queued
+        # e.g. by moving the cursor with the previous key press now.
+        self.flush_gui_update()
+        return False
 
     @aeidon.deco.export
     def _on_window_window_state_event(self, window, event):
@@ -111,28 +147,56 @@ class UpdateAgent(aeidon.Delegate):
         maximized = bool(state & Gdk.WindowState.MAXIMIZED)
         gaupol.conf.application_window.maximized = maximized
 
+    def _queue_gui_update(self):
+        """Update GUI when idle, merging multiple requests into one."""
+        if self._update_gui_id is not None: return
+        self._update_gui_id = gaupol.util.idle_add(
+            self._update_gui_if_changed)
+
     @aeidon.deco.export
     def show_message(self, message):
         """Show `message` in the statuslabel or hide label with `None`."""
         self.statuslabel.set_text(message)
 
-    def _update_actions(self, page):
+    def _update_actions(self, page, rows):
         """Update sensitivities of all actions for page."""
-        rows = []
-        with aeidon.util.silent(AttributeError):
-            rows = page.view.get_selected_rows()
+        # Share the same tuple of selected rows between all actions
+        # instead of each action querying the view separately.
         for name in self.window.list_actions():
-            action = self.get_action(name)
+            action = self.window.lookup_action(name)
             action.update_enabled(self, page, rows)
 
     @aeidon.deco.export
     def update_gui(self):
         """Update widget sensitivities and states for the current page."""
         page = self.get_current_page()
-        self._update_actions(page)
+        self._update_gui(self._get_gui_state(page))
+
+    def _update_gui(self, state):
+        """Update widget sensitivities and states for GUI `state`."""
+        page, rows, focus = state
+        self._update_gui_state = state
+        self._update_actions(page, rows)
         self._update_widgets(page)
         self.extension_manager.update_extensions(page)
 
+    def _update_gui_if_changed(self):
+        """Update GUI if selection or focus changed since last update."""
+        self._update_gui_id = None
+        rows_changed = self._update_gui_rows_changed
+        self._update_gui_rows_changed = False
+        page = self.get_current_page()
+        if not rows_changed and self._update_gui_state is not None:
+            # Selected rows can only have changed along with the page
+            # or the selection, skip reading them for cursor movement
+            # if neither the page nor the focus changed.
+            last_page, last_rows, last_focus = self._update_gui_state
+            focus = (None, None) if page is None else page.view.get_focus()
+            if page is last_page and focus == last_focus: return
+        state = self._get_gui_state(page)
+        if state == self._update_gui_state: return
+        self._update_gui(state)
+
     def _update_widgets(self, page):
         """Update states of all widgets for `page`."""
         if page is None:
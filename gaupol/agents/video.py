@@ -39,20 +39,34 @@ class VideoAgent(aeidon.Delegate):
         aeidon.Delegate.__init__(self, master)
         # Maintain an up-to-date cache of subtitle positions in seconds and
         # subtitle texts in order to allow fast polled updates in video player.
-        # This cache must be updated when page or subtitle data changes.
-        self._cache = []
+        # Caches are kept for each page and patched on project signals.
+        self._cache = (aeidon.IntervalIndex(), [])
+        self._cache_handlers = (
+            ("main-file-opened",   self._on_project_reset_cache),
+            ("main-texts-changed", self._on_project_patch_cache_texts),
+            ("notify::framerate",  self._on_project_reset_cache),
+            ("positions-changed",  self._on_project_patch_cache_positions),
+            ("subtitle-moved",     self._on_project_patch_cache_moved),
+            ("subtitles-changed",  self._on_project_patch_cache_subtitles),
+            ("subtitles-inserted", self._on_project_patch_cache_inserted),
+            ("subtitles-removed",  self._on_project_patch_cache_removed),
+        )
+        self._caches = {}
         self._update_handlers = []
 
-    def _clear_subtitle_cache(self):
-        """Clear subtitle position and text cache."""
-        self._cache = []
+    def _add_subtitle_cache(self, application, page):
+        """Add subtitle position and text cache for `page`."""
+        for signal, method in self._cache_handlers:
+            page.project.connect(signal, method, page)
+        self._on_project_reset_cache(page.project, page)
 
     def _init_cache_updates(self):
         """Initialize cache updates on application signals."""
-        self.connect("page-added",    self._update_subtitle_cache)
-        self.connect("page-changed",  self._update_subtitle_cache)
-        self.connect("page-closed",   self._update_subtitle_cache)
-        self.connect("page-switched", self._update_subtitle_cache)
+        self.connect("page-added",    self._add_subtitle_cache)
+        self.connect("page-closed",   self._remove_subtitle_cache)
+        self.connect("page-switched", self._switch_subtitle_cache)
+        for page in self.pages:
+            self._add_subtitle_cache(self, page)
 
     def _init_player_toolbar(self):
         """Initialize the video player toolbar."""
@@ -161,7 +175,6 @@ class VideoAgent(aeidon.Delegate):
             self._init_player_widgets()
             self._init_cache_updates()
             self._init_update_handlers()
-            self._update_subtitle_cache()
         else: # Player exists
             if self.player.is_playing():
                 self.get_action("play-pause").activate()
@@ -236,9 +249,9 @@ class VideoAgent(aeidon.Delegate):
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None:
             return True # to be called again.
-        subtitles = list(filter(lambda x: x[0] <= pos <= x[1], self._cache))
-        if subtitles:
-            text = subtitles[-1][2]
+        index = self._cache[0].get_last_active(pos)
+        if index is not None:
+            text = self._cache[1][index]
             if text != self.player.subtitle_text_raw:
                 self.player.subtitle_text = text
         else:
@@ -251,6 +264,68 @@ class VideoAgent(aeidon.Delegate):
         self.volume_button.set_value(self.player.volume)
         return True # to be called again.
 
+    def _on_project_patch_cache_inserted(self, project, rows, page):
+        """Insert subtitles in `rows` to cache of `page`."""
+        if not rows: return
+        index, texts = self._caches[page]
+        rows = sorted(rows)
+        subtitles = [project.subtitles[x] for x in rows]
+        index.insert_many(rows, [(x.start_seconds, x.end_seconds)
+                                 for x in subtitles])
+
+        # Rebuild the tail after the first row in one pass instead of
+        # inserting one by one, each of which shifts all following texts.
+        first = rows[0]
+        tail = iter(texts[first:])
+        new = iter([x.main_text for x in subtitles])
+        rows = set(rows)
+        texts[first:] = [next(new) if i in rows else next(tail)
+                         for i in range(first, len(texts) + len(rows))]
+
+    def _on_project_patch_cache_moved(self, project, row, new_row, page):
+        """Move subtitle from `row` to `new_row` in cache of `page`."""
+        self._on_project_patch_cache_removed(project, (row,), page)
+        self._on_project_patch_cache_inserted(project, (new_row,), page)
+
+    def _on_project_patch_cache_positions(self, project, rows, page):
+        """Update positions of subtitles in `rows` in cache of `page`."""
+        index, texts = self._caches[page]
+        for row in rows:
+            subtitle = project.subtitles[row]
+            index.set(row, subtitle.start_seconds, subtitle.end_seconds)
+
+    def _on_project_patch_cache_removed(self, project, rows, page):
+        """Remove subtitles in `rows` from cache of `page`."""
+        if not rows: return
+        index, texts = self._caches[page]
+        index.remove_many(rows)
+        # Rebuild the tail after the first row in one pass instead of
+        # removing one by one, each of which shifts all following texts.
+        first = min(rows)
+        rows = set(rows)
+        texts[first:] = [texts[i] for i in range(first, len(texts))
+                         if not i in rows]
+
+    def _on_project_patch_cache_subtitles(self, project, rows, page):
+        """Update subtitles in `rows` in cache of `page`."""
+        self._on_project_patch_cache_positions(project, rows, page)
+        self._on_project_patch_cache_texts(project, rows, page)
+
+    def _on_project_patch_cache_texts(self, project, rows, page):
+        """Update texts of subtitles in `rows` in cache of `page`."""
+        index, texts = self._caches[page]
+        for row in rows:
+            texts[row] = project.subtitles[row].main_text
+
+    def _on_project_reset_cache(self, project, *args):
+        """Rebuild the entire cache of page given last in `args`."""
+        page = args[-1]
+        self._caches[page] = (
+            aeidon.IntervalIndex((x.start_seconds, x.end_seconds)
+                                 for x in project.subtitles),
+            [x.main_text for x in project.subtitles])
+        self._switch_subtitle_cache()
+
     @aeidon.deco.export
     def _on_seek_backward_activate(self, *args):
         """Seek backward."""
@@ -275,17 +350,19 @@ class VideoAgent(aeidon.Delegate):
     def _on_seek_next_activate(self, *args):
         """Seek to the start of the next subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
-        subtitles = list(filter(lambda x: x[0] > pos + 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[0][0])
+        if pos is None: return
+        index = self._cache[0].get_next(pos + 0.001)
+        if index is None: return
+        self.player.seek(self._cache[0][index][0])
 
     @aeidon.deco.export
     def _on_seek_previous_activate(self, *args):
         """Seek to the start of the previous subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
-        subtitles = list(filter(lambda x: x[1] < pos - 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[-1][0])
+        if pos is None: return
+        index = self._cache[0].get_previous(pos - 0.001)
+        if index is None: return
+        self.player.seek(self._cache[0][index][0])
 
     @aeidon.deco.export
     def _on_seek_selection_end_activate(self, *args):
@@ -342,6 +419,18 @@ class VideoAgent(aeidon.Delegate):
         self.volume_button.set_value(self.player.volume)
         self.update_gui()
 
+    def _remove_subtitle_cache(self, application, page):
+        """Remove subtitle position and text cache of `page`."""
+        for signal, method in self._cache_handlers:
+            page.project.disconnect(signal, method)
+        self._caches.pop(page, None)
+        self._switch_subtitle_cache()
+
+    def _switch_subtitle_cache(self, *args):
+        """Use subtitle position and text cache of the current page."""
+        page = self.get_current_page()
+        self._cache = self._caches.get(page, (aeidon.IntervalIndex(), []))
+
     def _update_languages_menu(self):
         """Update the audio language selection menu."""
         menu = self.get_menubar_section("audio-languages-placeholder")
@@ -354,11 +443,3 @@ class VideoAgent(aeidon.Delegate):
             if i == self.player.audio_track:
                 action = self.get_action("set-audio-language")
                 action.set_state(str(i))
-
-    def _update_subtitle_cache(self, *args, **kwargs):
-        """Update subtitle position and text cache."""
-        page = self.get_current_page()
-        if self.player is None or page is None:
-            return self._clear_subtitle_cache()
-        self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
-                       for x in page.project.subtitles]
@@ -39,7 +39,7 @@ class ViewAgent(aeidon.Delegate):
         selected_rows = page.view.get_selected_rows()
         scroller = page.view.get_parent()
         scroller.remove(page.view)
-        page.view = gaupol.View(edit_mode)
+        page.view = gaupol.View(edit_mode, page.project)
         self.connect_view_signals(page.view)
         scroller.add(page.view)
         scroller.show_all()
@@ -137,11 +137,12 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
         self.x_clipboard = None
         self._init_delegations()
         self._init_gui()
-        self.extension_manager.find_extensions()
-        self.extension_manager.setup_extensions()
         self.update_gui()
         self.window.show()
         self.emit("init-done")
+        # Scanning for and importing extensions can take a while,
+        # defer that until after the window has been drawn.
+        gaupol.util.idle_add(self._init_extensions)
 
     def __getattr__(self, name):
         """Return method delegated to an agent."""
@@ -165,6 +166,7 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
             callback = "_on_{}_activate".format(
                 action.props.name.replace("-", "_"))
             action.connect("activate", getattr(self, callback))
+            action.application = self
             self.window.add_action(action)
 
     def _init_delegations(self):
@@ -189,6 +191,12 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
                 if hasattr(self.__class__, attr_name):
                     delattr(self.__class__, attr_name)
 
+    def _init_extensions(self):
+        """Find extensions and setup those configured as active."""
+        self.extension_manager.find_extensions()
+        self.extension_manager.setup_extensions()
+        self.update_gui()
+
     def _init_gui(self):
         """Initialize the user interface."""
         vbox = gaupol.util.new_vbox(spacing=0)
@@ -347,6 +355,7 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
         if gaupol.conf.application_window.maximized:
             self.window.maximize()
         aeidon.util.connect(self, "window", "delete-event")
+        aeidon.util.connect(self, "window", "key-press-event")
         aeidon.util.connect(self, "window", "window-state-event")
         gaupol.style.load_css(self.window)
 
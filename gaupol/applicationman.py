@@ -28,6 +28,7 @@ import gaupol
 import os
 import re
 import sys
+import time
 
 from aeidon.i18n   import _
 from gi.repository import Gio
@@ -45,6 +46,7 @@ class ApplicationManager(Gtk.Application):
         """Initialize an :class:`ApplicationManager` instance."""
         GObject.GObject.__init__(self)
         self.menubar_builder = None
+        self._phases = [("start", time.perf_counter())]
         self.set_flags(Gio.ApplicationFlags.NON_UNIQUE)
         self.connect("activate", self._on_activate, args)
         self.connect("shutdown", self._on_shutdown)
@@ -52,22 +54,14 @@ class ApplicationManager(Gtk.Application):
     def _init_application(self, opts, args):
         """Initialize application and open files from `args`."""
         application = gaupol.Application()
-        paths = list(map(os.path.abspath, args))
-        application.open_main(paths, opts.encoding)
-        page = application.get_current_page()
-        if page is None: return
-        if opts.translation_file is not None:
-            path = os.path.abspath(opts.translation_file)
-            method = opts.align_method.upper()
-            method = getattr(aeidon.align_methods, method)
-            application.open_translation(path, opts.encoding, method)
-        if opts.video_file is not None:
-            path = os.path.abspath(opts.video_file)
-            page.project.video_path = path
-            application.update_gui()
-        if opts.jump is not None:
-            page.view.set_focus(opts.jump)
-            page.view.scroll_to_row(opts.jump)
+        self._mark_phase("application")
+        # Extensions are set up in an idle callback added when initializing
+        # application. Open files in an idle callback added after that one
+        # so that extensions see the pages being added. Idle callbacks of
+        # the same priority are called in the order they were added.
+        gaupol.util.idle_add(self._open_files, application, opts, args)
+        if opts.profile_startup:
+            gaupol.util.idle_add(self._print_phases)
 
     def _init_configuration(self):
         """Read configuration values from file."""
@@ -90,14 +84,41 @@ class ApplicationManager(Gtk.Application):
         opts, args = self._parse_args(args)
         sys.excepthook = gaupol.util.show_exception
         aeidon.i18n.bind()
+        self._mark_phase("arguments")
         self._init_configuration()
+        self._mark_phase("configuration")
         self._init_menubar()
+        self._mark_phase("menubar")
         self._init_application(opts, args)
 
+    def _mark_phase(self, name):
+        """Record the end of startup phase `name`."""
+        self._phases.append((name, time.perf_counter()))
+
     def _on_shutdown(self, manager):
         """Terminate application."""
         gaupol.conf.write_to_file()
 
+    def _open_files(self, application, opts, args):
+        """Open files from `args` once extensions have been set up."""
+        self._mark_phase("extensions")
+        paths = list(map(os.path.abspath, args))
+        application.open_main(paths, opts.encoding)
+        page = application.get_current_page()
+        if page is None: return
+        if opts.translation_file is not None:
+            path = os.path.abspath(opts.translation_file)
+            method = opts.align_method.upper()
+            method = getattr(aeidon.align_methods, method)
+            application.open_translation(path, opts.encoding, method)
+        if opts.video_file is not None:
+            path = os.path.abspath(opts.video_file)
+            page.project.video_path = path
+            application.update_gui()
+        if opts.jump is not None:
+            page.view.set_focus(opts.jump)
+            page.view.scroll_to_row(opts.jump)
+
     def _parse_args(self, args):
         """Parse and return options and arguments from `args`."""
         parser = argparse.ArgumentParser(
@@ -155,6 +176,13 @@ class ApplicationManager(Gtk.Application):
             default=None,
             help=_("select video file"))
 
+        parser.add_argument(
+            "--profile-startup",
+            action="store_true",
+            dest="profile_startup",
+            default=False,
+            help=_("print time taken by each phase of startup"))
+
         args = parser.parse_args()
         args.jump = None
         if args.list_encodings:
@@ -174,3 +202,13 @@ class ApplicationManager(Gtk.Application):
             encodings.insert(0, "auto")
         print(", ".join(encodings))
         raise SystemExit(0)
+
+    def _print_phases(self):
+        """Print time taken by each phase of startup."""
+        self._mark_phase("files")
+        start = prev = self._phases[0][1]
+        for name, end in self._phases[1:]:
+            print("{:16s} {:8.1f} ms {:8.1f} ms".format(
+                name, 1000 * (end - prev), 1000 * (end - start)),
+                file=sys.stderr)
+            prev = end
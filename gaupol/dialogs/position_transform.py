@@ -21,6 +21,7 @@ import aeidon
 import gaupol
 
 from aeidon.i18n   import _
+from aeidon.i18n   import n_
 from gi.repository import Gtk
 from gi.repository import Pango
 
@@ -32,6 +33,8 @@ class PositionTransformDialog(gaupol.BuilderDialog):
     """Base class for dialogs for transforming positions."""
 
     _widgets = (
+        "add_point_button",
+        "clear_points_button",
         "correction_hbox_1",
         "correction_hbox_2",
         "correction_label_1",
@@ -39,6 +42,7 @@ class PositionTransformDialog(gaupol.BuilderDialog):
         "current_radio",
         "input_entry_1",
         "input_entry_2",
+        "points_label",
         "preview_button_1",
         "preview_button_2",
         "selected_radio",
@@ -52,10 +56,17 @@ class PositionTransformDialog(gaupol.BuilderDialog):
         """Initialize a :class:`PositionTransformDialog` instance."""
         gaupol.BuilderDialog.__init__(self, "position-transform-dialog.ui")
         self.application = application
+        self._points = []
         self._init_dialog(parent)
         self._init_sensitivities()
         self._init_sizes()
 
+    def _get_points(self):
+        """Return a list of all sync points sorted by row."""
+        points = dict(self._points)
+        points.update((self._get_first_point(), self._get_second_point()))
+        return sorted(points.items())
+
     def _get_target(self):
         """Return the selected target."""
         if self._selected_radio.get_active():
@@ -64,6 +75,16 @@ class PositionTransformDialog(gaupol.BuilderDialog):
             return gaupol.targets.CURRENT
         raise ValueError("Invalid target radio state")
 
+    def _get_transform(self, rows):
+        """Return method and arguments to transform positions in `rows`."""
+        page = self.application.get_current_page()
+        points = self._get_points()
+        if len(points) == 2:
+            method = page.project.transform_positions
+            return method, (rows, points[0], points[1])
+        method = page.project.transform_positions_piecewise
+        return method, (rows, points)
+
     def _init_dialog(self, parent):
         """Initialize the dialog."""
         self.add_button(_("_Cancel"), Gtk.ResponseType.CANCEL)
@@ -116,17 +137,24 @@ class PositionTransformDialog(gaupol.BuilderDialog):
             self._text_label_1.props.xalign = 0
             self._text_label_2.props.xalign = 0
 
+    def _on_add_point_button_clicked(self, *args):
+        """Keep the second point for a piecewise transformation."""
+        self._points.append(self._get_second_point())
+        self._update_points()
+
+    def _on_clear_points_button_clicked(self, *args):
+        """Forget all kept points."""
+        self._points = []
+        self._update_points()
+
     def _on_preview_button_1_clicked(self, *args):
         """Preview changes from the first point."""
         page = self.application.get_current_page()
         row = self._subtitle_spin_1.get_value_as_int() - 1
         doc = aeidon.documents.MAIN
-        method = page.project.transform_positions
         target = self._get_target()
         rows = self.application.get_target_rows(target)
-        point_1 = self._get_first_point()
-        point_2 = self._get_second_point()
-        args = (rows, point_1, point_2)
+        method, args = self._get_transform(rows)
         self.application.preview_changes(page, row, doc, method, args)
 
     def _on_preview_button_2_clicked(self, *args):
@@ -134,12 +162,9 @@ class PositionTransformDialog(gaupol.BuilderDialog):
         page = self.application.get_current_page()
         row = self._subtitle_spin_2.get_value_as_int() - 1
         doc = aeidon.documents.MAIN
-        method = page.project.transform_positions
         target = self._get_target()
         rows = self.application.get_target_rows(target)
-        point_1 = self._get_first_point()
-        point_2 = self._get_second_point()
-        args = (rows, point_1, point_2)
+        method, args = self._get_transform(rows)
         self.application.preview_changes(page, row, doc, method, args)
 
     def _on_response(self, dialog, response):
@@ -168,9 +193,19 @@ class PositionTransformDialog(gaupol.BuilderDialog):
         page = self.application.get_current_page()
         target = self._get_target()
         rows = self.application.get_target_rows(target)
-        point_1 = self._get_first_point()
-        point_2 = self._get_second_point()
-        page.project.transform_positions(rows, point_1, point_2)
+        method, args = self._get_transform(rows)
+        method(*args)
+
+    def _update_points(self):
+        """Update widgets to match kept points."""
+        rows = sorted(dict(self._points))
+        self._clear_points_button.set_sensitive(bool(rows))
+        if not rows:
+            return self._points_label.set_text("")
+        subtitles = ", ".join(str(x+1) for x in rows)
+        self._points_label.set_text(n_("Kept point at subtitle {}",
+                                       "Kept points at subtitles {}",
+                                       len(rows)).format(subtitles))
 
 
 class FrameTransformDialog(PositionTransformDialog):
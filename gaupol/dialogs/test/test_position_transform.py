@@ -26,6 +26,21 @@ class _TestPositionTransformDialog(gaupol.TestCase):
         self.dialog.run()
         self.dialog.destroy()
 
+    def test__on_add_point_button_clicked(self):
+        self.dialog._add_point_button.emit("clicked")
+        self.dialog._subtitle_spin_2.set_value(3)
+        self.dialog.response(Gtk.ResponseType.OK)
+
+    def test__on_clear_points_button_clicked(self):
+        self.dialog._add_point_button.emit("clicked")
+        assert self.dialog._points
+        assert self.dialog._clear_points_button.get_sensitive()
+        self.dialog._clear_points_button.emit("clicked")
+        assert not self.dialog._points
+        assert not self.dialog._clear_points_button.get_sensitive()
+        assert not self.dialog._points_label.get_text()
+        self.dialog.response(Gtk.ResponseType.OK)
+
     def test__on_response(self):
         self.dialog.response(Gtk.ResponseType.OK)
 
@@ -24,6 +24,8 @@ from aeidon.i18n   import _
 from gi.repository import GObject
 from gi.repository import Gtk
 
+__all__ = ("TextEditDialog",)
+
 
 class TextEditDialog(Gtk.Dialog):
 
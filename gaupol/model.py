@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""List data model reading subtitle data directly from a project."""
+
+import aeidon
+import gaupol
+import random
+
+from gi.repository import GObject
+from gi.repository import Gtk
+
+__all__ = ("SubtitleModel",)
+
+
+class SubtitleModel(GObject.Object, Gtk.TreeModel):
+
+    """
+    List data model reading subtitle data directly from a project.
+
+    :ivar edit_mode: :attr:`aeidon.modes` item corresponding to editing mode
+    :ivar project: The associated :class:`aeidon.Project` instance
+
+    Cell values are not stored, but read from :attr:`project.subtitles` when
+    requested, which keeps memory use and time taken to fill the view low
+    regardless of the amount of subtitles. Columns correspond to
+    :attr:`gaupol.fields`. The model does not follow the project on its own,
+    call :meth:`notify_changed`, :meth:`notify_inserted` and
+    :meth:`notify_removed` after subtitles have been changed, inserted or
+    removed to notify views. The amount of rows is tracked separately and
+    advanced one row per notification, so that views never see rows they
+    have not yet been notified of. Call :meth:`notify_reset` while the model
+    is detached from views to recount rows.
+    """
+
+    def __init__(self, project, edit_mode):
+        """Initialize a :class:`SubtitleModel` instance."""
+        GObject.Object.__init__(self)
+        self.edit_mode = edit_mode
+        self.project = project
+        self._n_rows = len(project.subtitles)
+        self._stamp = random.randint(1, 2**31-1)
+        self._types = self._get_column_types(edit_mode)
+
+    def do_get_column_type(self, index):
+        """Return type of column `index`."""
+        return self._types[index]
+
+    def do_get_flags(self):
+        """Return flags of supported features."""
+        return Gtk.TreeModelFlags.LIST_ONLY
+
+    def do_get_iter(self, path):
+        """Return iterator pointing to `path`."""
+        indices = path.get_indices()
+        if len(indices) != 1: return (False, None)
+        return self._new_iter(indices[0])
+
+    def do_get_n_columns(self):
+        """Return the amount of columns."""
+        return len(self._types)
+
+    def do_get_path(self, itr):
+        """Return path pointed to by `itr`."""
+        return gaupol.util.tree_row_to_path(self._get_row(itr))
+
+    def do_get_value(self, itr, column):
+        """Return value of `column` in row pointed to by `itr`."""
+        return self._get_value(self._get_row(itr), column)
+
+    def do_iter_children(self, parent):
+        """Return iterator pointing to first child of `parent`."""
+        if parent is not None: return (False, None)
+        return self._new_iter(0)
+
+    def do_iter_has_child(self, itr):
+        """Return ``True`` if `itr` has children."""
+        return False
+
+    def do_iter_n_children(self, itr):
+        """Return the amount of children of `itr`."""
+        if itr is not None: return 0
+        return self._n_rows
+
+    def do_iter_next(self, itr):
+        """Move `itr` to the next row and return ``True`` if it exists."""
+        row = self._get_row(itr) + 1
+        if row >= self._n_rows: return False
+        self._set_row(itr, row)
+        return True
+
+    def do_iter_nth_child(self, parent, n):
+        """Return iterator pointing to `n`th child of `parent`."""
+        if parent is not None: return (False, None)
+        return self._new_iter(n)
+
+    def do_iter_parent(self, child):
+        """Return iterator pointing to parent of `child`."""
+        return (False, None)
+
+    def do_iter_previous(self, itr):
+        """Move `itr` to the previous row and return ``True`` if it exists."""
+        row = self._get_row(itr) - 1
+        if row < 0: return False
+        self._set_row(itr, row)
+        return True
+
+    def _get_column_types(self, edit_mode):
+        """Return a tuple of column types for `edit_mode`."""
+        if edit_mode == aeidon.modes.TIME:
+            return (GObject.TYPE_INT,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_DOUBLE,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_STRING)
+        if edit_mode == aeidon.modes.FRAME:
+            return (GObject.TYPE_INT,
+                    GObject.TYPE_INT,
+                    GObject.TYPE_INT,
+                    GObject.TYPE_INT,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_STRING)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(edit_mode)))
+
+    def _get_row(self, itr):
+        """Return row pointed to by `itr`."""
+        # Rows are stored offset by one, since zero would
+        # be translated to a NULL pointer, i.e. None.
+        return itr.user_data - 1
+
+    def _get_value(self, row, field):
+        """Return value of subtitle data for `row` and `field`."""
+        mode = self.edit_mode
+        subtitle = self.project.subtitles[row]
+        if field == gaupol.fields.NUMBER:
+            return row + 1
+        if field == gaupol.fields.START:
+            return subtitle.get_start(mode)
+        if field == gaupol.fields.END:
+            return subtitle.get_end(mode)
+        if field == gaupol.fields.DURATION:
+            if mode == aeidon.modes.TIME:
+                return subtitle.duration_seconds
+            if mode == aeidon.modes.FRAME:
+                return subtitle.duration_frame
+            raise ValueError("Invalid mode: {}"
+                             .format(repr(mode)))
+
+        if field == gaupol.fields.MAIN_TEXT:
+            return subtitle.main_text
+        if field == gaupol.fields.TRAN_TEXT:
+            return subtitle.tran_text
+        raise ValueError("Invalid field: {}"
+                         .format(repr(field)))
+
+    def _new_iter(self, row):
+        """Return a tuple of success and iterator pointing to `row`."""
+        if not 0 <= row < self._n_rows:
+            return (False, None)
+        return (True, self._new_iter_unchecked(row))
+
+    def _new_iter_unchecked(self, row):
+        """Return iterator pointing to `row`, which need not exist yet."""
+        itr = Gtk.TreeIter()
+        itr.stamp = self._stamp
+        self._set_row(itr, row)
+        return itr
+
+    def notify_changed(self, rows):
+        """Notify views that subtitles in `rows` have changed."""
+        for path, itr in self._walk_rows(rows):
+            self.row_changed(path, itr)
+
+    def notify_inserted(self, rows):
+        """Notify views that subtitles have been inserted in `rows`."""
+        for path, itr in self._walk_rows(rows):
+            # Views query the model during the signal,
+            # so it must report the inserted row as existing.
+            self._n_rows += 1
+            self.row_inserted(path, itr)
+
+    def notify_removed(self, rows):
+        """Notify views that subtitles have been removed from `rows`."""
+        for lst in reversed(aeidon.util.get_ranges(rows)):
+            # Each removal shifts the rest of the range up by one,
+            # so all rows of the range are removed at the same path.
+            path = gaupol.util.tree_row_to_path(lst[0])
+            for i in range(len(lst)):
+                self._n_rows -= 1
+                self.row_deleted(path)
+
+    def notify_reset(self):
+        """Recount rows, call while the model is detached from views."""
+        self._n_rows = len(self.project.subtitles)
+
+    def _set_row(self, itr, row):
+        """Make `itr` point to `row`."""
+        itr.user_data = row + 1
+
+    def _walk_rows(self, rows):
+        """Yield paths and iterators pointing to `rows` in ascending order."""
+        # Reuse the same path and iterator within ranges of consecutive
+        # rows to avoid creating new ones for each row.
+        for lst in aeidon.util.get_ranges(rows):
+            path = gaupol.util.tree_row_to_path(lst[0])
+            itr = self._new_iter_unchecked(lst[0])
+            for row in lst:
+                self._set_row(itr, row)
+                yield path, itr
+                path.next()
@@ -50,7 +50,7 @@ class Page(aeidon.Observable):
     """
     signals = ("close-request", "view-created")
 
-    def __init__(self, count=0):
+    def __init__(self, count=0, project=None):
         """Initialize a :class:`Page` instance."""
         aeidon.Observable.__init__(self)
         self.edit_mode = gaupol.conf.editor.mode
@@ -58,8 +58,9 @@ class Page(aeidon.Observable):
         self.tab_label = None
         self.tab_widget = None
         self.untitle = _("Untitled {:d}").format(count)
-        self.view = gaupol.View(self.edit_mode)
-        self._init_project()
+        self.view = None
+        self._init_project(project)
+        self.view = gaupol.View(self.edit_mode, self.project)
         self._init_widgets()
         self._init_signal_handlers()
         self.update_tab_label()
@@ -89,29 +90,6 @@ class Page(aeidon.Observable):
             return os.path.basename(self.project.main_file.path)
         return self.untitle
 
-    def _get_subtitle_value(self, row, field):
-        """Return value of subtitle data for `row` and `field`."""
-        mode = self.edit_mode
-        subtitle = self.project.subtitles[row]
-        if field == gaupol.fields.START:
-            return subtitle.get_start(mode)
-        if field == gaupol.fields.END:
-            return subtitle.get_end(mode)
-        if field == gaupol.fields.DURATION:
-            if mode == aeidon.modes.TIME:
-                return subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                return subtitle.duration_frame
-            raise ValueError("Invalid mode: {}"
-                             .format(repr(mode)))
-
-        if field == gaupol.fields.MAIN_TEXT:
-            return subtitle.main_text
-        if field == gaupol.fields.TRAN_TEXT:
-            return subtitle.tran_text
-        raise ValueError("Invalid field: {}"
-                         .format(repr(field)))
-
     def _get_tab_close_button(self):
         """Initialize and return a tab close button."""
         button = Gtk.Button()
@@ -144,10 +122,12 @@ class Page(aeidon.Observable):
                 basename = basename[:-len(extension)]
         return _("{} translation").format(basename)
 
-    def _init_project(self):
+    def _init_project(self, project=None):
         """Initialize :class:`aeidon.Project` with proper properties."""
-        framerate = gaupol.conf.editor.framerate
-        self.project = aeidon.Project(framerate)
+        if project is None:
+            framerate = gaupol.conf.editor.framerate
+            project = aeidon.Project(framerate)
+        self.project = project
 
     def _init_signal_handlers(self):
         """Initialize signal handlers."""
@@ -159,6 +139,7 @@ class Page(aeidon.Observable):
         aeidon.util.connect(self, "project", "main-file-opened")
         aeidon.util.connect(self, "project", "main-texts-changed")
         aeidon.util.connect(self, "project", "positions-changed")
+        aeidon.util.connect(self, "project", "subtitle-moved")
         aeidon.util.connect(self, "project", "subtitles-changed")
         aeidon.util.connect(self, "project", "subtitles-inserted")
         aeidon.util.connect(self, "project", "subtitles-removed")
@@ -222,6 +203,14 @@ class Page(aeidon.Observable):
         self.view.select_rows(rows)
         gaupol.util.iterate_main()
 
+    def _on_project_subtitle_moved(self, project, row, new_row):
+        """Reload rows shifted by moving subtitle from `row` to `new_row`."""
+        # Subtitles between the two rows move by one, which the view sees
+        # as changed values in the same rows instead of a removal and
+        # an insertion, which would both shift all following rows.
+        rows = list(range(min(row, new_row), max(row, new_row) + 1))
+        self.view.get_model().notify_changed(rows)
+
     def _on_project_subtitles_changed(self, project, rows):
         """Reload and select subtitles in rows."""
         if not rows: return
@@ -236,20 +225,7 @@ class Page(aeidon.Observable):
     def _on_project_subtitles_inserted(self, project, rows):
         """Insert rows to the view and select them."""
         if not rows: return
-        mode = self.edit_mode
-        store = self.view.get_model()
-        for row in sorted(rows):
-            subtitle = self.project.subtitles[row]
-            store.insert(row)
-            store[row][0] = row + 1
-            store[row][1] = subtitle.get_start(mode)
-            store[row][2] = subtitle.get_end(mode)
-            if mode == aeidon.modes.TIME:
-                store[row][3] = subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                store[row][3] = subtitle.duration_frame
-            store[row][4] = subtitle.main_text
-            store[row][5] = subtitle.tran_text
+        self._update_view(rows, self.view.get_model().notify_inserted)
         self.view.set_focus(rows[0])
         self.view.select_rows(rows)
         gaupol.util.iterate_main()
@@ -257,17 +233,7 @@ class Page(aeidon.Observable):
     def _on_project_subtitles_removed(self, project, rows):
         """Remove rows from the view."""
         if not rows: return
-        store = self.view.get_model()
-        if len(rows) > 50:
-            # Unset and later reset the model if removing a large amount
-            # of rows, because a large batch of separate live updates
-            # directly made to the view are slow.
-            self.view.set_model(None)
-        for row in reversed(sorted(rows)):
-            path = gaupol.util.tree_row_to_path(row)
-            store.remove(store.get_iter(path))
-        if len(rows) > 50:
-            self.view.set_model(store)
+        self._update_view(rows, self.view.get_model().notify_removed)
         if self.project.subtitles:
             row = min(rows[0], len(self.project.subtitles)-1)
             col = self.view.get_focus()[1]
@@ -308,28 +274,20 @@ class Page(aeidon.Observable):
 
     def reload_view(self, rows, fields):
         """Reload the view in `rows` and `fields`."""
-        store = self.view.get_model()
-        for row, field in ((x, y) for x in rows for y in fields):
-            value = self._get_subtitle_value(row, field)
-            store[row][field] = value
+        if not any(x.is_text for x in fields):
+            # The model reads values directly from the project and
+            # positions are always single-line, so row heights cannot
+            # have changed and a redraw is enough to show new values.
+            return self.view.queue_draw()
+        self.view.get_model().notify_changed(rows)
 
     def reload_view_all(self):
         """Clear and repopulate the entire view."""
         store = self.view.get_model()
+        # Reattaching the model makes the view recount rows
+        # and read values anew for the ones it displays.
         self.view.set_model(None)
-        store.clear()
-        mode = self.edit_mode
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.insert(i)
-            store[i][0] = i + 1
-            store[i][1] = subtitle.get_start(mode)
-            store[i][2] = subtitle.get_end(mode)
-            if mode == aeidon.modes.TIME:
-                store[i][3] = subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                store[i][3] = subtitle.duration_frame
-            store[i][4] = subtitle.main_text
-            store[i][5] = subtitle.tran_text
+        store.notify_reset()
         self.view.set_model(store)
 
     def text_column_to_document(self, col):
@@ -341,6 +299,18 @@ class Page(aeidon.Observable):
         raise ValueError("Invalid column: {}"
                          .format(repr(col)))
 
+    def _update_view(self, rows, notify):
+        """Update view by calling `notify` on `rows` or reattaching model."""
+        if len(rows) > max(50, len(self.project.subtitles) / 20):
+            # Reattach the model instead of notifying of each row
+            # if a large share of rows is inserted or removed, because
+            # a large batch of separate live updates directly made to
+            # the view are slow. Reattaching loses the scroll position
+            # and cursor, so only use this for inserts and removals,
+            # after which the caller sets focus again.
+            return self.reload_view_all()
+        notify(rows)
+
     def update_tab_label(self):
         """Update the notebook tab label and return title."""
         title = self.get_main_basename()
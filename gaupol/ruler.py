@@ -18,21 +18,49 @@
 """Functions to calculate line lengths and to show them in widgets."""
 
 import aeidon
+import collections
 import gaupol
+import re
 
 from gi.repository import Gtk
 from gi.repository import Pango
 
+# Tags of any format, including MicroDVD and MPL2 line-start tags
+# on all lines when applied to multiple lines at once.
+_re_any_tag = re.compile(aeidon.RE_ANY_TAG.pattern, re.MULTILINE)
+
 
 class _Ruler:
 
-    """Measurer of line lengths in various units."""
+    """
+    Measurer of line lengths in various units.
+
+    Em lengths are calculated by summing advance widths of characters,
+    which are measured once per font and then kept in a table. Kerning
+    and ligatures are thus ignored, which is close enough for determining
+    line lengths. Text containing characters of scripts that need complex
+    shaping is measured with Pango as a whole. Recent results are cached.
+    """
+
+    # Characters outside these ranges, e.g. combining marks and characters
+    # of complex scripts, cannot be measured by summing advance widths.
+    _re_complex = re.compile("[^\u0020-\u02ff"
+                             "\u0370-\u0482"
+                             "\u048a-\u052f"
+                             "\u2010-\u205e]")
 
     def __init__(self):
         """Initialize a :class:`_Ruler` instance."""
+        self._advances = {}
+        self._cache = collections.OrderedDict()
+        self._cache_limit = 1000
         self._em_length = None
         self._label = Gtk.Label()
-        self._update_em_length()
+        self._table = None
+        self._update_font()
+        settings = Gtk.Settings.get_default()
+        if settings is not None:
+            settings.connect("notify::gtk-font-name", self._update_font)
 
     def get_char_length(self, text, strip=False, floor=False):
         """Return length of `text` measured in characters."""
@@ -42,17 +70,48 @@ class _Ruler:
     def get_em_length(self, text, strip=False, floor=False):
         """Return length of `text` measured in ems."""
         text = (aeidon.RE_ANY_TAG.sub("", text) if strip else text)
-        self._label.set_text(text.replace("\n", " "))
-        width = self._label.get_preferred_width()[1]
-        length = width / self._em_length
+        length = self._get_width(text.replace("\n", " ")) / self._em_length
         return (int(length) if floor else length)
 
-    def _update_em_length(self):
-        """Update the length of em based on font rendering."""
-        text = "abcdefghijklmnopqrstuvwxyz"
+    def get_em_lengths(self, lines, strip=False, floor=False):
+        """Return a list of lengths of `lines` measured in ems."""
+        if strip:
+            # Strip tags of all lines at once.
+            lines = _re_any_tag.sub("", "\n".join(lines)).split("\n")
+        lengths = [self._get_width(x) / self._em_length for x in lines]
+        return ([int(x) for x in lengths] if floor else lengths)
+
+    def _get_width(self, text):
+        """Return width of single-line `text` in pixels."""
+        with aeidon.util.silent(KeyError):
+            self._cache.move_to_end(text)
+            return self._cache[text]
+        if self._re_complex.search(text) is None:
+            table = self._table
+            for char in set(text).difference(table):
+                table[char] = self._measure(char)
+            width = sum(table[x] for x in text)
+        else:
+            width = self._measure(text)
+        self._cache[text] = width
+        while len(self._cache) > self._cache_limit:
+            self._cache.popitem(last=False)
+        return width
+
+    def _measure(self, text):
+        """Return width of `text` in pixels as rendered by Pango."""
         self._label.set_text(text)
-        self._label.show()
-        width = self._label.get_preferred_width()[1]
+        layout = self._label.get_layout()
+        return layout.get_size()[0] / Pango.SCALE
+
+    def _update_font(self, *args):
+        """Update the length of em and advance widths for current font."""
+        self._cache.clear()
+        context = self._label.get_pango_context()
+        font = context.get_font_description().to_string()
+        self._table = self._advances.setdefault(font, {})
+        text = "abcdefghijklmnopqrstuvwxyz"
+        width = self._measure(text)
         # About 0.55 em per a-z average character.
         # https://bugzilla.gnome.org/show_bug.cgi?id=763589
         self._em_length = width / (0.55 * len(text))
@@ -112,5 +171,7 @@ def get_length_function(unit):
 
 def get_lengths(text):
     """Return a sequence of floored line lengths without tags."""
-    fun = get_length_function(gaupol.conf.editor.length_unit)
-    return [fun(line, strip=True, floor=True) for line in text.split("\n")]
+    metrics = aeidon.TextMetrics(text, _re_any_tag)
+    if gaupol.conf.editor.length_unit == gaupol.length_units.EM:
+        return _ruler.get_em_lengths(metrics.lines, floor=True)
+    return list(metrics.line_lengths)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import gaupol
+
+
+class TestSubtitleModel(gaupol.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.store = gaupol.SubtitleModel(self.project, aeidon.modes.TIME)
+
+    def test___len__(self):
+        assert len(self.store) == len(self.project.subtitles)
+
+    def test_get_value__frame(self):
+        self.store = gaupol.SubtitleModel(self.project, aeidon.modes.FRAME)
+        subtitle = self.project.subtitles[3]
+        assert self.store[3][gaupol.fields.NUMBER] == 4
+        assert self.store[3][gaupol.fields.START] == subtitle.start_frame
+        assert self.store[3][gaupol.fields.END] == subtitle.end_frame
+        assert self.store[3][gaupol.fields.DURATION] == subtitle.duration_frame
+
+    def test_get_value__time(self):
+        subtitle = self.project.subtitles[3]
+        assert self.store[3][gaupol.fields.NUMBER] == 4
+        assert self.store[3][gaupol.fields.START] == subtitle.start_time
+        assert self.store[3][gaupol.fields.END] == subtitle.end_time
+        assert self.store[3][gaupol.fields.MAIN_TEXT] == subtitle.main_text
+        assert self.store[3][gaupol.fields.TRAN_TEXT] == subtitle.tran_text
+
+    def test_iter_next(self):
+        rows = [x[gaupol.fields.NUMBER] - 1 for x in self.store]
+        assert rows == list(range(len(self.project.subtitles)))
+
+    def test_notify_changed(self):
+        self.project.subtitles[0].main_text = "test"
+        self.store.notify_changed((0,))
+        assert self.store[0][gaupol.fields.MAIN_TEXT] == "test"
+
+    def test_notify_inserted(self):
+        self.project.insert_subtitles((0, 1))
+        self.store.notify_inserted((0, 1))
+        assert len(self.store) == len(self.project.subtitles)
+
+    def test_notify_inserted__pending(self):
+        n = len(self.project.subtitles)
+        self.project.insert_subtitles((0, 1))
+        assert len(self.store) == n
+
+    def test_notify_removed(self):
+        self.project.remove_subtitles((0, 1))
+        self.store.notify_removed((0, 1))
+        assert len(self.store) == len(self.project.subtitles)
+
+    def test_notify_removed__ranges(self):
+        self.project.remove_subtitles((0, 1, 3))
+        self.store.notify_removed((0, 1, 3))
+        assert len(self.store) == len(self.project.subtitles)
+
+    def test_notify_reset(self):
+        self.project.remove_subtitles((0, 1))
+        self.store.notify_reset()
+        assert len(self.store) == len(self.project.subtitles)
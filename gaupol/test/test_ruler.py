@@ -35,6 +35,31 @@ class TestModule(gaupol.TestCase):
         text_buffer = text_view.get_buffer()
         text_buffer.insert_at_cursor("test\ntest")
 
+    def test_get_em_lengths(self):
+        lines = ["MMM", "<i>iii</i>", "\u0645\u0631\u062d\u0628\u0627"]
+        lengths = gaupol.ruler._ruler.get_em_lengths(lines, strip=True)
+        assert lengths[0] == gaupol.ruler._ruler.get_em_length("MMM")
+        assert lengths[1] == gaupol.ruler._ruler.get_em_length("iii")
+        assert lengths[2] > 0
+
+    def test_get_em_lengths__cache(self):
+        ruler = gaupol.ruler._ruler
+        length = ruler.get_em_length("test")
+        assert "test" in ruler._cache
+        assert ruler.get_em_length("test") == length
+        for i in range(ruler._cache_limit + 1):
+            ruler.get_em_length(str(i))
+        assert len(ruler._cache) == ruler._cache_limit
+        assert "test" not in ruler._cache
+
+    def test_get_em_lengths__line_start_tags(self):
+        ruler = gaupol.ruler._ruler
+        lines = ["/foo", "/bar", "_baz"]
+        lengths = ruler.get_em_lengths(lines, strip=True)
+        assert lengths[0] == ruler.get_em_length("foo")
+        assert lengths[1] == ruler.get_em_length("bar")
+        assert lengths[2] == ruler.get_em_length("baz")
+
     def test_get_length_function__char(self):
         unit = gaupol.length_units.CHAR
         function = gaupol.ruler.get_length_function(unit)
@@ -51,6 +76,12 @@ class TestModule(gaupol.TestCase):
         lengths = gaupol.ruler.get_lengths("MMM\n<i>iii</i>")
         assert tuple(lengths) == (3, 3)
 
+    def test_get_lengths__char_line_start_tags(self):
+        unit = gaupol.length_units.CHAR
+        gaupol.conf.editor.length_unit = unit
+        lengths = gaupol.ruler.get_lengths("/foo\n/bar\n_baz")
+        assert tuple(lengths) == (3, 3, 3)
+
     def test_get_lengths__em(self):
         unit = gaupol.length_units.EM
         gaupol.conf.editor.length_unit = unit
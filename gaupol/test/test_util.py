@@ -55,6 +55,11 @@ class TestModule(gaupol.TestCase):
         assert 50 < cust < 200
         assert 50 < mono < 200
 
+    def test_new_thread_pool(self):
+        with gaupol.util.new_thread_pool(3) as executor:
+            futures = [executor.submit(abs, -x) for x in range(3)]
+        assert [x.result() for x in futures] == [0, 1, 2]
+
     def test_rgba_to_hex(self):
         rgba = Gdk.RGBA(red=1, green=0, blue=1)
         color = gaupol.util.rgba_to_hex(rgba)
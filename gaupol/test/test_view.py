@@ -45,32 +45,16 @@ class TestView(gaupol.TestCase):
         Gtk.main()
 
     def setup_frame(self):
-        self.view = gaupol.View(aeidon.modes.FRAME)
-        store = self.view.get_model()
         self.project = self.new_project()
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.append((i+1,
-                          subtitle.start_frame,
-                          subtitle.end_frame,
-                          subtitle.duration_frame,
-                          subtitle.main_text,
-                          subtitle.tran_text))
+        self.view = gaupol.View(aeidon.modes.FRAME, self.project)
 
     def setup_method(self, method):
         random.choice((self.setup_frame, self.setup_time))()
         self.conf = gaupol.conf.editor
 
     def setup_time(self):
-        self.view = gaupol.View(aeidon.modes.TIME)
-        store = self.view.get_model()
         self.project = self.new_project()
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.append((i+1,
-                          subtitle.start_time,
-                          subtitle.end_time,
-                          subtitle.duration_seconds,
-                          subtitle.main_text,
-                          subtitle.tran_text))
+        self.view = gaupol.View(aeidon.modes.TIME, self.project)
 
     def test_select_rows(self):
         self.view.select_rows(())
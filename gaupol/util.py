@@ -18,6 +18,7 @@
 """Miscellaneous functions and decorators."""
 
 import aeidon
+import concurrent.futures
 import gaupol
 import inspect
 import sys
@@ -220,6 +221,13 @@ def new_hbox(spacing):
     return Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL,
                    spacing=spacing)
 
+def new_thread_pool(count):
+    """Return a new bounded thread pool executor for `count` tasks."""
+    # Tasks are expected to be dominated by file I/O, so use more
+    # threads than processors, but not unlimited for large counts.
+    workers = max(1, min(count, 8))
+    return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
 def new_vbox(spacing):
     """Return a new vertical :class:`Gtk.Box`."""
     return Gtk.Box(orientation=Gtk.Orientation.VERTICAL,
@@ -39,10 +39,10 @@ class View(Gtk.TreeView):
        The values of the enumeration items correspond to the column indices and
        are updated when columns are added, removed or reordered. Note that
        these indices are not necessarily the same as the column indices in the
-       underlying :class:`Gtk.ListStore` data model.
+       underlying :class:`gaupol.SubtitleModel` data model.
     """
 
-    def __init__(self, edit_mode):
+    def __init__(self, edit_mode, project):
         """Initialize a :class:`View` instance."""
         GObject.GObject.__init__(self)
         self._active_col_name = ""
@@ -50,7 +50,7 @@ class View(Gtk.TreeView):
         self.columns = aeidon.Enumeration()
         self._selection_changed_handlers = {}
         self._init_signal_handlers()
-        self._init_props(edit_mode)
+        self._init_props(edit_mode, project)
 
     def connect_selection_changed(self, callback):
         """
@@ -168,13 +168,9 @@ class View(Gtk.TreeView):
             label.set_tooltip_text(field.tooltip)
             column.set_widget(label)
 
-    def _init_props(self, edit_mode):
+    def _init_props(self, edit_mode, project):
         """Initialize properties."""
-        if edit_mode == aeidon.modes.TIME:
-            columns = (int, str, str, float, str, str)
-        if edit_mode == aeidon.modes.FRAME:
-            columns = (int, int, int, int, str, str)
-        store = Gtk.ListStore(*columns)
+        store = gaupol.SubtitleModel(project, edit_mode)
         self.set_model(store)
         self._init_columns(edit_mode)
         self._init_cell_data_functions()